@@ -1,10 +1,13 @@
 
 import os
 from pathlib import Path
+import platform
 import shutil
 from struct import unpack
 import subprocess
-from typing import List, Any
+import sys
+from typing import List, Any, Tuple
+import warnings
 
 
 PACKAGE_DIR = Path(__file__).parent / "openjpeg"
@@ -14,6 +17,21 @@ OPENJPEG_SRC = LIB_DIR / "openjpeg" / "src" / "lib" / "openjp2"
 INTERFACE_SRC = LIB_DIR / "interface"
 BUILD_DIR = LIB_DIR / "openjpeg" / "build"
 BACKUP_DIR = BUILD_TOOLS / "backup"
+# OpenJPEG's vectorised MCT and DWT implementations are only compiled when
+#   the corresponding instruction set macros are defined, which the default
+#   compiler flags don't do beyond SSE2 on x86-64 (and not at all with MSVC).
+#   As the resulting binary won't run on CPUs without the instruction set
+#   they must be opted into with the PYLIBJPEG_OPENJPEG_SIMD env variable
+SIMD_ENV = "PYLIBJPEG_OPENJPEG_SIMD"
+SIMD_OPTIONS = {
+    # level: (GCC/Clang args, MSVC args, MSVC macros)
+    # The single-pass 8 column forward DWT only requires SSE2, which is already
+    #   enabled by default for x86-64 GCC/Clang but not 32-bit x86 or MSVC
+    "sse2": (["-msse2"], [], ["__SSE__", "__SSE2__"]),
+    "sse4.1": (["-msse4.1"], [], ["__SSE__", "__SSE2__", "__SSE4_1__"]),
+    # MSVC defines __AVX2__ itself when using /arch:AVX2
+    "avx2": (["-mavx2"], ["/arch:AVX2"], ["__SSE__", "__SSE2__", "__SSE4_1__"]),
+}
 
 
 def build(setup_kwargs: Any) -> Any:
@@ -30,6 +48,17 @@ def build(setup_kwargs: Any) -> Any:
     if unpack("h", b"\x00\x01")[0] == 1:
         macros.append(("PYOJ_BIG_ENDIAN", None))
 
+    simd_args, simd_macros = get_simd_options()
+    macros.extend(simd_macros)
+
+    # Build OpenJPEG with thread support so encoding can use multiple threads
+    libraries = []
+    if sys.platform == "win32":
+        macros.append(("MUTEX_win32", None))
+    else:
+        macros.append(("MUTEX_pthread", None))
+        libraries.append("pthread")
+
     ext = Extension(
         "_openjpeg",
         [os.fspath(p) for p in get_source_files()],
@@ -39,8 +68,9 @@ def build(setup_kwargs: Any) -> Any:
             os.fspath(INTERFACE_SRC),
             numpy.get_include(),
         ],
-        extra_compile_args=[],
+        extra_compile_args=simd_args,
         extra_link_args=[],
+        libraries=libraries,
         define_macros=macros,
     )
 
@@ -65,6 +95,29 @@ def build(setup_kwargs: Any) -> Any:
     return setup_kwargs
 
 
+def get_simd_options() -> Tuple[List[str], List[Tuple[str, Any]]]:
+    """Return the compiler args and macros for the opt-in SIMD support."""
+    level = os.environ.get(SIMD_ENV, "").strip().lower()
+    if not level:
+        return [], []
+
+    if level not in SIMD_OPTIONS:
+        raise ValueError(
+            f"Invalid '{SIMD_ENV}' value '{level}', must be one of: "
+            f"{', '.join(SIMD_OPTIONS)}"
+        )
+
+    if platform.machine().lower() not in ("x86_64", "amd64", "i386", "i686", "x86"):
+        warnings.warn(f"{SIMD_ENV} is only supported on x86 platforms, ignoring")
+        return [], []
+
+    gcc_args, msvc_args, msvc_macros = SIMD_OPTIONS[level]
+    if sys.platform == "win32":
+        return msvc_args, [(macro, None) for macro in msvc_macros]
+
+    return gcc_args, []
+
+
 def get_source_files() -> List[Path]:
     """Return a list of paths to the source files to be compiled."""
     source_files = [
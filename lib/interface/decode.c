@@ -50,23 +50,6 @@ BSD license (see the main LICENSE file).
 #include "utils.h"
 
 
-static void py_error(const char *msg) {
-    py_log("openjpeg.decode", "ERROR", msg);
-}
-
-static void info_callback(const char *msg, void *callback) {
-    py_log("openjpeg.decode", "INFO", msg);
-}
-
-static void warning_callback(const char *msg, void *callback) {
-    py_log("openjpeg.decode", "WARNING", msg);
-}
-
-static void error_callback(const char *msg, void *callback) {
-    py_error(msg);
-}
-
-
 const char * OpenJpegVersion(void)
 {
     /* Return the openjpeg version as char array
@@ -153,14 +136,26 @@ typedef struct JPEG2000Parameters {
 } j2k_parameters_t;
 
 
-extern int GetParameters(PyObject* fd, int codec_format, j2k_parameters_t *output)
+typedef struct DecodeOptions {
+    OPJ_UINT32 reduce;  // number of highest resolution levels to discard
+    OPJ_UINT32 x0;  // decoded area left boundary, all 0 for the entire image
+    OPJ_UINT32 y0;  // decoded area top boundary
+    OPJ_UINT32 x1;  // decoded area right boundary
+    OPJ_UINT32 y1;  // decoded area bottom boundary
+} decode_options_t;
+
+
+static int get_parameters(opj_stream_t *stream, int codec_format, j2k_parameters_t *output)
 {
     /* Decode a JPEG 2000 header for the image meta data.
 
+    Doesn't use the Python C API so may be called without holding the GIL.
+
     Parameters
     ----------
-    fd : PyObject *
-        The Python stream object containing the JPEG 2000 data to be decoded.
+    stream : opj_stream_t *
+        The input stream containing the JPEG 2000 data to be decoded, will not
+        be destroyed.
     codec_format : int
         The format of the JPEG 2000 data, one of:
         * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
@@ -174,8 +169,6 @@ extern int GetParameters(PyObject* fd, int codec_format, j2k_parameters_t *outpu
     int
         The exit status, 0 for success, failure otherwise.
     */
-    // J2K stream
-    opj_stream_t *stream = NULL;
     // struct defining image data and characteristics
     opj_image_t *image = NULL;
     // J2K codec
@@ -186,23 +179,6 @@ extern int GetParameters(PyObject* fd, int codec_format, j2k_parameters_t *outpu
 
     int return_code = EXIT_FAILURE;
 
-    // Creates an abstract input stream; allocates memory
-    stream = opj_stream_create(BUFFER_SIZE, OPJ_TRUE);
-
-    if (!stream)
-    {
-        // Failed to create the input stream
-        return_code = 1;
-        goto failure;
-    }
-
-    // Functions for the stream
-    opj_stream_set_read_function(stream, py_read);
-    opj_stream_set_skip_function(stream, py_skip);
-    opj_stream_set_seek_function(stream, py_seek_set);
-    opj_stream_set_user_data(stream, fd, NULL);
-    opj_stream_set_user_data_length(stream, py_length(fd));
-
     codec = opj_create_decompress(codec_format);
 
     /* Setup the decoder parameters */
@@ -232,7 +208,6 @@ extern int GetParameters(PyObject* fd, int codec_format, j2k_parameters_t *outpu
     destroy_parameters(&parameters);
     opj_destroy_codec(codec);
     opj_image_destroy(image);
-    opj_stream_destroy(stream);
 
     return EXIT_SUCCESS;
 
@@ -242,13 +217,134 @@ extern int GetParameters(PyObject* fd, int codec_format, j2k_parameters_t *outpu
             opj_destroy_codec(codec);
         if (image)
             opj_image_destroy(image);
-        if (stream)
-            opj_stream_destroy(stream);
 
         return return_code;
 }
 
 
+extern int GetParameters(PyObject* fd, int codec_format, j2k_parameters_t *output)
+{
+    /* Decode a JPEG 2000 header for the image meta data.
+
+    Parameters
+    ----------
+    fd : PyObject *
+        The Python stream object containing the JPEG 2000 data to be decoded.
+    codec_format : int
+        The format of the JPEG 2000 data, one of:
+        * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
+        * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
+        * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    output : j2k_parameters_t *
+        The struct where the parameters will be stored.
+
+    Returns
+    -------
+    int
+        The exit status, 0 for success, failure otherwise.
+    */
+    // Creates an abstract input stream; allocates memory
+    opj_stream_t *stream = py_input_stream(fd);
+    if (!stream)
+    {
+        // Failed to create the input stream
+        return 1;
+    }
+
+    int return_code = get_parameters(stream, codec_format, output);
+    opj_stream_destroy(stream);
+
+    return return_code;
+}
+
+
+extern int GetParametersBuffer(
+    const unsigned char *src,
+    size_t length,
+    int codec_format,
+    j2k_parameters_t *output
+)
+{
+    /* Decode a JPEG 2000 header in memory for the image meta data.
+
+    Doesn't use the Python C API so may be called without holding the GIL.
+
+    Parameters
+    ----------
+    src : const unsigned char *
+        The JPEG 2000 data to be decoded, must remain valid until returning.
+    length : size_t
+        The length of `src`, in bytes.
+    codec_format : int
+        The format of the JPEG 2000 data, one of:
+        * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
+        * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
+        * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    output : j2k_parameters_t *
+        The struct where the parameters will be stored.
+
+    Returns
+    -------
+    int
+        The exit status, 0 for success, failure otherwise.
+    */
+    // Creates an abstract input stream; allocates memory
+    opj_stream_t *stream = buffer_input_stream(src, length);
+    if (!stream)
+    {
+        // Failed to create the input stream
+        return 1;
+    }
+
+    int return_code = get_parameters(stream, codec_format, output);
+    opj_stream_destroy(stream);
+
+    return return_code;
+}
+
+
+extern int GetParametersFile(
+    const char *path,
+    int codec_format,
+    j2k_parameters_t *output
+)
+{
+    /* Decode a JPEG 2000 file's header for the image meta data.
+
+    Doesn't use the Python C API so may be called without holding the GIL.
+
+    Parameters
+    ----------
+    path : const char *
+        The path to the JPEG 2000 file to be decoded.
+    codec_format : int
+        The format of the JPEG 2000 data, one of:
+        * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
+        * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
+        * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    output : j2k_parameters_t *
+        The struct where the parameters will be stored.
+
+    Returns
+    -------
+    int
+        The exit status, 0 for success, failure otherwise.
+    */
+    // Creates an input stream that reads from the file; allocates memory
+    opj_stream_t *stream = opj_stream_create_default_file_stream(path, OPJ_TRUE);
+    if (!stream)
+    {
+        // Failed to create the input stream
+        return 1;
+    }
+
+    int return_code = get_parameters(stream, codec_format, output);
+    opj_stream_destroy(stream);
+
+    return return_code;
+}
+
+
 static opj_image_t* upsample_image_components(opj_image_t* original)
 {
     // Basically a straight copy from opj_decompress.c
@@ -449,31 +545,43 @@ static opj_image_t* upsample_image_components(opj_image_t* original)
 }
 
 
-extern int Decode(PyObject* fd, unsigned char *out, int codec_format)
+static int decode(
+    opj_stream_t *stream,
+    unsigned char *out,
+    size_t length,
+    int codec_format,
+    const decode_options_t *options
+)
 {
     /* Decode JPEG 2000 data.
 
+    Doesn't use the Python C API so may be called without holding the GIL.
+
     Parameters
     ----------
-    fd : PyObject *
-        The Python stream object containing the JPEG 2000 data to be decoded.
+    stream : opj_stream_t *
+        The input stream containing the JPEG 2000 data to be decoded, will not
+        be destroyed.
     out : unsigned char *
         Either a Python bytearray object or a numpy ndarray of uint8 to write the
         decoded image data to. Multi-byte decoded data will be written using little
         endian byte ordering.
+    length : size_t
+        The length of `out`, in bytes.
     codec_format : int
         The format of the JPEG 2000 data, one of:
         * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
         * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
         * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    options : const decode_options_t *
+        The resolution reduction and the area of the image to decode, or NULL
+        to decode the entire image at full resolution.
 
     Returns
     -------
     int
         The exit status, 0 for success, failure otherwise.
     */
-    // J2K stream
-    opj_stream_t *stream = NULL;
     // struct defining image data and characteristics
     opj_image_t *image = NULL;
     // J2K codec
@@ -486,28 +594,17 @@ extern int Decode(PyObject* fd, unsigned char *out, int codec_format)
 
     int return_code = EXIT_FAILURE;
 
-    /* Send info, warning, error message to Python logging */
-    opj_set_info_handler(codec, info_callback, NULL);
-    opj_set_warning_handler(codec, warning_callback, NULL);
-    opj_set_error_handler(codec, error_callback, NULL);
-
-    // Creates an abstract input stream; allocates memory
-    stream = opj_stream_create(BUFFER_SIZE, OPJ_TRUE);
-    if (!stream)
+    if (options)
     {
-        // Failed to create the input stream
-        return_code = 1;
-        goto failure;
+        parameters.core.cp_reduce = options->reduce;
+        parameters.DA_x0 = options->x0;
+        parameters.DA_y0 = options->y0;
+        parameters.DA_x1 = options->x1;
+        parameters.DA_y1 = options->y1;
     }
 
-    // Functions for the stream
-    opj_stream_set_read_function(stream, py_read);
-    opj_stream_set_skip_function(stream, py_skip);
-    opj_stream_set_seek_function(stream, py_seek_set);
-    opj_stream_set_user_data(stream, fd, NULL);
-    opj_stream_set_user_data_length(stream, py_length(fd));
-
-    //opj_set_error_handler(codec, j2k_error, 00);
+    // The info, warning and error messages aren't sent to Python logging as
+    //  that requires holding the GIL
 
     codec = opj_create_decompress(codec_format);
 
@@ -527,6 +624,21 @@ extern int Decode(PyObject* fd, unsigned char *out, int codec_format)
         goto failure;
     }
 
+    // Upsampling subsampled components doesn't account for the reduced
+    //  resolution
+    if (parameters.core.cp_reduce)
+    {
+        for (unsigned int ii = 0; ii < image->numcomps; ii++)
+        {
+            if (image->comps[ii].dx > 1 || image->comps[ii].dy > 1)
+            {
+                // reducing the resolution of subsampled components unsupported
+                return_code = 9;
+                goto failure;
+            }
+        }
+    }
+
     // TODO: add check that all components match
 
     if (parameters.numcomps)
@@ -606,7 +718,37 @@ extern int Decode(PyObject* fd, unsigned char *out, int codec_format)
     // See DICOM Standard, Part 3, Annex C.7.6.3.1.3
     int row, col;
     unsigned int ii;
-    if (precision <= 8) {
+    size_t px;
+    const size_t NR_PIXELS = (size_t)width * (size_t)height;
+    // Never write past the end of `out`
+    const size_t BYTES_PER_SAMPLE = precision <= 8 ? 1 : (precision <= 16 ? 2 : 4);
+    if (NR_PIXELS * NR_COMPONENTS * BYTES_PER_SAMPLE > length)
+    {
+        // the decoded image is larger than the output buffer
+        return_code = 10;
+        goto failure;
+    }
+    // Single component data is copied with a flat loop over the pixels which
+    //  the compiler can vectorise
+    const int *p_single = p_component[0];
+    if (precision <= 8 && NR_COMPONENTS == 1) {
+        // 8-bit signed/unsigned, single component
+        for (px = 0; px < NR_PIXELS; px++)
+        {
+            out[px] = (unsigned char)p_single[px];
+        }
+    } else if (precision <= 16 && NR_COMPONENTS == 1) {
+        // 16-bit signed/unsigned, single component
+        // Shifts rather than a union so the output is little endian
+        //  regardless of the platform
+        OPJ_UINT16 value;
+        for (px = 0; px < NR_PIXELS; px++)
+        {
+            value = (OPJ_UINT16)p_single[px];
+            out[2 * px] = (unsigned char)(value & 0xFF);
+            out[2 * px + 1] = (unsigned char)(value >> 8);
+        }
+    } else if (precision <= 8) {
         // 8-bit signed/unsigned
         for (row = 0; row < height; row++)
         {
@@ -704,7 +846,6 @@ extern int Decode(PyObject* fd, unsigned char *out, int codec_format)
     destroy_parameters(&parameters);
     opj_destroy_codec(codec);
     opj_image_destroy(image);
-    opj_stream_destroy(stream);
 
     return EXIT_SUCCESS;
 
@@ -719,8 +860,160 @@ extern int Decode(PyObject* fd, unsigned char *out, int codec_format)
             opj_destroy_codec(codec);
         if (image)
             opj_image_destroy(image);
-        if (stream)
-            opj_stream_destroy(stream);
 
         return return_code;
 }
+
+
+extern int Decode(
+    PyObject* fd,
+    unsigned char *out,
+    size_t length,
+    int codec_format,
+    const decode_options_t *options
+)
+{
+    /* Decode JPEG 2000 data.
+
+    Parameters
+    ----------
+    fd : PyObject *
+        The Python stream object containing the JPEG 2000 data to be decoded.
+    out : unsigned char *
+        Either a Python bytearray object or a numpy ndarray of uint8 to write the
+        decoded image data to. Multi-byte decoded data will be written using little
+        endian byte ordering.
+    length : size_t
+        The length of `out`, in bytes.
+    codec_format : int
+        The format of the JPEG 2000 data, one of:
+        * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
+        * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
+        * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    options : const decode_options_t *
+        The resolution reduction and the area of the image to decode, or NULL
+        to decode the entire image at full resolution.
+
+    Returns
+    -------
+    int
+        The exit status, 0 for success, failure otherwise.
+    */
+    // Creates an abstract input stream; allocates memory
+    opj_stream_t *stream = py_input_stream(fd);
+    if (!stream)
+    {
+        // Failed to create the input stream
+        return 1;
+    }
+
+    int return_code = decode(stream, out, length, codec_format, options);
+    opj_stream_destroy(stream);
+
+    return return_code;
+}
+
+
+extern int DecodeBuffer(
+    const unsigned char *src,
+    size_t length,
+    unsigned char *out,
+    size_t out_length,
+    int codec_format,
+    const decode_options_t *options
+)
+{
+    /* Decode JPEG 2000 data in memory.
+
+    Doesn't use the Python C API so may be called without holding the GIL.
+
+    Parameters
+    ----------
+    src : const unsigned char *
+        The JPEG 2000 data to be decoded, must remain valid until returning.
+    length : size_t
+        The length of `src`, in bytes.
+    out : unsigned char *
+        Either a Python bytearray object or a numpy ndarray of uint8 to write the
+        decoded image data to. Multi-byte decoded data will be written using little
+        endian byte ordering.
+    out_length : size_t
+        The length of `out`, in bytes.
+    codec_format : int
+        The format of the JPEG 2000 data, one of:
+        * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
+        * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
+        * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    options : const decode_options_t *
+        The resolution reduction and the area of the image to decode, or NULL
+        to decode the entire image at full resolution.
+
+    Returns
+    -------
+    int
+        The exit status, 0 for success, failure otherwise.
+    */
+    // Creates an abstract input stream; allocates memory
+    opj_stream_t *stream = buffer_input_stream(src, length);
+    if (!stream)
+    {
+        // Failed to create the input stream
+        return 1;
+    }
+
+    int return_code = decode(stream, out, out_length, codec_format, options);
+    opj_stream_destroy(stream);
+
+    return return_code;
+}
+
+
+extern int DecodeFile(
+    const char *path,
+    unsigned char *out,
+    size_t length,
+    int codec_format,
+    const decode_options_t *options
+)
+{
+    /* Decode a JPEG 2000 file.
+
+    Doesn't use the Python C API so may be called without holding the GIL.
+
+    Parameters
+    ----------
+    path : const char *
+        The path to the JPEG 2000 file to be decoded.
+    out : unsigned char *
+        Either a Python bytearray object or a numpy ndarray of uint8 to write the
+        decoded image data to. Multi-byte decoded data will be written using little
+        endian byte ordering.
+    length : size_t
+        The length of `out`, in bytes.
+    codec_format : int
+        The format of the JPEG 2000 data, one of:
+        * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
+        * ``1`` - OPJ_CODEC_JPT : JPT-stream (JPEG 2000, JPIP)
+        * ``2`` - OPJ_CODEC_JP2 : JP2 file format
+    options : const decode_options_t *
+        The resolution reduction and the area of the image to decode, or NULL
+        to decode the entire image at full resolution.
+
+    Returns
+    -------
+    int
+        The exit status, 0 for success, failure otherwise.
+    */
+    // Creates an input stream that reads from the file; allocates memory
+    opj_stream_t *stream = opj_stream_create_default_file_stream(path, OPJ_TRUE);
+    if (!stream)
+    {
+        // Failed to create the input stream
+        return 1;
+    }
+
+    int return_code = decode(stream, out, length, codec_format, options);
+    opj_stream_destroy(stream);
+
+    return return_code;
+}
@@ -37,7 +37,8 @@ extern int EncodeArray(
     int use_mct,
     PyObject *compression_ratios,
     PyObject *signal_noise_ratios,
-    int codec_format
+    int codec_format,
+    int nr_threads
 )
 {
     /* Encode a numpy ndarray using JPEG 2000.
@@ -64,6 +65,9 @@ extern int EncodeArray(
         The format of the encoded JPEG 2000 data, one of:
         * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
         * ``1`` - OPJ_CODEC_JP2 : JP2 file format
+    nr_threads : int
+        The number of threads to use for encoding, only used if OpenJPEG
+        was built with thread support.
 
     Returns
     -------
@@ -422,6 +426,13 @@ extern int EncodeArray(
         goto failure;
     }
 
+    // Multi-thread the code-block encoding, must be after opj_setup_encoder()
+    if (nr_threads > 1 && opj_has_thread_support()) {
+        if (! opj_codec_set_threads(codec, nr_threads)) {
+            py_debug("Failed to set the number of threads, using one thread");
+        }
+    }
+
     // Creates an abstract output stream; allocates memory
     stream = opj_stream_create(BUFFER_SIZE, OPJ_FALSE);
 
@@ -440,22 +451,30 @@ extern int EncodeArray(
     OPJ_BOOL result;
 
     // Encode `image` using `codec` and put the output in `stream`
+    // The GIL is released while encoding so other Python threads can run,
+    //  the stream and message callbacks re-acquire it when needed
     py_debug("Encoding started");
+    Py_BEGIN_ALLOW_THREADS
     result = opj_start_compress(codec, image, stream);
+    Py_END_ALLOW_THREADS
     if (!result)  {
         py_error("Failure result from 'opj_start_compress()'");
         return_code = 25;
         goto failure;
     }
 
+    Py_BEGIN_ALLOW_THREADS
     result = result && opj_encode(codec, stream);
+    Py_END_ALLOW_THREADS
     if (!result)  {
         py_error("Failure result from 'opj_encode()'");
         return_code = 26;
         goto failure;
     }
 
+    Py_BEGIN_ALLOW_THREADS
     result = result && opj_end_compress(codec, stream);
+    Py_END_ALLOW_THREADS
     if (!result)  {
         py_error("Failure result from 'opj_end_compress()'");
         return_code = 27;
@@ -490,7 +509,8 @@ extern int EncodeBuffer(
     unsigned int use_mct,
     PyObject *compression_ratios,
     PyObject *signal_noise_ratios,
-    int codec_format
+    int codec_format,
+    int nr_threads
 )
 {
     /* Encode image data using JPEG 2000.
@@ -499,7 +519,7 @@ extern int EncodeBuffer(
     ----------
     src : PyObject *
         The image data to be encoded, as a little endian and colour-by-pixel
-        ordered bytes or bytearray.
+        ordered C-contiguous object that supports the buffer protocol.
     columns : int
         Supported values: 1-2^16 - 1
     rows : int
@@ -527,6 +547,9 @@ extern int EncodeBuffer(
         The format of the encoded JPEG 2000 data, one of:
         * ``0`` - OPJ_CODEC_J2K : JPEG-2000 codestream
         * ``1`` - OPJ_CODEC_JP2 : JP2 file format
+    nr_threads : int
+        The number of threads to use for encoding, only used if OpenJPEG
+        was built with thread support.
 
     Returns
     -------
@@ -576,12 +599,21 @@ extern int EncodeBuffer(
         return 54;
     }
 
+    // Get a read-only view of `src` so the data can be used without copying
+    Py_buffer view;
+    if (PyObject_GetBuffer(src, &view, PyBUF_C_CONTIGUOUS) != 0) {
+        PyErr_Clear();
+        py_error("Unable to get a C-contiguous buffer from `src`");
+        return 56;
+    }
+
     // Check length of `src` matches expected dimensions
-    Py_ssize_t actual_length = PyObject_Length(src);
+    Py_ssize_t actual_length = view.len;
     // (2**24 - 1) x (2**24 - 1) * 4 * 4 -> requires 52-bits
     // OPJ_INT64 covers from (-2**63, 2**63 - 1) which is sufficient
     OPJ_INT64 expected_length = rows * columns * samples_per_pixel * bytes_per_pixel;
     if (actual_length != expected_length) {
+        PyBuffer_Release(&view);
         py_error("The length of `src` does not match the expected length");
         return 55;
     }
@@ -598,6 +630,7 @@ extern int EncodeBuffer(
             "The value of the 'photometric_interpretation' parameter is not "
             "valid for the number of samples per pixel"
         );
+        PyBuffer_Release(&view);
         return 9;
     }
 
@@ -614,6 +647,7 @@ extern int EncodeBuffer(
             "The value of the 'photometric_interpretation' parameter is not "
             "valid for the number of samples per pixel"
         );
+        PyBuffer_Release(&view);
         return 9;
     }
 
@@ -628,12 +662,14 @@ extern int EncodeBuffer(
             "The value of the 'photometric_interpretation' parameter is not "
             "valid for the number of samples per pixel"
         );
+        PyBuffer_Release(&view);
         return 9;
     }
 
     // Check the encoding format
     if (codec_format != 0 && codec_format != 1) {
         py_error("The value of the 'codec_format' parameter is invalid");
+        PyBuffer_Release(&view);
         return 10;
     }
 
@@ -779,32 +815,47 @@ extern int EncodeBuffer(
     // src is ordered as colour-by-pixel
     unsigned int p;
     OPJ_UINT64 nr_pixels = rows * columns;
-    char *data = PyBytes_AsString(src);
+    char *data = (char *) view.buf;
+    // The 8- and 16-bit data is split into the component planes one plane at
+    //  a time with the signedness checked outside the loop, so each loop is a
+    //  plain strided copy the compiler can vectorise
     if (bytes_per_pixel == 1) {
-        for (OPJ_UINT64 ii = 0; ii < nr_pixels; ii++)
+        for (p = 0; p < samples_per_pixel; p++)
         {
-            for (p = 0; p < samples_per_pixel; p++)
-            {
-                // comps[...].data[...] is OPJ_INT32 -> int32_t
-                image->comps[p].data[ii] = is_signed ? (signed char) *data : (unsigned char) *data;
-                data++;
+            // comps[...].data[...] is OPJ_INT32 -> int32_t
+            OPJ_INT32 *plane = image->comps[p].data;
+            const unsigned char *src = (const unsigned char *) view.buf + p;
+            if (is_signed) {
+                for (OPJ_UINT64 ii = 0; ii < nr_pixels; ii++)
+                {
+                    plane[ii] = (signed char) src[ii * samples_per_pixel];
+                }
+            } else {
+                for (OPJ_UINT64 ii = 0; ii < nr_pixels; ii++)
+                {
+                    plane[ii] = src[ii * samples_per_pixel];
+                }
             }
         }
     } else if (bytes_per_pixel == 2) {
-        unsigned short value;
-        unsigned char temp1;
-        unsigned char temp2;
-
-        for (OPJ_UINT64 ii = 0; ii < nr_pixels; ii++)
+        const OPJ_UINT64 stride = 2 * (OPJ_UINT64) samples_per_pixel;
+        for (p = 0; p < samples_per_pixel; p++)
         {
-            for (p = 0; p < samples_per_pixel; p++)
-            {
-                temp1 = (unsigned char) *data;
-                data++;
-                temp2 = (unsigned char) *data;
-                data++;
-                value = (unsigned short) ((temp2 << 8) + temp1);
-                image->comps[p].data[ii] = is_signed ? (signed short) value : value;
+            // Little endian, assembled with shifts so independent of the platform
+            OPJ_INT32 *plane = image->comps[p].data;
+            const unsigned char *src = (const unsigned char *) view.buf + 2 * p;
+            if (is_signed) {
+                for (OPJ_UINT64 ii = 0; ii < nr_pixels; ii++)
+                {
+                    plane[ii] = (signed short) (
+                        src[ii * stride] | (src[ii * stride + 1] << 8)
+                    );
+                }
+            } else {
+                for (OPJ_UINT64 ii = 0; ii < nr_pixels; ii++)
+                {
+                    plane[ii] = src[ii * stride] | (src[ii * stride + 1] << 8);
+                }
             }
         }
     } else if (bytes_per_pixel == 4) {
@@ -837,6 +888,7 @@ extern int EncodeBuffer(
             }
         }
     }
+    PyBuffer_Release(&view);
     py_debug("Input image configured and populated with data");
 
     /* Get an encoder handle */
@@ -866,6 +918,13 @@ extern int EncodeBuffer(
         goto failure;
     }
 
+    // Multi-thread the code-block encoding, must be after opj_setup_encoder()
+    if (nr_threads > 1 && opj_has_thread_support()) {
+        if (! opj_codec_set_threads(codec, nr_threads)) {
+            py_debug("Failed to set the number of threads, using one thread");
+        }
+    }
+
     // Creates an abstract output stream; allocates memory
     // cio::opj_stream_create(buffer size, is_input)
     stream = opj_stream_create(BUFFER_SIZE, OPJ_FALSE);
@@ -885,22 +944,30 @@ extern int EncodeBuffer(
     OPJ_BOOL result;
 
     // Encode `image` using `codec` and put the output in `stream`
+    // The GIL is released while encoding so other Python threads can run,
+    //  the stream and message callbacks re-acquire it when needed
     py_debug("Encoding started");
+    Py_BEGIN_ALLOW_THREADS
     result = opj_start_compress(codec, image, stream);
+    Py_END_ALLOW_THREADS
     if (!result)  {
         py_error("Failure result from 'opj_start_compress()'");
         return_code = 25;
         goto failure;
     }
 
+    Py_BEGIN_ALLOW_THREADS
     result = result && opj_encode(codec, stream);
+    Py_END_ALLOW_THREADS
     if (!result)  {
         py_error("Failure result from 'opj_encode()'");
         return_code = 26;
         goto failure;
     }
 
+    Py_BEGIN_ALLOW_THREADS
     result = result && opj_end_compress(codec, stream);
+    Py_END_ALLOW_THREADS
     if (!result)  {
         py_error("Failure result from 'opj_end_compress()'");
         return_code = 27;
@@ -916,6 +983,8 @@ extern int EncodeBuffer(
     return 0;
 
     failure:
+        // No-op if the view has already been released
+        PyBuffer_Release(&view);
         opj_stream_destroy(stream);
         opj_destroy_codec(codec);
         opj_image_destroy(image);
@@ -23,9 +23,14 @@ void py_log(char *name, char *log_level, const char *log_msg)
     static PyObject *msg = NULL;
     static PyObject *lib_name = NULL;
 
+    // May be called by OpenJPEG while encoding without the GIL, including
+    //  from its worker threads
+    PyGILState_STATE gil_state = PyGILState_Ensure();
+
     // import logging
     module = PyImport_ImportModuleNoBlock("logging");
     if (module == NULL) {
+        PyGILState_Release(gil_state);
         return;
     }
 
@@ -52,6 +57,8 @@ void py_log(char *name, char *log_level, const char *log_msg)
 
     Py_DECREF(msg);
     Py_DECREF(lib_name);
+
+    PyGILState_Release(gil_state);
 }
 
 // Python BinaryIO methods
@@ -72,10 +79,12 @@ Py_ssize_t py_tell(PyObject *stream)
     PyObject *result;
     Py_ssize_t location;
 
+    PyGILState_STATE gil_state = PyGILState_Ensure();
     result = PyObject_CallMethod(stream, "tell", NULL);
     location = PyLong_AsSsize_t(result);
 
     Py_DECREF(result);
+    PyGILState_Release(gil_state);
 
     //printf("py_tell(): %u\n", location);
     return location;
@@ -166,8 +175,10 @@ OPJ_BOOL py_seek(Py_ssize_t offset, void *stream, int whence)
     // k: convert C unsigned long int to Python int
     // i: convert C int to a Python integer
     PyObject *result;
+    PyGILState_STATE gil_state = PyGILState_Ensure();
     result = PyObject_CallMethod(stream, "seek", "ni", offset, whence);
     Py_DECREF(result);
+    PyGILState_Release(gil_state);
 
     //printf("py_seek(): offset %u bytes from %u\n", offset, whence);
 
@@ -235,15 +246,16 @@ OPJ_UINT64 py_length(PyObject * stream)
     Returns
     -------
     OPJ_UINT64
-        The total length of the `stream`.
+        The length of the `stream` from its current position to the end. The
+        position of the `stream` is unchanged.
     */
-    OPJ_OFF_T input_length = 0;
+    Py_ssize_t start = py_tell(stream);
 
     py_seek(0, stream, SEEK_END);
-    input_length = (OPJ_OFF_T)py_tell(stream);
-    py_seek(0, stream, SEEK_SET);
+    Py_ssize_t end = py_tell(stream);
+    py_seek(start, stream, SEEK_SET);
 
-    return (OPJ_UINT64)input_length;
+    return (OPJ_UINT64)(end - start);
 }
 
 
@@ -268,6 +280,9 @@ OPJ_SIZE_T py_write(void *src, OPJ_SIZE_T nr_bytes, void *dst)
     PyObject *result;
     PyObject *bytes_object;
 
+    // Called by OpenJPEG while encoding without the GIL
+    PyGILState_STATE gil_state = PyGILState_Ensure();
+
     // Create bytes object from `src` (of length `bytes`)
     bytes_object = PyBytes_FromStringAndSize(src, nr_bytes);
     // Use the bytes object to extend our dst using write(bytes_object)
@@ -276,6 +291,250 @@ OPJ_SIZE_T py_write(void *src, OPJ_SIZE_T nr_bytes, void *dst)
 
     Py_DECREF(bytes_object);
     Py_DECREF(result);
+    PyGILState_Release(gil_state);
+
+    return nr_bytes;
+}
+
+
+
+// In-memory input streams
+typedef struct {
+    const unsigned char *data;  // the encoded data
+    OPJ_SIZE_T length;  // the length of the encoded data
+    OPJ_SIZE_T position;  // the current position in the encoded data
+} buffer_stream_t;
+
+
+static OPJ_SIZE_T buffer_read(void *destination, OPJ_SIZE_T nr_bytes, void *src)
+{
+    /* Copy up to `nr_bytes` from the buffer stream `src` to `destination`.
+
+    Parameters
+    ----------
+    destination : void *
+        The object where the read data will be copied.
+    nr_bytes : OPJ_SIZE_T
+        The number of bytes to be read.
+    src : buffer_stream_t *
+        The buffer stream to read the data from.
+
+    Returns
+    -------
+    OPJ_SIZE_T
+        The number of bytes read or -1 if trying to read while at the end of
+        the data.
+    */
+    buffer_stream_t *stream = (buffer_stream_t *)src;
+
+    if (stream->position >= stream->length)
+        return (OPJ_SIZE_T)-1;
+
+    if (nr_bytes > stream->length - stream->position)
+        nr_bytes = stream->length - stream->position;
+
+    memcpy(destination, stream->data + stream->position, nr_bytes);
+    stream->position += nr_bytes;
 
     return nr_bytes;
 }
+
+
+static OPJ_BOOL buffer_seek_set(OPJ_OFF_T offset, void *src)
+{
+    /* Change the buffer stream position to the given `offset` from SEEK_SET.
+
+    Parameters
+    ----------
+    offset : OPJ_OFF_T
+        The offset relative to SEEK_SET.
+    src : buffer_stream_t *
+        The buffer stream to seek.
+
+    Returns
+    -------
+    OPJ_BOOL
+        OPJ_TRUE if successful, OPJ_FALSE if `offset` is outside the buffer.
+    */
+    buffer_stream_t *stream = (buffer_stream_t *)src;
+
+    if (offset < 0 || offset > (OPJ_OFF_T)stream->length)
+        return OPJ_FALSE;
+
+    stream->position = (OPJ_SIZE_T)offset;
+
+    return OPJ_TRUE;
+}
+
+
+static OPJ_OFF_T buffer_skip(OPJ_OFF_T offset, void *src)
+{
+    /* Change the buffer stream position by `offset` from SEEK_CUR and return
+    the number of skipped bytes.
+
+    Parameters
+    ----------
+    offset : OPJ_OFF_T
+        The offset relative to SEEK_CUR.
+    src : buffer_stream_t *
+        The buffer stream to seek.
+
+    Returns
+    -------
+    OPJ_OFF_T
+        The number of bytes skipped or -1 if skipping to before the start of
+        the buffer. Skipping past the end of the buffer stops at the end.
+    */
+    buffer_stream_t *stream = (buffer_stream_t *)src;
+    OPJ_OFF_T initial = (OPJ_OFF_T)stream->position;
+    OPJ_OFF_T current = initial + offset;
+
+    if (current < 0)
+        return -1;
+
+    if (current > (OPJ_OFF_T)stream->length)
+        current = (OPJ_OFF_T)stream->length;
+
+    stream->position = (OPJ_SIZE_T)current;
+
+    return current - initial;
+}
+
+
+opj_stream_t* buffer_input_stream(const unsigned char *data, size_t length)
+{
+    /* Return a new input stream that reads directly from `data`.
+
+    Doesn't use the Python C API so may be called without holding the GIL.
+
+    Parameters
+    ----------
+    data : const unsigned char *
+        The encoded data, which must remain valid until the stream is
+        destroyed.
+    length : size_t
+        The length of `data`, in bytes.
+
+    Returns
+    -------
+    opj_stream_t *
+        The input stream, which should be freed with opj_stream_destroy(), or
+        NULL if creating the stream failed.
+    */
+    opj_stream_t *stream = NULL;
+    buffer_stream_t *src = NULL;
+
+    // Creates an abstract input stream; allocates memory
+    stream = opj_stream_create(BUFFER_SIZE, OPJ_TRUE);
+    if (!stream)
+        return NULL;
+
+    src = (buffer_stream_t *)malloc(sizeof(buffer_stream_t));
+    if (!src)
+    {
+        opj_stream_destroy(stream);
+        return NULL;
+    }
+    src->data = data;
+    src->length = (OPJ_SIZE_T)length;
+    src->position = 0;
+
+    opj_stream_set_read_function(stream, buffer_read);
+    opj_stream_set_skip_function(stream, buffer_skip);
+    opj_stream_set_seek_function(stream, buffer_seek_set);
+    // `src` is freed when the stream is destroyed
+    opj_stream_set_user_data(stream, src, free);
+    opj_stream_set_user_data_length(stream, (OPJ_UINT64)length);
+
+    return stream;
+}
+
+
+// Python file-like input streams
+typedef struct {
+    PyObject *fd;  // the Python file-like containing the encoded data
+    Py_ssize_t start;  // the position of `fd` when the stream was created
+} py_stream_t;
+
+
+static OPJ_SIZE_T py_stream_read(void *destination, OPJ_SIZE_T nr_bytes, void *src)
+{
+    /* Read `nr_bytes` from the file-like stream `src` to `destination`. */
+    return py_read(destination, nr_bytes, ((py_stream_t *)src)->fd);
+}
+
+
+static OPJ_BOOL py_stream_seek_set(OPJ_OFF_T offset, void *src)
+{
+    /* Change the file-like stream position to `offset` from its start.
+
+    OpenJPEG's offsets are relative to the start of the encoded data, which
+    may not be the start of the file-like.
+    */
+    py_stream_t *stream = (py_stream_t *)src;
+
+    return py_seek(stream->start + (Py_ssize_t)offset, stream->fd, SEEK_SET);
+}
+
+
+static OPJ_OFF_T py_stream_skip(OPJ_OFF_T offset, void *src)
+{
+    /* Change the file-like stream position by `offset` from SEEK_CUR. */
+    return py_skip(offset, ((py_stream_t *)src)->fd);
+}
+
+
+static void py_stream_free(void *src)
+{
+    /* Return the file-like to its starting position and free the stream. */
+    py_stream_t *stream = (py_stream_t *)src;
+
+    py_seek(stream->start, stream->fd, SEEK_SET);
+    free(stream);
+}
+
+
+opj_stream_t* py_input_stream(PyObject *fd)
+{
+    /* Return a new input stream that reads from the Python file-like `fd`.
+
+    Parameters
+    ----------
+    fd : PyObject *
+        The Python stream object containing the encoded data (must have
+        ``read()``, ``seek()`` and ``tell()`` methods).
+
+    Returns
+    -------
+    opj_stream_t *
+        The input stream, which should be freed with opj_stream_destroy(), or
+        NULL if creating the stream failed. The encoded data starts at the
+        current position of `fd`, which is restored when the stream is freed.
+    */
+    opj_stream_t *stream = NULL;
+    py_stream_t *src = NULL;
+
+    // Creates an abstract input stream; allocates memory
+    stream = opj_stream_create(BUFFER_SIZE, OPJ_TRUE);
+    if (!stream)
+        return NULL;
+
+    src = (py_stream_t *)malloc(sizeof(py_stream_t));
+    if (!src)
+    {
+        opj_stream_destroy(stream);
+        return NULL;
+    }
+    src->fd = fd;
+    src->start = py_tell(fd);
+
+    // Functions for the stream
+    opj_stream_set_read_function(stream, py_stream_read);
+    opj_stream_set_skip_function(stream, py_stream_skip);
+    opj_stream_set_seek_function(stream, py_stream_seek_set);
+    // `fd` is returned to its starting position when the stream is destroyed
+    opj_stream_set_user_data(stream, src, py_stream_free);
+    opj_stream_set_user_data_length(stream, py_length(fd));
+
+    return stream;
+}
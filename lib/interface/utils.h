@@ -28,6 +28,12 @@
   // BinaryIO.write()
   extern OPJ_SIZE_T py_write(void *src, OPJ_SIZE_T nr_bytes, void *dst);
 
+  // Input stream for a Python BinaryIO
+  extern opj_stream_t* py_input_stream(PyObject *fd);
+
+  // Input stream for encoded data in memory
+  extern opj_stream_t* buffer_input_stream(const unsigned char *data, size_t length);
+
   // Log a message to the Python logger
   extern void py_log(char *name, char *log_level, const char *log_msg);
 
@@ -6,8 +6,11 @@ from ._version import __version__  # noqa: F401
 from .utils import (
     decode,  # noqa: F401
     decode_pixel_data,  # noqa: F401
+    decode_pixel_data_frames,  # noqa: F401
+    decode_pixel_data_iter,  # noqa: F401
     encode,  # noqa: F401
     encode_pixel_data,  # noqa: F401
+    encode_pixel_data_batched,  # noqa: F401
     get_parameters,  # noqa: F401
 )
 
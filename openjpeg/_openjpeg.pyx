@@ -1,12 +1,15 @@
 # cython: language_level=3
 # distutils: language=c
-from math import ceil
 from io import BytesIO
 import logging
+import os
 from typing import Union, Dict, BinaryIO, Tuple, List
 
 from libc.stdint cimport uint32_t
 
+from cpython.buffer cimport (
+    PyObject_CheckBuffer, PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+)
 from cpython.ref cimport PyObject
 import numpy as np
 cimport numpy as cnp
@@ -20,9 +23,46 @@ cdef extern struct JPEG2000Parameters:
     unsigned int is_signed
     uint32_t nr_tiles
 
+cdef extern struct DecodeOptions:
+    uint32_t reduce
+    uint32_t x0
+    uint32_t y0
+    uint32_t x1
+    uint32_t y1
+
 cdef extern char* OpenJpegVersion()
-cdef extern int Decode(void* fp, unsigned char* out, int codec)
+cdef extern int Decode(
+    void* fp,
+    unsigned char* out,
+    size_t length,
+    int codec,
+    const DecodeOptions *options,
+)
+cdef extern int DecodeBuffer(
+    const unsigned char* src,
+    size_t length,
+    unsigned char* out,
+    size_t out_length,
+    int codec,
+    const DecodeOptions *options,
+) nogil
+cdef extern int DecodeFile(
+    const char* path,
+    unsigned char* out,
+    size_t length,
+    int codec,
+    const DecodeOptions *options,
+) nogil
 cdef extern int GetParameters(void* fp, int codec, JPEG2000Parameters *param)
+cdef extern int GetParametersBuffer(
+    const unsigned char* src,
+    size_t length,
+    int codec,
+    JPEG2000Parameters *param,
+) nogil
+cdef extern int GetParametersFile(
+    const char* path, int codec, JPEG2000Parameters *param
+) nogil
 cdef extern int EncodeArray(
     cnp.PyArrayObject* arr,
     PyObject* dst,
@@ -32,6 +72,7 @@ cdef extern int EncodeArray(
     PyObject* compression_ratios,
     PyObject* signal_noise_ratios,
     int codec_format,
+    int nr_threads,
 )
 cdef extern int EncodeBuffer(
     PyObject* src,
@@ -46,10 +87,14 @@ cdef extern int EncodeBuffer(
     PyObject* compression_ratios,
     PyObject* signal_noise_ratios,
     int codec_format,
+    int nr_threads,
 )
 
 
 LOGGER = logging.getLogger(__name__)
+# The number of threads used by OpenJPEG when encoding (defaults to 1) and by the
+#   batch helpers (defaults to all CPUs)
+THREADS_ENV = "PYLIBJPEG_OPENJPEG_THREADS"
 ERRORS = {
     1: "failed to create the input stream",
     2: "failed to setup the decoder",
@@ -59,6 +104,8 @@ ERRORS = {
     6: "failed to decode image",
     7: "support for more than 32-bits per component is not implemented",
     8: "failed to upscale subsampled components",
+    9: "reducing the resolution of subsampled components is not supported",
+    10: "the decoded image is larger than the output buffer",
 }
 
 
@@ -70,17 +117,22 @@ def get_version() -> bytes:
 
 
 def decode(
-    fp: BinaryIO,
+    fp: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO],
     codec: int = 0,
-    as_array: bool = False
-) -> Union[np.ndarray, bytearray]:
+    as_array: bool = False,
+    reduce: int = 0,
+    decode_area: Union[Tuple[int, int, int, int], None] = None,
+    out: Union[np.ndarray, None] = None,
+) -> Tuple[int, Union[np.ndarray, bytearray], Dict[str, Union[str, int, bool]]]:
     """Return the decoded JPEG 2000 data from Python file-like `fp`.
 
     Parameters
     ----------
-    fp : file-like
-        A Python file-like containing the encoded JPEG 2000 data. Must have
-        ``tell()``, ``seek()`` and ``read()`` methods.
+    fp : str | os.PathLike | bytes | bytearray | memoryview | file-like
+        The path to the JPEG 2000 file or a Python object containing the
+        encoded JPEG 2000 data. If not a path or bytes-like then must have
+        ``tell()``, ``seek()`` and ``read()`` methods. Paths are read by
+        OpenJPEG and bytes-like directly from memory, both without copying.
     codec : int, optional
         The codec to use for decoding, one of:
 
@@ -90,46 +142,144 @@ def decode(
     as_array : bool, optional
         If ``True`` then return the decoded image data as a :class:`numpy.ndarray`
         otherwise return the data as a :class:`bytearray` (default).
+    reduce : int, optional
+        The number of highest resolution levels to discard, each level halves
+        the number of rows and columns of the decoded image (default ``0``).
+    decode_area : tuple[int, int, int, int], optional
+        The ``(x0, y0, x1, y1)`` area of the full resolution image to decode,
+        where (`x0`, `y0`) is the top left corner (inclusive) and (`x1`, `y1`)
+        the bottom right corner (exclusive). Only the tiles and code-blocks
+        that cover the area are decoded (default: the entire image).
+    out : numpy.ndarray, optional
+        A writeable, C-contiguous array to write the decoded image data to
+        instead of allocating a new one, must be exactly as many bytes as the
+        decoded image data. If used then `as_array` is ignored.
 
     Returns
     -------
-    bytearray | numpy.ndarray
-        If `as_array` is False (default) then returns the decoded image data
-        as a :class:`bytearray`, otherwise returns the image data as a
-        :class:`numpy.ndarray`.
+    tuple[int, bytearray | numpy.ndarray, dict]
+        The return code from the decoder, the decoded image data and the
+        J2K image parameters from :func:`get_parameters`, with the ``'rows'``
+        and ``'columns'`` of the decoded image. If `out` is used then the
+        decoded image data is `out`, otherwise if `as_array` is False
+        (default) then it's a :class:`bytearray`, or a :class:`numpy.ndarray`
+        if True.
 
     Raises
     ------
     RuntimeError
         If unable to decode the JPEG 2000 data.
+    ValueError
+        If `reduce`, `decode_area` or `out` are invalid.
     """
     param = get_parameters(fp, codec)
-    bpp = ceil(param['precision'] / 8)
+
+    cdef DecodeOptions options
+    options.x0, options.y0, options.x1, options.y1 = 0, 0, 0, 0
+    x0, y0, x1, y1 = 0, 0, param['columns'], param['rows']
+    if decode_area is not None:
+        x0, y0, x1, y1 = decode_area
+        if not (0 <= x0 < x1 <= param['columns'] and 0 <= y0 < y1 <= param['rows']):
+            raise ValueError(
+                f"Invalid 'decode_area' value {tuple(decode_area)}, must be "
+                f"(x0, y0, x1, y1) with 0 <= x0 < x1 <= {param['columns']} and "
+                f"0 <= y0 < y1 <= {param['rows']}"
+            )
+
+        options.x0, options.y0, options.x1, options.y1 = x0, y0, x1, y1
+
+    if reduce < 0:
+        raise ValueError(f"Invalid 'reduce' value {reduce}, must be at least 0")
+
+    # The size of the decoded image, see opj_int_ceildivpow2()
+    options.reduce = reduce
+    scale = 1 << reduce
+    param['columns'] = (x1 + scale - 1) // scale - (x0 + scale - 1) // scale
+    param['rows'] = (y1 + scale - 1) // scale - (y0 + scale - 1) // scale
+
+    bpp = (param['precision'] + 7) >> 3
     if bpp == 3:
         bpp = 4
     nr_bytes = param['rows'] * param['columns'] * param['samples_per_pixel'] * bpp
 
     cdef PyObject* p_in = <PyObject*>fp
     cdef unsigned char *p_out
-    if as_array:
+    # The decoder checks the decoded image fits in the output before writing
+    cdef size_t length = nr_bytes
+    if out is not None:
+        if not (
+            isinstance(out, np.ndarray)
+            and out.flags.c_contiguous
+            and out.flags.writeable
+        ):
+            raise ValueError("'out' must be a writeable, C-contiguous numpy.ndarray")
+
+        if out.nbytes != nr_bytes:
+            raise ValueError(
+                f"'out' must be {nr_bytes} bytes to hold the decoded image data, "
+                f"not {out.nbytes}"
+            )
+
+        p_out = <unsigned char *>cnp.PyArray_DATA(out)
+        length = out.nbytes
+    elif as_array:
         out = np.zeros(nr_bytes, dtype=np.uint8)
         p_out = <unsigned char *>cnp.PyArray_DATA(out)
     else:
         out = bytearray(nr_bytes)
         p_out = <unsigned char *>out
 
-    return_code = Decode(p_in, p_out, codec)
-
-    return return_code, out
-
-
-def get_parameters(fp: BinaryIO, codec: int = 0) -> Dict[str, Union[str, int, bool]]:
+    cdef Py_buffer view
+    cdef int codec_format = codec
+    cdef int return_code
+    cdef bytes path
+    cdef const char *p_path
+    if isinstance(fp, (str, os.PathLike)):
+        # Paths are decoded directly from the file without holding the GIL
+        # The file is opened again to decode, if it's been replaced since
+        #   reading the header then the decoder's length check stops it from
+        #   writing past the end of `out`
+        path = os.fsencode(fp)
+        p_path = path
+        with nogil:
+            return_code = DecodeFile(p_path, p_out, length, codec_format, &options)
+
+        return return_code, out, param
+
+    if not PyObject_CheckBuffer(fp):
+        return_code = Decode(p_in, p_out, length, codec_format, &options)
+        return return_code, out, param
+
+    # bytes-like are decoded directly from memory without holding the GIL
+    PyObject_GetBuffer(fp, &view, PyBUF_SIMPLE)
+    try:
+        with nogil:
+            return_code = DecodeBuffer(
+                <const unsigned char *>view.buf,
+                view.len,
+                p_out,
+                length,
+                codec_format,
+                &options,
+            )
+    finally:
+        PyBuffer_Release(&view)
+
+    return return_code, out, param
+
+
+def get_parameters(
+    fp: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO],
+    codec: int = 0,
+) -> Dict[str, Union[str, int, bool]]:
     """Return a :class:`dict` containing the JPEG 2000 image parameters.
 
     Parameters
     ----------
-    fp : file-like
-        A Python file-like containing the encoded JPEG 2000 data.
+    fp : str | os.PathLike | bytes | bytearray | memoryview | file-like
+        The path to the JPEG 2000 file or a Python object containing the
+        encoded JPEG 2000 data. If not a path or bytes-like then must have
+        ``tell()``, ``seek()`` and ``read()`` methods.
     codec : int, optional
         The codec to use for decoding, one of:
 
@@ -166,8 +316,39 @@ def get_parameters(fp: BinaryIO, codec: int = 0) -> Dict[str, Union[str, int, bo
     # Pointer to J2K data
     cdef PyObject* ptr = <PyObject*>fp
 
-    # Decode the data - output is written to output_buffer
-    result = GetParameters(ptr, codec, p_param)
+    cdef Py_buffer view
+    cdef int codec_format = codec
+    cdef int result
+    cdef bytes path
+    cdef const char *p_path
+    if isinstance(fp, (str, os.PathLike)):
+        # Only the header is read from the file, without holding the GIL
+        path = os.fsencode(fp)
+        p_path = path
+        with nogil:
+            result = GetParametersFile(p_path, codec_format, p_param)
+    elif not PyObject_CheckBuffer(fp):
+        # Decode the data - output is written to output_buffer
+        result = GetParameters(ptr, codec_format, p_param)
+    else:
+        # bytes-like are read directly from memory without holding the GIL
+        try:
+            PyObject_GetBuffer(fp, &view, PyBUF_SIMPLE)
+        except (BufferError, ValueError):
+            # Failed to create the input stream, i.e. `fp` isn't C-contiguous
+            result = 1
+        else:
+            try:
+                with nogil:
+                    result = GetParametersBuffer(
+                        <const unsigned char *>view.buf,
+                        view.len,
+                        codec_format,
+                        p_param,
+                    )
+            finally:
+                PyBuffer_Release(&view)
+
     if result != 0:
         try:
             msg = f": {ERRORS[result]}"
@@ -318,6 +499,7 @@ def encode_array(
         <PyObject *> compression_ratios,
         <PyObject *> signal_noise_ratios,
         codec_format,
+        _get_nr_threads(),
     )
     return return_code, dst.getvalue()
 
@@ -334,6 +516,7 @@ def encode_buffer(
     List[float] compression_ratios,
     List[float] signal_noise_ratios,
     int codec_format,
+    int nr_threads=0,
 ) -> Tuple[int, bytes]:
     """Return the JPEG 2000 compressed `src`.
 
@@ -343,9 +526,9 @@ def encode_buffer(
 
     Parameters
     ----------
-    src : bytes | bytearray
-        A bytes or bytearray containing the image data to be encoded, ordered as
-        little endian and colour-by-pixel.
+    src : bytes | bytearray | memoryview | numpy.ndarray
+        A C-contiguous object supporting the buffer protocol containing the
+        image data to be encoded, ordered as little endian and colour-by-pixel.
     columns : int
         The number of columns in the image, should be in the range [1, 65535].
     rows : int
@@ -375,6 +558,10 @@ def encode_buffer(
 
         * ``0``: JPEG 2000 codestream only (default) (J2K/J2C format)
         * ``1``: A boxed JPEG 2000 codestream (JP2 format)
+    nr_threads : int, optional
+        The number of threads OpenJPEG uses when encoding, if ``0`` (default)
+        then uses the ``PYLIBJPEG_OPENJPEG_THREADS`` environment variable or
+        ``1`` if not set.
 
     Returns
     -------
@@ -384,11 +571,16 @@ def encode_buffer(
         failed.
     """
     # Checks
-    if not isinstance(src, (bytes, bytearray)):
+    if not PyObject_CheckBuffer(src):
         raise TypeError(
-            f"'src' must be bytes or bytearray, not {type(src).__name__}"
+            "'src' must be bytes, bytearray or an object that supports the "
+            f"buffer protocol, not {type(src).__name__}"
         )
 
+    view = memoryview(src)
+    if not view.c_contiguous:
+        raise ValueError("'src' must be C-contiguous")
+
     if not 1 <= columns <= 65535:
         raise ValueError(
             f"Invalid 'columns' value '{columns}', must be in the range [1, 65535]"
@@ -417,7 +609,8 @@ def encode_buffer(
             "range [1, 24]"
         )
 
-    actual_length = len(src)
+    # The size in bytes, which for an ndarray isn't the same as len()
+    actual_length = view.nbytes
     expected_length = rows * columns * samples_per_pixel * bytes_allocated
     if actual_length != expected_length:
         raise ValueError(
@@ -466,5 +659,26 @@ def encode_buffer(
         <PyObject *> compression_ratios,
         <PyObject *> signal_noise_ratios,
         codec_format,
+        nr_threads or _get_nr_threads(),
     )
     return return_code, dst.getvalue()
+
+
+def _get_nr_threads(int default=1) -> int:
+    """Return the number of threads to use when encoding or batch processing.
+
+    Uses the value of the ``PYLIBJPEG_OPENJPEG_THREADS`` environment variable
+    if set, otherwise `default`.
+    """
+    value = os.environ.get(THREADS_ENV, "").strip()
+    if not value:
+        return default
+
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        LOGGER.warning(
+            f"Invalid '{THREADS_ENV}' value '{value}', must be an integer, "
+            "using 1 thread"
+        )
+        return 1
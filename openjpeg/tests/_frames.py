@@ -0,0 +1,45 @@
+"""Helpers for getting the DICOM test datasets and their encapsulated frames."""
+
+from copy import deepcopy
+from functools import lru_cache
+
+try:
+    from pydicom.encaps import generate_pixel_data_frame
+except ImportError:
+    pass
+
+from openjpeg.data import get_indexed_datasets
+
+
+@lru_cache(maxsize=None)
+def _indexed_datasets(uid):
+    """Return the indexed datasets for `uid`, only indexing each UID once.
+
+    The returned datasets are shared and mustn't be modified.
+    """
+    return get_indexed_datasets(uid)
+
+
+def indexed_datasets(uid):
+    """Return a copy of the indexed datasets for `uid`.
+
+    Each UID is only indexed once per session, but every call returns new
+    copies of the datasets so changes made by one test can't affect another.
+    """
+    return deepcopy(_indexed_datasets(uid))
+
+
+@lru_cache(maxsize=None)
+def first_frame(uid, name):
+    """Return the first frame of encapsulated pixel data for the dataset `name`.
+
+    The frame is only extracted once per session for each dataset.
+    """
+    ds = _indexed_datasets(uid)[name]["ds"]
+    return next(generate_frames(ds))
+
+
+def generate_frames(ds):
+    """Return a frame generator for DICOM datasets."""
+    nr_frames = ds.get("NumberOfFrames", 1)
+    return generate_pixel_data_frame(ds.PixelData, nr_frames)
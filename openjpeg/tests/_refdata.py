@@ -0,0 +1,37 @@
+"""Reference values for the JPEG 2000 DICOM test datasets."""
+
+# The values are for the J2K codestream and may not match the dataset itself,
+#   e.g. the TOSHIBA datasets have a Pixel Representation that doesn't match
+#   the codestream's signedness
+REF_DCM = {
+    "1.2.840.10008.1.2.4.90": [
+        # filename, (rows, columns, samples/px, bits/sample, signed?)
+        ("693_J2KR.dcm", (512, 512, 1, 14, True)),
+        ("966_fixed.dcm", (2128, 2000, 1, 12, False)),
+        ("emri_small_jpeg_2k_lossless.dcm", (64, 64, 1, 16, False)),
+        ("explicit_VR-UN.dcm", (512, 512, 1, 16, True)),
+        ("GDCMJ2K_TextGBR.dcm", (400, 400, 3, 8, False)),
+        ("JPEG2KLossless_1s_1f_u_16_16.dcm", (1416, 1420, 1, 16, False)),
+        ("MR_small_jp2klossless.dcm", (64, 64, 1, 16, True)),
+        ("MR2_J2KR.dcm", (1024, 1024, 1, 12, False)),
+        ("NM_Kakadu44_SOTmarkerincons.dcm", (2500, 2048, 1, 16, False)),
+        ("RG1_J2KR.dcm", (1955, 1841, 1, 15, False)),
+        ("RG3_J2KR.dcm", (1760, 1760, 1, 10, False)),
+        ("TOSHIBA_J2K_OpenJPEGv2Regression.dcm", (512, 512, 1, 16, False)),
+        ("TOSHIBA_J2K_SIZ0_PixRep1.dcm", (512, 512, 1, 16, False)),
+        ("TOSHIBA_J2K_SIZ1_PixRep0.dcm", (512, 512, 1, 16, True)),
+        ("US1_J2KR.dcm", (480, 640, 3, 8, False)),
+    ],
+    "1.2.840.10008.1.2.4.91": [
+        ("693_J2KI.dcm", (512, 512, 1, 16, True)),
+        ("ELSCINT1_JP2vsJ2K.dcm", (512, 512, 1, 12, False)),
+        ("JPEG2000.dcm", (1024, 256, 1, 16, True)),
+        ("MAROTECH_CT_JP2Lossy.dcm", (716, 512, 1, 12, False)),
+        ("MR2_J2KI.dcm", (1024, 1024, 1, 12, False)),
+        ("OsirixFake16BitsStoredFakeSpacing.dcm", (224, 176, 1, 11, False)),
+        ("RG1_J2KI.dcm", (1955, 1841, 1, 15, False)),
+        ("RG3_J2KI.dcm", (1760, 1760, 1, 10, False)),
+        ("SC_rgb_gdcm_KY.dcm", (100, 100, 3, 8, False)),
+        ("US1_J2KI.dcm", (480, 640, 3, 8, False)),
+    ],
+}
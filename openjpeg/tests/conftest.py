@@ -0,0 +1,33 @@
+"""pytest configuration for the unit tests."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run the slow bit-depth sweep tests",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: slow bit-depth sweep tests, only run with --runslow"
+    )
+    # Registered by pytest-xdist when installed, but the tests should also run
+    #   without it
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests with the same name on one worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="needs the --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
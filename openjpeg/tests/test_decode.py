@@ -3,11 +3,7 @@
 from io import BytesIO
 
 try:
-    from pydicom.encaps import generate_pixel_data_frame
-    from pydicom.pixel_data_handlers.util import (
-        reshape_pixel_array,
-        pixel_dtype,
-    )
+    import pydicom  # noqa: F401
 
     HAS_PYDICOM = True
 except ImportError:
@@ -16,11 +12,18 @@ except ImportError:
 import numpy as np
 import pytest
 
-from openjpeg.data import get_indexed_datasets, JPEG_DIRECTORY
+import _openjpeg
+
+from openjpeg.data import JPEG_DIRECTORY
+from openjpeg.tests._frames import first_frame, generate_frames, indexed_datasets
+from openjpeg.tests._refdata import REF_DCM
 from openjpeg.utils import (
     get_openjpeg_version,
+    get_parameters,
     decode,
     decode_pixel_data,
+    decode_pixel_data_frames,
+    decode_pixel_data_iter,
     _get_format,
 )
 
@@ -28,40 +31,6 @@ from openjpeg.utils import (
 DIR_15444 = JPEG_DIRECTORY / "15444"
 
 
-REF_DCM = {
-    "1.2.840.10008.1.2.4.90": [
-        # filename, (rows, columns, samples/px, bits/sample, signed?)
-        ("693_J2KR.dcm", (512, 512, 1, 14, True)),
-        ("966_fixed.dcm", (2128, 2000, 1, 12, False)),
-        ("emri_small_jpeg_2k_lossless.dcm", (64, 64, 1, 16, False)),
-        ("explicit_VR-UN.dcm", (512, 512, 1, 16, True)),
-        ("GDCMJ2K_TextGBR.dcm", (400, 400, 3, 8, False)),
-        ("JPEG2KLossless_1s_1f_u_16_16.dcm", (1416, 1420, 1, 16, False)),
-        ("MR_small_jp2klossless.dcm", (64, 64, 1, 16, True)),
-        ("MR2_J2KR.dcm", (1024, 1024, 1, 12, False)),
-        ("NM_Kakadu44_SOTmarkerincons.dcm", (2500, 2048, 1, 16, False)),
-        ("RG1_J2KR.dcm", (1955, 1841, 1, 15, False)),
-        ("RG3_J2KR.dcm", (1760, 1760, 1, 10, False)),
-        ("TOSHIBA_J2K_OpenJPEGv2Regression.dcm", (512, 512, 1, 16, True)),
-        ("TOSHIBA_J2K_SIZ0_PixRep1.dcm", (512, 512, 1, 16, True)),
-        ("TOSHIBA_J2K_SIZ1_PixRep0.dcm", (512, 512, 1, 16, False)),
-        ("US1_J2KR.dcm", (480, 640, 3, 8, False)),
-    ],
-    "1.2.840.10008.1.2.4.91": [
-        ("693_J2KI.dcm", (512, 512, 1, 16, True)),
-        ("ELSCINT1_JP2vsJ2K.dcm", (512, 512, 1, 12, False)),
-        ("JPEG2000.dcm", (1024, 256, 1, 16, True)),
-        ("MAROTECH_CT_JP2Lossy.dcm", (716, 512, 1, 12, False)),
-        ("MR2_J2KI.dcm", (1024, 1024, 1, 12, False)),
-        ("OsirixFake16BitsStoredFakeSpacing.dcm", (224, 176, 1, 16, False)),
-        ("RG1_J2KI.dcm", (1955, 1841, 1, 15, False)),
-        ("RG3_J2KI.dcm", (1760, 1760, 1, 10, False)),
-        ("SC_rgb_gdcm_KY.dcm", (100, 100, 3, 8, False)),
-        ("US1_J2KI.dcm", (480, 640, 3, 8, False)),
-    ],
-}
-
-
 def test_version():
     """Test that the openjpeg version can be retrieved."""
     version = get_openjpeg_version()
@@ -72,12 +41,6 @@ def test_version():
     assert 5 == version[1]
 
 
-def generate_frames(ds):
-    """Return a frame generator for DICOM datasets."""
-    nr_frames = ds.get("NumberOfFrames", 1)
-    return generate_pixel_data_frame(ds.PixelData, nr_frames)
-
-
 def test_get_format_raises():
     """Test get_format() raises for an unknown magic number"""
     buffer = BytesIO(b"\x00" * 20)
@@ -85,13 +48,32 @@ def test_get_format_raises():
     with pytest.raises(ValueError, match=msg):
         _get_format(buffer)
 
+    with pytest.raises(ValueError, match=msg):
+        _get_format(b"\xff\x4f")
+
+
+@pytest.mark.parametrize(
+    "data, j2k_format",
+    [
+        (b"\xff\x4f\xff\x51\x00\x00", 0),
+        (b"\x0d\x0a\x87\x0a\x00\x00", 2),
+        (b"\x00\x00\x00\x0c\x6a\x50\x20\x20\x0d\x0a\x87\x0a\x00", 2),
+    ],
+)
+def test_get_format(data, j2k_format):
+    """Test get_format() with bytes-like and file-like."""
+    assert j2k_format == _get_format(data)
+    assert j2k_format == _get_format(memoryview(data))
+
+    buffer = BytesIO(data)
+    assert j2k_format == _get_format(buffer)
+    assert 0 == buffer.tell()
+
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
 def test_bad_decode():
     """Test trying to decode bad data."""
-    index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
-    ds = index["966.dcm"]["ds"]
-    frame = next(generate_frames(ds))
+    frame = first_frame("1.2.840.10008.1.2.4.90", "966.dcm")
     msg = r"Error decoding the J2K data: failed to decode image"
     with pytest.raises(RuntimeError, match=msg):
         decode(frame)
@@ -106,9 +88,9 @@ class TestDecode:
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_decode_bytes(self):
         """Test decoding using bytes."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
         ds = index["MR_small_jp2klossless.dcm"]["ds"]
-        frame = next(generate_frames(ds))
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
         assert isinstance(frame, bytes)
         arr = decode(frame)
         assert arr.flags.writeable
@@ -121,12 +103,42 @@ class TestDecode:
         assert (1369, 1129, 862) == tuple(arr[-1, -3:])
         assert 862 == arr[-1, -1]
 
+    @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
+    def test_decode_memoryview(self):
+        """Test decoding using memoryview."""
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["MR_small_jp2klossless.dcm"]["ds"]
+        frame = memoryview(
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        )
+        arr = decode(frame)
+        assert arr.flags.writeable
+        assert "<i2" == arr.dtype
+        assert (ds.Rows, ds.Columns) == arr.shape
+        assert (422, 319, 361) == tuple(arr[0, 31:34])
+        assert 862 == arr[-1, -1]
+
+    @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
+    def test_decode_non_contiguous_raises(self):
+        """Test decoding a non-contiguous memoryview raises."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        data = bytearray(2 * len(frame))
+        data[::2] = frame
+        frame = memoryview(data)[::2]
+        assert not frame.c_contiguous
+
+        msg = r"Error decoding the J2K data: failed to create the input stream"
+        with pytest.raises(RuntimeError, match=msg):
+            decode(frame)
+
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_decode_filelike(self):
         """Test decoding using file-like."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
         ds = index["MR_small_jp2klossless.dcm"]["ds"]
-        frame = BytesIO(next(generate_frames(ds)))
+        frame = BytesIO(
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        )
         assert isinstance(frame, BytesIO)
         arr = decode(frame)
         assert arr.flags.writeable
@@ -139,12 +151,25 @@ class TestDecode:
         assert (1369, 1129, 862) == tuple(arr[-1, -3:])
         assert 862 == arr[-1, -1]
 
+    @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
+    def test_decode_filelike_offset(self):
+        """Test decoding a file-like positioned after the start."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        buffer = BytesIO(b"\x00" * 13 + frame + b"\x00" * 7)
+        buffer.seek(13)
+
+        arr = decode(buffer)
+        assert np.array_equal(decode(frame), arr)
+        assert 13 == buffer.tell()
+        assert get_parameters(frame) == get_parameters(buffer)
+        assert 13 == buffer.tell()
+
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_decode_bad_type_raises(self):
         """Test decoding using invalid type raises."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
-        ds = index["MR_small_jp2klossless.dcm"]["ds"]
-        frame = tuple(next(generate_frames(ds)))
+        frame = tuple(
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        )
         assert not hasattr(frame, "tell") and not isinstance(frame, bytes)
 
         msg = (
@@ -157,9 +182,7 @@ class TestDecode:
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_decode_bad_format_raises(self):
         """Test decoding using invalid jpeg format raises."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
-        ds = index["MR_small_jp2klossless.dcm"]["ds"]
-        frame = next(generate_frames(ds))
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
 
         msg = r"Unsupported 'j2k_format' value: 3"
         with pytest.raises(ValueError, match=msg):
@@ -168,9 +191,9 @@ class TestDecode:
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_decode_reshape_true(self):
         """Test decoding using invalid jpeg format raises."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
         ds = index["US1_J2KR.dcm"]["ds"]
-        frame = next(generate_frames(ds))
+        frame = first_frame("1.2.840.10008.1.2.4.90", "US1_J2KR.dcm")
 
         arr = decode(frame)
         assert arr.flags.writeable
@@ -203,9 +226,9 @@ class TestDecode:
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_decode_reshape_false(self):
         """Test decoding using invalid jpeg format raises."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
         ds = index["US1_J2KR.dcm"]["ds"]
-        frame = next(generate_frames(ds))
+        frame = first_frame("1.2.840.10008.1.2.4.90", "US1_J2KR.dcm")
 
         arr = decode(frame, reshape=False)
         assert arr.flags.writeable
@@ -214,9 +237,7 @@ class TestDecode:
     @pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
     def test_signed_error(self):
         """Regression test for #30."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
-        ds = index["693_J2KR.dcm"]["ds"]
-        frame = next(generate_frames(ds))
+        frame = first_frame("1.2.840.10008.1.2.4.90", "693_J2KR.dcm")
 
         arr = decode(frame)
         assert -2000 == arr[0, 0]
@@ -235,6 +256,154 @@ class TestDecode:
         assert (256, 256, 3) == arr.shape
         assert [235, 244, 245] == arr[0, 0, :].tolist()
 
+    def test_decode_path(self):
+        """Test decoding using a path to the file."""
+        jpg = DIR_15444 / "2KLS" / "oj36.j2k"
+        with open(jpg, "rb") as f:
+            ref = decode(f.read())
+
+        assert np.array_equal(ref, decode(jpg))
+        assert np.array_equal(ref, decode(str(jpg)))
+
+    def test_decode_path_missing_raises(self):
+        """Test decoding a path that doesn't exist raises."""
+        jpg = DIR_15444 / "2KLS" / "missing.j2k"
+        msg = r"Error decoding the J2K data: failed to create the input stream"
+        with pytest.raises(RuntimeError, match=msg):
+            decode(jpg, j2k_format=0)
+
+    def test_decode_area(self):
+        """Test decoding an area of the image."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        ref = decode(jpg)
+
+        arr = decode(jpg, decode_area=(55, 270, 65, 271))
+        assert (1, 10) == arr.shape
+        assert ref.dtype == arr.dtype
+        assert ref[270:271, 55:65].tolist() == arr.tolist()
+
+        arr = decode(jpg, decode_area=(0, 0, 512, 512))
+        assert np.array_equal(ref, arr)
+
+    @pytest.mark.parametrize(
+        "area", [(0, 0, 0, 0), (10, 0, 5, 10), (0, 0, 513, 10), (-1, 0, 10, 10)]
+    )
+    def test_decode_area_raises(self, area):
+        """Test decoding an invalid area raises."""
+        msg = r"Invalid 'decode_area' value"
+        with pytest.raises(ValueError, match=msg):
+            decode(DIR_15444 / "2KLS" / "693.j2k", decode_area=area)
+
+    def test_decode_reduce(self):
+        """Test decoding at a reduced resolution."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        arr = decode(jpg, reduce=1)
+        assert (256, 256) == arr.shape
+        assert "<i2" == arr.dtype
+
+        arr = decode(jpg, reduce=2, decode_area=(55, 270, 65, 280))
+        assert (2, 3) == arr.shape
+
+    def test_decode_reduce_raises(self):
+        """Test decoding at an invalid reduced resolution raises."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        msg = r"Invalid 'reduce' value -1, must be at least 0"
+        with pytest.raises(ValueError, match=msg):
+            decode(jpg, reduce=-1)
+
+        msg = (
+            r"Error decoding the J2K data: reducing the resolution of subsampled "
+            r"components is not supported"
+        )
+        with pytest.raises(RuntimeError, match=msg):
+            decode(DIR_15444 / "2KLS" / "oj36.j2k", reduce=1)
+
+    def test_decode_output_too_small_raises(self, monkeypatch):
+        """Test the decoder doesn't write past the end of the output."""
+        with open(DIR_15444 / "2KLS" / "693.j2k", "rb") as f:
+            data = f.read()
+
+        param = _openjpeg.get_parameters(data, 0)
+        param["rows"] -= 1
+        monkeypatch.setattr(_openjpeg, "get_parameters", lambda *args: dict(param))
+
+        msg = (
+            r"Error decoding the J2K data: the decoded image is larger than the "
+            r"output buffer"
+        )
+        with pytest.raises(RuntimeError, match=msg):
+            decode(data)
+
+    def test_decode_path_changed_raises(self, monkeypatch):
+        """Test decoding a file that changes after reading the header raises."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        param = _openjpeg.get_parameters(jpg, 0)
+        # As if the file was replaced by a smaller image between reading the
+        #   header and decoding
+        param["columns"] //= 2
+        monkeypatch.setattr(_openjpeg, "get_parameters", lambda *args: dict(param))
+
+        msg = (
+            r"Error decoding the J2K data: the decoded image is larger than the "
+            r"output buffer"
+        )
+        with pytest.raises(RuntimeError, match=msg):
+            decode(jpg)
+
+    def test_decode_out(self):
+        """Test decoding into a preallocated array."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        ref = decode(jpg)
+
+        frames = np.zeros((2, *ref.shape), dtype=ref.dtype)
+        out = decode(jpg, out=frames[1])
+        assert np.shares_memory(out, frames)
+        assert np.array_equal(ref, frames[1])
+        assert not frames[0].any()
+
+        arr = np.empty(ref.nbytes, dtype="u1")
+        assert np.array_equal(ref.ravel(), decode(jpg, out=arr).view(ref.dtype))
+
+    def test_decode_out_area_reduce(self):
+        """Test decoding an area at a reduced resolution into an array."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        ref = decode(jpg, reduce=1, decode_area=(0, 0, 512, 256))
+        assert (128, 256) == ref.shape
+
+        arr = np.empty((128, 256), dtype="<i2")
+        out = decode(jpg, reduce=1, decode_area=(0, 0, 512, 256), out=arr)
+        assert out is arr
+        assert np.array_equal(ref, arr)
+
+        # Sized for the full image rather than the reduced area
+        msg = r"'out' must be 65536 bytes to hold the decoded image data, not 524288"
+        with pytest.raises(ValueError, match=msg):
+            decode(
+                jpg,
+                reduce=1,
+                decode_area=(0, 0, 512, 256),
+                out=np.empty((512, 512), dtype="<i2"),
+            )
+
+    def test_decode_out_raises(self):
+        """Test decoding into an invalid array raises."""
+        jpg = DIR_15444 / "2KLS" / "693.j2k"
+        msg = r"'out' must be a writeable, C-contiguous numpy.ndarray"
+        with pytest.raises(ValueError, match=msg):
+            decode(jpg, out=np.empty((512, 1024), dtype="<i2")[:, ::2])
+
+        arr = np.empty((512, 512), dtype="<i2")
+        arr.flags.writeable = False
+        with pytest.raises(ValueError, match=msg):
+            decode(jpg, out=arr)
+
+        with pytest.raises(ValueError, match=msg):
+            decode(jpg, out=bytearray(512 * 512 * 2))
+
+        msg = r"'out' must be 524288 bytes to hold the decoded image data, not 262144"
+        with pytest.raises(ValueError, match=msg):
+            decode(jpg, out=np.empty((512, 512), dtype="u1"))
+
     def test_reference_J2KLS(self):
         """Test the reference J2KLS images."""
         d = DIR_15444 / "2KLS"
@@ -369,20 +538,11 @@ class TestDecodeDCM:
     @pytest.mark.parametrize("fname, info", REF_DCM["1.2.840.10008.1.2.4.90"])
     def test_jpeg2000r(self, fname, info):
         """Test get_parameters() for the j2k lossless datasets."""
-        # info: (rows, columns, spp, bps)
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
-        ds = index[fname]["ds"]
-        frame = next(generate_frames(ds))
-        arr = decode(BytesIO(frame), reshape=False)
+        # info: (rows, columns, spp, bps, signed)
+        frame = first_frame("1.2.840.10008.1.2.4.90", fname)
+        arr = decode(frame)
         assert arr.flags.writeable
 
-        ds.NumberOfFrames = 1
-        arr = arr.view(pixel_dtype(ds))
-        arr = reshape_pixel_array(ds, arr)
-
-        # plt.imshow(arr)
-        # plt.show()
-
         if info[2] == 1:
             assert (info[0], info[1]) == arr.shape
         else:
@@ -399,24 +559,32 @@ class TestDecodeDCM:
             else:
                 assert arr.dtype == "<u2"
 
+    def test_jpeg2000r_frames(self):
+        """Test decoding only the needed frames of a multi-frame dataset."""
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["emri_small_jpeg_2k_lossless.dcm"]["ds"]
+        frames = list(generate_frames(ds))
+        assert 10 == len(frames)
+        first, last = (decode(frames[idx]) for idx in (0, 9))
+        assert "<u2" == first.dtype
+        assert (ds.Rows, ds.Columns) == first.shape
+
+        # Values checked against GDCM
+        assert np.array_equal(
+            first[36, 41:51], [290, 312, 345, 414, 379, 239, 119, 76, 80, 76]
+        )
+        assert np.array_equal(
+            last[53:63, 57], [87, 45, 193, 341, 307, 133, 54, 99, 113, 101]
+        )
+
     @pytest.mark.parametrize("fname, info", REF_DCM["1.2.840.10008.1.2.4.91"])
     def test_jpeg2000i(self, fname, info):
         """Test get_parameters() for the j2k datasets."""
-        # info: (rows, columns, spp, bps)
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.91")
-        ds = index[fname]["ds"]
-
-        frame = next(generate_frames(ds))
-        arr = decode(BytesIO(frame), reshape=False)
+        # info: (rows, columns, spp, bps, signed)
+        frame = first_frame("1.2.840.10008.1.2.4.91", fname)
+        arr = decode(frame)
         assert arr.flags.writeable
 
-        ds.NumberOfFrames = 1
-        arr = arr.view(pixel_dtype(ds))
-        arr = reshape_pixel_array(ds, arr)
-
-        # plt.imshow(arr)
-        # plt.show()
-
         if info[2] == 1:
             assert (info[0], info[1]) == arr.shape
         else:
@@ -432,3 +600,164 @@ class TestDecodeDCM:
                 assert arr.dtype == "<i2"
             else:
                 assert arr.dtype == "<u2"
+
+
+@pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
+class TestDecodePixelDataIter:
+    """Tests for decode_pixel_data_iter()."""
+
+    def test_nominal(self):
+        """Test the frames are yielded in order."""
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["emri_small_jpeg_2k_lossless.dcm"]["ds"]
+        frames = list(generate_frames(ds))
+
+        result = list(decode_pixel_data_iter(iter(frames)))
+        assert 10 == len(result)
+        for frame, arr in zip(frames, result):
+            assert np.array_equal(decode_pixel_data(frame), arr)
+
+    def test_read_ahead(self, monkeypatch):
+        """Test the frames are only read ahead by one per thread."""
+        monkeypatch.setenv("PYLIBJPEG_OPENJPEG_THREADS", "2")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["emri_small_jpeg_2k_lossless.dcm"]["ds"]
+        read = []
+
+        def frames():
+            for frame in generate_frames(ds):
+                read.append(frame)
+                yield frame
+
+        result = decode_pixel_data_iter(frames(), version=2)
+        buffer = next(result)
+        assert 3 == len(read)
+        assert decode_pixel_data(read[0], version=2) == buffer
+        assert 9 == len(list(result))
+        assert 10 == len(read)
+
+    def test_bad_frame_raises(self):
+        """Test a frame that fails to decode raises when reached."""
+        frames = [
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm"),
+            first_frame("1.2.840.10008.1.2.4.90", "966.dcm"),
+        ]
+        result = decode_pixel_data_iter(frames)
+        next(result)
+        msg = r"Error decoding the J2K data: failed to decode image"
+        with pytest.raises(RuntimeError, match=msg):
+            next(result)
+
+    def test_version_2(self):
+        """Test decoding to bytearray."""
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["emri_small_jpeg_2k_lossless.dcm"]["ds"]
+        frames = list(generate_frames(ds))
+
+        result = list(decode_pixel_data_iter(frames, version=2))
+        assert [decode_pixel_data(frame, version=2) for frame in frames] == result
+
+    def test_no_frames(self):
+        """Test decoding no frames."""
+        assert [] == list(decode_pixel_data_iter([]))
+
+    def test_mismatch_warns(self):
+        """Test a dataset that doesn't match the frames warns once."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        kwargs = {"samples_per_pixel": 1, "bits_stored": 12, "pixel_representation": 1}
+        with pytest.warns(UserWarning, match="Bits Stored value '12'") as record:
+            list(decode_pixel_data_iter([frame, frame], **kwargs))
+
+        assert 1 == len(record)
+
+    def test_frame_parameters_mismatch_raises(self):
+        """Test a frame with different parameters to the first raises."""
+        frames = [
+            first_frame("1.2.840.10008.1.2.4.90", "emri_small_jpeg_2k_lossless.dcm"),
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm"),
+        ]
+        result = decode_pixel_data_iter(frames)
+        next(result)
+        msg = "The 'is_signed' value 'True' of frame 1 doesn't match"
+        with pytest.raises(ValueError, match=msg):
+            next(result)
+
+    def test_invalid_type_raises(self):
+        """Test a frame that isn't bytes-like raises."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        result = decode_pixel_data_iter([frame, tuple(frame)])
+        next(result)
+        msg = "a bytes-like object is required, not 'tuple'"
+        with pytest.raises(TypeError, match=msg):
+            next(result)
+
+
+@pytest.mark.skipif(not HAS_PYDICOM, reason="No pydicom")
+class TestDecodePixelDataFrames:
+    """Tests for decode_pixel_data_frames()."""
+
+    def test_nominal(self):
+        """Test the frames are decoded into a single array."""
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["emri_small_jpeg_2k_lossless.dcm"]["ds"]
+        frames = list(generate_frames(ds))
+
+        arr = decode_pixel_data_frames(frames)
+        assert arr.flags.c_contiguous
+        assert (10, ds.Rows, ds.Columns) == arr.shape
+        assert "<u2" == arr.dtype
+        for frame, ref in zip(frames, arr):
+            assert np.array_equal(decode(frame), ref)
+
+    def test_samples_per_pixel(self):
+        """Test decoding multi-sample frames."""
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds = index["US1_J2KR.dcm"]["ds"]
+        frame = first_frame("1.2.840.10008.1.2.4.90", "US1_J2KR.dcm")
+
+        arr = decode_pixel_data_frames([frame, frame])
+        assert (2, ds.Rows, ds.Columns, 3) == arr.shape
+        assert np.array_equal(decode(frame), arr[0])
+        assert np.array_equal(arr[0], arr[1])
+
+    def test_mismatch_warns(self):
+        """Test a dataset that doesn't match the frames warns once."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        kwargs = {"samples_per_pixel": 1, "bits_stored": 12, "pixel_representation": 1}
+        with pytest.warns(UserWarning, match="Bits Stored value '12'") as record:
+            decode_pixel_data_frames([frame, frame], **kwargs)
+
+        assert 1 == len(record)
+
+    def test_no_frames_raises(self):
+        """Test decoding no frames raises."""
+        with pytest.raises(ValueError, match="At least one frame is required"):
+            decode_pixel_data_frames([])
+
+    def test_frame_mismatch_raises(self):
+        """Test a frame with a different size to the first raises."""
+        frames = [
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm"),
+            first_frame("1.2.840.10008.1.2.4.90", "US1_J2KR.dcm"),
+        ]
+        with pytest.raises(ValueError, match="bytes to hold the decoded image"):
+            decode_pixel_data_frames(frames)
+
+    def test_frame_parameters_mismatch_raises(self):
+        """Test a frame with the same size but different parameters raises."""
+        frames = [
+            first_frame("1.2.840.10008.1.2.4.90", "emri_small_jpeg_2k_lossless.dcm"),
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm"),
+        ]
+        msg = "The 'is_signed' value 'True' of frame 1 doesn't match"
+        with pytest.raises(ValueError, match=msg):
+            decode_pixel_data_frames(frames)
+
+    def test_ndarray_frames(self):
+        """Test decoding frames from an ndarray."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        frames = np.asarray([frame, frame], dtype=object)
+
+        arr = decode_pixel_data_frames(frames)
+        assert (2, 64, 64) == arr.shape
+        assert np.array_equal(decode(frame), arr[1])
@@ -1,15 +1,17 @@
-import math
 from struct import unpack
-import sys
+from types import MappingProxyType
+from typing import NamedTuple
 
 import numpy as np
 import pytest
 
+import _openjpeg
 from openjpeg.data import JPEG_DIRECTORY
 from openjpeg.utils import (
     encode_array,
     encode_buffer,
     encode_pixel_data,
+    encode_pixel_data_batched,
     decode,
     PhotometricInterpretation as PI,
     _get_bits_stored,
@@ -17,6 +19,140 @@ from openjpeg.utils import (
 
 
 DIR_15444 = JPEG_DIRECTORY / "15444"
+# Seeded so the randomly generated test images are reproducible, only use
+#   through the `random_image` fixture
+RNG = np.random.default_rng(0x1234)
+# Shared input for the invalid parameter tests, the encoder never modifies it
+TINY_U1 = np.ones((1, 2), dtype="u1")
+TINY_U1.setflags(write=False)
+# (photometric interpretation, use MCT, MCT expected) for 3 sample data
+MCT_CASES = [
+    (PI.RGB, True, True),
+    (PI.RGB, False, False),
+    (0, True, False),
+    (3, True, False),
+    (4, True, False),
+]
+# The encode_pixel_data() kwargs for the decoded HTJ2K/Bretagne1_ht.j2k image
+BRETAGNE_KWARGS = MappingProxyType(
+    {
+        "rows": 480,
+        "columns": 640,
+        "samples_per_pixel": 3,
+        "pixel_representation": 0,
+        "photometric_interpretation": "RGB",
+        "bits_stored": 8,
+    }
+)
+# Vectorised int.bit_length() for object arrays of Python ints
+bit_length = np.frompyfunc(int.bit_length, 1, 1)
+
+
+def boundary_pairs(dtype):
+    """Return pairs of values at the boundaries of each precision of `dtype`."""
+    dtype = np.dtype(dtype)
+    max_bits = dtype.itemsize * 8
+    if dtype.kind == "u":
+        # The smallest and largest value of each precision
+        pairs = [(0, 0), (1, 0)] + [
+            (value, 0)
+            for nr_bits in range(2, max_bits + 1)
+            for value in (2 ** (nr_bits - 1), 2**nr_bits - 1)
+        ]
+        return np.asarray(pairs, dtype=dtype)
+
+    pairs = [(0, 0), (-1, 0)]
+    for nr_bits in range(2, max_bits + 1):
+        # The narrowest and widest ranges that require `nr_bits`
+        minimin, minimax = -(2 ** (nr_bits - 2)) - 1, 2 ** (nr_bits - 2)
+        maximax, maximin = 2 ** (nr_bits - 1) - 1, -(2 ** (nr_bits - 1))
+        pairs += [
+            (minimin, minimax),
+            (minimax - 1, minimax),
+            (minimin, minimin + 1),
+            (maximin, maximax),
+            (0, maximax),
+            (minimin, 0),
+        ]
+
+    return np.asarray(pairs, dtype=dtype)
+
+
+def expected_bits_stored(pairs):
+    """Return the bits stored for each of `pairs` using int.bit_length()."""
+    maximum = pairs.max(axis=-1).astype(object)
+    if pairs.dtype.kind == "u":
+        return np.maximum(bit_length(maximum), 1).astype(int)
+
+    minimum = pairs.min(axis=-1).astype(object)
+    magnitude = np.maximum(np.maximum(maximum, 0), np.maximum(~minimum, 0))
+    return (bit_length(magnitude) + 1).astype(int)
+
+
+@pytest.fixture(scope="module")
+def random_image():
+    """Return a function that creates read-only random images.
+
+    Images are cached by their shape, bit-depth, signedness and byte order so
+    the same image is shared by every test in the module that asks for it.
+    Use a `byteorder` of ``"<"`` for data passed to encode_buffer().
+    """
+    cache = {}
+
+    def create(shape, bit_depth, is_signed, byteorder="="):
+        key = (shape, bit_depth, is_signed, byteorder)
+        if key in cache:
+            return cache[key]
+
+        if byteorder != "=":
+            # A no-op on little endian systems, otherwise swapped only once
+            arr = create(shape, bit_depth, is_signed)
+            arr = arr.astype(arr.dtype.newbyteorder(byteorder), copy=False)
+        else:
+            itemsize = 4 if bit_depth > 16 else (bit_depth + 7) >> 3
+            if is_signed:
+                low, high = -(2 ** (bit_depth - 1)), 2 ** (bit_depth - 1)
+            else:
+                low, high = 0, 2**bit_depth
+
+            arr = RNG.integers(
+                low, high, size=shape, dtype=f"{'i' if is_signed else 'u'}{itemsize}"
+            )
+
+        arr.setflags(write=False)
+        cache[key] = arr
+        return arr
+
+    return create
+
+
+@pytest.fixture(scope="module")
+def decoded_image():
+    """Return a function that decodes a JPEG 2000 test file from DIR_15444.
+
+    Decoded images are read-only and cached so each file is only decoded once.
+    """
+    cache = {}
+
+    def get(*parts):
+        if parts not in cache:
+            with open(DIR_15444.joinpath(*parts), "rb") as f:
+                arr = decode(f.read())
+
+            arr.setflags(write=False)
+            cache[parts] = arr
+
+        return cache[parts]
+
+    return get
+
+
+class J2KParameters(NamedTuple):
+    precision: int
+    is_signed: bool
+    components: int
+    mct: bool
+    layers: int
 
 
 def parse_j2k(buffer):
@@ -38,12 +174,10 @@ def parse_j2k(buffer):
     c_siz = buffer[40:42]
     nr_components = unpack(">H", c_siz)[0]
 
-    o = 42
-    for component in range(nr_components):
-        ssiz = buffer[o]
-        # xrsiz = buffer[o + 1]
-        # yrsiz = buffer[o + 2]
-        o += 3
+    # Each component has 3 bytes of (Ssiz, XRsiz, YRsiz) and the encoder
+    #   always uses the same precision and signedness for every component
+    ssiz = buffer[42]
+    o = 42 + 3 * nr_components
 
     # Should be at the start of the COD marker
     # cod = buffer[o : o + 2]
@@ -55,19 +189,32 @@ def parse_j2k(buffer):
     nr_layers = sg_cod[1:3]
     mct = sg_cod[3]  # 0 for none, 1 for applied
 
-    param = {}
-    if ssiz & 0x80:
-        param["precision"] = (ssiz & 0x7F) + 1
-        param["is_signed"] = True
+    return J2KParameters(
+        precision=(ssiz & 0x7F) + 1,
+        is_signed=bool(ssiz & 0x80),
+        components=nr_components,
+        mct=bool(mct),
+        layers=unpack(">H", nr_layers)[0],
+    )
+
+
+def check_encoded(arr, buffer, precision, layers=1, atol=None):
+    """Check the J2K `buffer` and its decoded image against `arr`.
+
+    The decoded image must match `arr` exactly, or be within `atol` if used.
+    """
+    param = parse_j2k(buffer)
+    assert param.precision == precision
+    assert param.is_signed is (arr.dtype.kind == "i")
+    assert param.layers == layers
+    assert param.components == (1 if arr.ndim == 2 else arr.shape[2])
+
+    out = decode(buffer)
+    assert out.dtype.kind == arr.dtype.kind
+    if atol is None:
+        assert np.array_equal(arr, out)
     else:
-        param["precision"] = ssiz + 1
-        param["is_signed"] = False
-
-    param["components"] = nr_components
-    param["mct"] = bool(mct)
-    param["layers"] = unpack(">H", nr_layers)[0]
-
-    return param
+        assert np.allclose(arr, out, atol=atol)
 
 
 class TestEncode:
@@ -97,12 +244,12 @@ class TestEncode:
         with pytest.raises(RuntimeError, match=msg):
             encode_array(np.ones((1, 2, 5), dtype="u1"))
 
-    def test_invalid_dtype_raises(self):
+    @pytest.mark.parametrize("dtype", ["u8", "i8", "f", "d", "c", "U", "m", "M"])
+    def test_invalid_dtype_raises(self, dtype):
         """Test invalid array dtype raise exceptions."""
         msg = "input array has an unsupported dtype"
-        for dtype in ("u8", "i8", "f", "d", "c", "U", "m", "M"):
-            with pytest.raises((ValueError, RuntimeError), match=msg):
-                encode_array(np.ones((1, 2), dtype=dtype))
+        with pytest.raises((ValueError, RuntimeError), match=msg):
+            encode_array(np.empty((1, 2), dtype=dtype))
 
     def test_invalid_contiguity_raises(self):
         """Test invalid array contiguity raise exceptions."""
@@ -136,10 +283,10 @@ class TestEncode:
             r"be in the range \(1, 8\)"
         )
         with pytest.raises(ValueError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), bits_stored=0)
+            encode_array(TINY_U1, bits_stored=0)
 
         with pytest.raises(ValueError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), bits_stored=9)
+            encode_array(TINY_U1, bits_stored=9)
 
         msg = (
             "A 'bits_stored' value of 15 is incompatible with the range of "
@@ -197,7 +344,7 @@ class TestEncode:
             "parameter is not valid for the number of samples per pixel"
         )
         with pytest.raises(RuntimeError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), photometric_interpretation=PI.RGB)
+            encode_array(TINY_U1, photometric_interpretation=PI.RGB)
 
         with pytest.raises(RuntimeError, match=msg):
             encode_array(
@@ -220,27 +367,27 @@ class TestEncode:
         """Test an invalid 'compression_ratios' raises exceptions."""
         msg = "More than 10 compression layers is not supported"
         with pytest.raises(ValueError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), compression_ratios=[1] * 11)
+            encode_array(TINY_U1, compression_ratios=[1] * 11)
 
         msg = (
             "Error encoding the data: invalid compression ratio, lowest value "
             "must be at least 1"
         )
         with pytest.raises(RuntimeError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), compression_ratios=[0])
+            encode_array(TINY_U1, compression_ratios=[0])
 
     def test_invalid_signal_noise_ratios_raises(self):
         """Test an invalid 'signal_noise_ratios' raises exceptions."""
         msg = "More than 10 compression layers is not supported"
         with pytest.raises(ValueError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), signal_noise_ratios=[1] * 11)
+            encode_array(TINY_U1, signal_noise_ratios=[1] * 11)
 
         msg = (
             "Error encoding the data: invalid signal-to-noise ratio, lowest "
             "value must be at least 0"
         )
         with pytest.raises(RuntimeError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"), signal_noise_ratios=[-1])
+            encode_array(TINY_U1, signal_noise_ratios=[-1])
 
     def test_encoding_failures_raise(self):
         """Miscellaneous test to check that failures are handled properly."""
@@ -255,375 +402,170 @@ class TestEncode:
         # Input too small
         msg = r"Error encoding the data: failure result from 'opj_start_compress\(\)'"
         with pytest.raises(RuntimeError, match=msg):
-            encode_array(np.ones((1, 2), dtype="u1"))
-
-    def test_mct(self):
-        """Test that MCT is applied as required."""
-        # Should only be applied with RGB
-        arr = np.random.randint(0, 2**8 - 1, size=(100, 100, 3), dtype="u1")
-        buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=True)
-        param = parse_j2k(buffer)
-        assert param["mct"] is True
-
+            encode_array(TINY_U1)
+
+    @pytest.mark.parametrize("pi, use_mct, expected", MCT_CASES)
+    def test_mct(self, pi, use_mct, expected, random_image):
+        """Test that MCT is only applied to RGB data."""
+        arr = random_image((100, 100, 3), 8, False)
+        buffer = encode_array(arr, photometric_interpretation=pi, use_mct=use_mct)
+        assert parse_j2k(buffer).mct is expected
+
+    @pytest.mark.parametrize("use_mct", [True, False])
+    def test_mct_preserved_with_rate_control(self, use_mct, random_image):
+        """Test that MCT is applied as required with lossy encoding."""
+        arr = random_image((100, 100, 3), 8, False)
         buffer = encode_array(
             arr,
             photometric_interpretation=PI.RGB,
-            use_mct=True,
+            use_mct=use_mct,
             compression_ratios=[2.5, 3, 5],
         )
-        param = parse_j2k(buffer)
-        assert param["mct"] is True
-
-        buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
+        assert parse_j2k(buffer).mct is use_mct
 
-        buffer = encode_array(
-            arr,
-            photometric_interpretation=PI.RGB,
-            use_mct=False,
-            compression_ratios=[2.5, 3, 5],
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
-
-        for pi in (0, 3, 4):
-            buffer = encode_array(arr, photometric_interpretation=pi, use_mct=True)
-            param = parse_j2k(buffer)
-            assert param["mct"] is False
-
-            buffer = encode_array(
-                arr,
-                photometric_interpretation=pi,
-                use_mct=True,
-                compression_ratios=[2.5, 3, 5],
-            )
-            param = parse_j2k(buffer)
-            assert param["mct"] is False
-
-        arr = np.random.randint(0, 2**8 - 1, size=(100, 100), dtype="u1")
+    def test_mct_mono_and_rgba(self, random_image):
+        """Test that MCT isn't applied to 1 or 4 sample data."""
+        arr = random_image((100, 100), 8, False)
         buffer = encode_array(
             arr, photometric_interpretation=PI.MONOCHROME1, use_mct=True
         )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
+        assert parse_j2k(buffer).mct is False
 
-        buffer = encode_array(
-            arr,
-            photometric_interpretation=PI.MONOCHROME1,
-            use_mct=True,
-            compression_ratios=[2.5, 3, 5],
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
-
-        arr = np.random.randint(0, 2**8 - 1, size=(100, 100, 4), dtype="u1")
+        arr = random_image((100, 100, 4), 8, False)
         buffer = encode_array(arr, photometric_interpretation=5, use_mct=True)
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
-
-        buffer = encode_array(
-            arr,
-            photometric_interpretation=5,
-            use_mct=True,
-            compression_ratios=[2.5, 3, 5],
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
+        assert parse_j2k(buffer).mct is False
 
-    def test_lossless_bool(self):
-        """Test encoding bool data for bit-depth 1"""
+    def test_lossless_bool(self, decoded_image):
         """Test encoding bool data for bit-depth 1"""
         # Convert one of the test images to 1-bit
         # Note that as of OpenJpeg v2.5.0 that random 1-bit images are prone
         #   to encoding failures
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
         assert "uint8" == arr.dtype
         assert (480, 640, 3) == arr.shape
 
-        mono = arr[..., 0]
-        mono[mono <= 127] = 0
-        mono[mono > 127] = 1
-        mono = mono.astype("bool")
-        assert mono.min() == 0
-        assert mono.max() == 1
+        # Threshold into independent arrays so the decoded image isn't modified
+        mono = arr[..., 0] > 127
+        rgb = arr > 127
+        assert mono.any() and not mono.all()
 
         buffer = encode_array(mono, photometric_interpretation=PI.MONOCHROME2)
         out = decode(buffer)
         param = parse_j2k(buffer)
-        assert param["precision"] == 1
-        assert param["is_signed"] is False
-        assert param["layers"] == 1
-        assert param["components"] == 1
+        assert param.precision == 1
+        assert param.is_signed is False
+        assert param.layers == 1
+        assert param.components == 1
 
         assert out.dtype.kind == "u"
         assert np.array_equal(mono, out)
 
-        arr[arr <= 127] = 0
-        arr[arr > 127] = 1
-        arr = arr.astype("bool")
-
-        buffer = encode_array(arr, photometric_interpretation=PI.RGB)
+        buffer = encode_array(rgb, photometric_interpretation=PI.RGB)
         out = decode(buffer)
         param = parse_j2k(buffer)
-        assert param["precision"] == 1
-        assert param["is_signed"] is False
-        assert param["layers"] == 1
-        assert param["components"] == 3
+        assert param.precision == 1
+        assert param.is_signed is False
+        assert param.layers == 1
+        assert param.components == 3
 
         assert out.dtype.kind == "u"
-        assert np.array_equal(arr, out)
+        assert np.array_equal(rgb, out)
 
-    def test_lossless_unsigned(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(2, 17))
+    def test_lossless_unsigned(self, bit_depth, random_image):
         """Test encoding unsigned data for bit-depth 1-16"""
         rows = 123
         cols = 234
-        for bit_depth in range(2, 17):
-            maximum = 2**bit_depth - 1
-            dtype = f"u{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype=dtype)
-            buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, 3), dtype=dtype
-            )
-            buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 3
-
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols), bit_depth, False)
+        buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
+        check_encoded(arr, buffer, bit_depth)
 
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, 4), dtype=dtype
-            )
-            buffer = encode_array(arr, photometric_interpretation=5, use_mct=False)
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 4
+        arr = random_image((rows, cols, 3), bit_depth, False)
+        buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
+        check_encoded(arr, buffer, bit_depth)
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, 4), bit_depth, False)
+        buffer = encode_array(arr, photometric_interpretation=5, use_mct=False)
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_unsigned_u4(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(17, 25))
+    def test_lossless_unsigned_u4(self, bit_depth, random_image):
         """Test encoding unsigned data for bit-depth 17-32"""
         rows = 123
         cols = 234
         planes = 3
-        for bit_depth in range(17, 25):
-            maximum = 2**bit_depth - 1
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype="u4")
-            buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols), bit_depth, False)
+        buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
+        check_encoded(arr, buffer, bit_depth)
 
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, planes), dtype="u4"
-            )
-            buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 3
-
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, planes), bit_depth, False)
+        buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_signed(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(2, 17))
+    def test_lossless_signed(self, bit_depth, random_image):
         """Test encoding signed data for bit-depth 1-16"""
         rows = 123
         cols = 543
-        for bit_depth in range(2, 17):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            dtype = f"i{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype=dtype
-            )
-            buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            dtype = f"i{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(
-                low=minimum, high=maximum, size=(rows, cols, 3), dtype=dtype
-            )
-            buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 3
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                low=minimum, high=maximum, size=(rows, cols, 4), dtype=dtype
-            )
-            buffer = encode_array(arr, photometric_interpretation=5, use_mct=False)
-            out = decode(buffer)
+        arr = random_image((rows, cols), bit_depth, True)
+        buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
+        check_encoded(arr, buffer, bit_depth)
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 4
+        arr = random_image((rows, cols, 3), bit_depth, True)
+        buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
+        check_encoded(arr, buffer, bit_depth)
 
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, 4), bit_depth, True)
+        buffer = encode_array(arr, photometric_interpretation=5, use_mct=False)
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_signed_i4(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(17, 25))
+    def test_lossless_signed_i4(self, bit_depth, random_image):
         """Test encoding signed data for bit-depth 17-32"""
         rows = 123
         cols = 234
         planes = 3
-        for bit_depth in range(17, 25):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype="i4"
-            )
-            buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
-            out = decode(buffer)
+        arr = random_image((rows, cols), bit_depth, True)
+        buffer = encode_array(arr, photometric_interpretation=PI.MONOCHROME2)
+        check_encoded(arr, buffer, bit_depth)
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols, planes), dtype="i4"
-            )
-            buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 3
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, planes), bit_depth, True)
+        buffer = encode_array(arr, photometric_interpretation=PI.RGB, use_mct=False)
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossy_unsigned(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(1, 17))
+    def test_lossy_unsigned(self, bit_depth, random_image):
         """Test lossy encoding with unsigned data"""
         rows = 123
         cols = 234
-        for bit_depth in range(1, 17):
-            maximum = 2**bit_depth - 1
-            dtype = f"u{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype=dtype)
-            buffer = encode_array(arr, compression_ratios=[4, 2, 1])
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 3
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "u"
-            assert np.allclose(arr, out, atol=5)
-
-            buffer = encode_array(arr, signal_noise_ratios=[50, 100, 200])
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 3
-            assert param["components"] == 1
+        arr = random_image((rows, cols), bit_depth, False)
+        buffer = encode_array(arr, compression_ratios=[4, 2, 1])
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-            assert out.dtype.kind == "u"
-            assert np.allclose(arr, out, atol=5)
+        buffer = encode_array(arr, signal_noise_ratios=[50, 100, 200])
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-    def test_lossy_signed(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(1, 17))
+    def test_lossy_signed(self, bit_depth, random_image):
         """Test lossy encoding with unsigned data"""
         rows = 123
         cols = 234
-        for bit_depth in range(1, 17):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            dtype = f"i{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype=dtype
-            )
-            buffer = encode_array(arr, compression_ratios=[4, 2, 1])
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 3
-            assert param["components"] == 1
+        arr = random_image((rows, cols), bit_depth, True)
+        buffer = encode_array(arr, compression_ratios=[4, 2, 1])
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-            assert out.dtype.kind == "i"
-            assert np.allclose(arr, out, atol=5)
+        buffer = encode_array(arr, signal_noise_ratios=[50, 100, 200])
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-            buffer = encode_array(arr, signal_noise_ratios=[50, 100, 200])
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 3
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.allclose(arr, out, atol=5)
-
-    def test_roundtrip_u1_ybr(self):
+    def test_roundtrip_u1_ybr(self, decoded_image):
         """Test a round trip for u1 YBR."""
-        jpg = DIR_15444 / "2KLS" / "oj36.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
+        arr = decoded_image("2KLS", "oj36.j2k")
         assert "uint8" == arr.dtype
         assert (256, 256, 3) == arr.shape
 
@@ -650,20 +592,15 @@ class TestEncode:
         out = decode(result)
         assert np.allclose(out, arr, atol=2)
 
-    def test_roundtrip_i2_mono(self):
+    def test_roundtrip_i2_mono(self, decoded_image):
         """Test a round trip for i2 YBR."""
 
-        jpg = DIR_15444 / "2KLS" / "693.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
+        arr = decoded_image("2KLS", "693.j2k")
         assert "<i2" == arr.dtype
         assert (512, 512) == arr.shape
 
-        if sys.byteorder == "big":
-            # ndarray must match system byte order
-            arr = arr.astype(">i2")
+        # ndarray must match system byte order, a no-op on little endian systems
+        arr = arr.astype("=i2", copy=False)
 
         # Test lossless
         result = encode_array(
@@ -691,11 +628,9 @@ class TestEncode:
         out = decode(result)
         assert np.allclose(out, arr, atol=2)
 
-    def test_jp2(self):
+    def test_jp2(self, decoded_image):
         """Test using JP2 format"""
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            arr = decode(f.read())
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
 
         buffer = encode_array(arr, codec_format=1)
         assert buffer.startswith(b"\x00\x00\x00\x0c\x6a\x50\x20\x20\x0d\x0a\x87\x0a")
@@ -706,10 +641,19 @@ class TestEncodeBuffer:
 
     def test_invalid_type_raises(self):
         """Test invalid buffer type raises."""
-        msg = "'src' must be bytes or bytearray, not list"
+        msg = (
+            "'src' must be bytes, bytearray or an object that supports the "
+            "buffer protocol, not list"
+        )
         with pytest.raises(TypeError, match=msg):
             encode_buffer([1, 2, 3], 1, 1, 1, 1, False)
 
+    def test_non_contiguous_raises(self):
+        """Test a non C-contiguous buffer raises."""
+        arr = np.zeros((4, 4), dtype="u1")
+        with pytest.raises(ValueError, match="'src' must be C-contiguous"):
+            encode_buffer(arr[:, ::2], 2, 4, 1, 8, False)
+
     def test_invalid_shape_raises(self):
         """Test invalid image shape raises."""
         msg = r"Invalid 'columns' value '0', must be in the range \[1, 65535\]"
@@ -746,31 +690,20 @@ class TestEncodeBuffer:
         with pytest.raises(ValueError, match=msg):
             encode_buffer(b"", 1, 1, 1, 25, False)
 
-    def test_invalid_length_raises(self):
+    @pytest.mark.parametrize(
+        "bits_stored, src, length",
+        [(ii, b"\x00\x01", 1) for ii in range(1, 9)]
+        + [(ii, b"\x00\x01\x02", 2) for ii in range(9, 17)]
+        + [(ii, b"\x00\x01\x02", 4) for ii in range(17, 25)],
+    )
+    def test_invalid_length_raises(self, bits_stored, src, length):
         """Test mismatch between actual and expected src length"""
         msg = (
-            "The length of 'src' is 2 bytes which doesn't match the expected "
-            "length of 1 bytes"
+            f"The length of 'src' is {len(src)} bytes which doesn't match the "
+            f"expected length of {length} bytes"
         )
-        for bits_stored in range(1, 9):
-            with pytest.raises(ValueError, match=msg):
-                encode_buffer(b"\x00\x01", 1, 1, 1, bits_stored, False)
-
-        msg = (
-            "The length of 'src' is 3 bytes which doesn't match the expected "
-            "length of 2 bytes"
-        )
-        for bits_stored in range(9, 17):
-            with pytest.raises(ValueError, match=msg):
-                encode_buffer(b"\x00\x01\x02", 1, 1, 1, bits_stored, False)
-
-        msg = (
-            "The length of 'src' is 3 bytes which doesn't match the expected "
-            "length of 4 bytes"
-        )
-        for bits_stored in range(17, 25):
-            with pytest.raises(ValueError, match=msg):
-                encode_buffer(b"\x00\x01\x02", 1, 1, 1, bits_stored, False)
+        with pytest.raises(ValueError, match=msg):
+            encode_buffer(src, 1, 1, 1, bits_stored, False)
 
     def test_invalid_photometric_interpretation_raises(self):
         """Test invalid photometric interpretation"""
@@ -852,108 +785,51 @@ class TestEncodeBuffer:
         with pytest.raises(RuntimeError, match=msg):
             encode_buffer(b"\x00\x01", 1, 2, 1, 8, False)
 
-    def test_mct(self):
-        """Test that MCT is applied as required."""
-        # Should only be applied with RGB
-        arr = np.random.randint(0, 2**8 - 1, size=(100, 100, 3), dtype="u1")
+    def test_buffer_types(self, random_image):
+        """Test encoding objects that support the buffer protocol."""
+        arr = random_image((10, 12), 16, False, "<")
+        reference = encode_buffer(arr.tobytes(), 12, 10, 1, 16, False)
+        for src in (arr, bytearray(arr), memoryview(arr)):
+            assert encode_buffer(src, 12, 10, 1, 16, False) == reference
+
+    @pytest.mark.parametrize("pi, use_mct, expected", MCT_CASES)
+    def test_mct(self, pi, use_mct, expected, random_image):
+        """Test that MCT is only applied to RGB data."""
+        arr = random_image((100, 100, 3), 8, False)
         buffer = encode_buffer(
-            arr.tobytes(),
+            arr,
             100,
             100,
             3,
             8,
             False,
-            photometric_interpretation=PI.RGB,
-            use_mct=True,
+            photometric_interpretation=pi,
+            use_mct=use_mct,
         )
-        param = parse_j2k(buffer)
-        assert param["mct"] is True
+        assert parse_j2k(buffer).mct is expected
 
+    @pytest.mark.parametrize("use_mct", [True, False])
+    def test_mct_preserved_with_rate_control(self, use_mct, random_image):
+        """Test that MCT is applied as required with lossy encoding."""
+        arr = random_image((100, 100, 3), 8, False)
         buffer = encode_buffer(
-            arr.tobytes(),
+            arr,
             100,
             100,
             3,
             8,
             False,
             photometric_interpretation=PI.RGB,
-            use_mct=True,
+            use_mct=use_mct,
             compression_ratios=[2.5, 3, 5],
         )
-        param = parse_j2k(buffer)
-        assert param["mct"] is True
-
-        buffer = encode_buffer(
-            arr.tobytes(),
-            100,
-            100,
-            3,
-            8,
-            False,
-            photometric_interpretation=PI.RGB,
-            use_mct=False,
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
+        assert parse_j2k(buffer).mct is use_mct
 
+    def test_mct_mono_and_rgba(self, random_image):
+        """Test that MCT isn't applied to 1 or 4 sample data."""
+        arr = random_image((100, 100), 8, False)
         buffer = encode_buffer(
-            arr.tobytes(),
-            100,
-            100,
-            3,
-            8,
-            False,
-            photometric_interpretation=PI.RGB,
-            use_mct=False,
-            compression_ratios=[2.5, 3, 5],
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
-
-        for pi in (0, 3, 4):
-            buffer = encode_buffer(
-                arr.tobytes(),
-                100,
-                100,
-                3,
-                8,
-                False,
-                photometric_interpretation=pi,
-                use_mct=True,
-            )
-            param = parse_j2k(buffer)
-            assert param["mct"] is False
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                100,
-                100,
-                3,
-                8,
-                False,
-                photometric_interpretation=pi,
-                use_mct=True,
-                compression_ratios=[2.5, 3, 5],
-            )
-            param = parse_j2k(buffer)
-            assert param["mct"] is False
-
-        arr = np.random.randint(0, 2**8 - 1, size=(100, 100), dtype="u1")
-        buffer = encode_buffer(
-            arr.tobytes(),
-            100,
-            100,
-            1,
-            8,
-            False,
-            photometric_interpretation=PI.MONOCHROME1,
-            use_mct=True,
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
-
-        buffer = encode_buffer(
-            arr.tobytes(),
+            arr,
             100,
             100,
             1,
@@ -961,27 +837,12 @@ class TestEncodeBuffer:
             False,
             photometric_interpretation=PI.MONOCHROME1,
             use_mct=True,
-            compression_ratios=[2.5, 3, 5],
         )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
+        assert parse_j2k(buffer).mct is False
 
-        arr = np.random.randint(0, 2**8 - 1, size=(100, 100, 4), dtype="u1")
+        arr = random_image((100, 100, 4), 8, False)
         buffer = encode_buffer(
-            arr.tobytes(),
-            100,
-            100,
-            4,
-            8,
-            False,
-            photometric_interpretation=5,
-            use_mct=True,
-        )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
-
-        buffer = encode_buffer(
-            arr.tobytes(),
+            arr,
             100,
             100,
             4,
@@ -989,33 +850,25 @@ class TestEncodeBuffer:
             False,
             photometric_interpretation=5,
             use_mct=True,
-            compression_ratios=[2.5, 3, 5],
         )
-        param = parse_j2k(buffer)
-        assert param["mct"] is False
+        assert parse_j2k(buffer).mct is False
 
-    def test_lossless_bool(self):
+    def test_lossless_bool(self, decoded_image):
         """Test encoding bool data for bit-depth 1"""
         # Convert one of the test images to 1-bit
         # Note that as of OpenJpeg v2.5.0 that random 1-bit images are prone
         #   to encoding failures
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
         assert "uint8" == arr.dtype
         assert (480, 640, 3) == arr.shape
 
-        mono = arr[..., 0]
-        mono[mono <= 127] = 0
-        mono[mono > 127] = 1
-        mono = mono.astype("bool")
-        assert mono.min() == 0
-        assert mono.max() == 1
+        # Threshold into independent arrays so the decoded image isn't modified
+        mono = arr[..., 0] > 127
+        rgb = arr > 127
+        assert mono.any() and not mono.all()
 
         buffer = encode_buffer(
-            mono.tobytes(),
+            mono,
             640,
             480,
             1,
@@ -1025,20 +878,16 @@ class TestEncodeBuffer:
         )
         out = decode(buffer)
         param = parse_j2k(buffer)
-        assert param["precision"] == 1
-        assert param["is_signed"] is False
-        assert param["layers"] == 1
-        assert param["components"] == 1
+        assert param.precision == 1
+        assert param.is_signed is False
+        assert param.layers == 1
+        assert param.components == 1
 
         assert out.dtype.kind == "u"
         assert np.array_equal(mono, out)
 
-        arr[arr <= 127] = 0
-        arr[arr > 127] = 1
-        arr = arr.astype("bool")
-
         buffer = encode_buffer(
-            arr.tobytes(),
+            rgb,
             640,
             480,
             3,
@@ -1048,577 +897,333 @@ class TestEncodeBuffer:
         )
         out = decode(buffer)
         param = parse_j2k(buffer)
-        assert param["precision"] == 1
-        assert param["is_signed"] is False
-        assert param["layers"] == 1
-        assert param["components"] == 3
+        assert param.precision == 1
+        assert param.is_signed is False
+        assert param.layers == 1
+        assert param.components == 3
 
         assert out.dtype.kind == "u"
-        assert np.array_equal(arr, out)
+        assert np.array_equal(rgb, out)
 
-    def test_lossless_unsigned_u1(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(2, 9))
+    def test_lossless_unsigned_u1(self, bit_depth, random_image):
         """Test encoding unsigned data for bit-depth 1-8"""
         rows = 123
         cols = 234
-        for bit_depth in range(2, 9):
-            maximum = 2**bit_depth - 1
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype="u1")
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                False,
-                photometric_interpretation=PI.MONOCHROME2,
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, 3), dtype="u1"
-            )
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                3,
-                bit_depth,
-                False,
-                photometric_interpretation=PI.RGB,
-                use_mct=False,
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 3
-
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols), bit_depth, False, "<")
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            False,
+            photometric_interpretation=PI.MONOCHROME2,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, 4), dtype="u1"
-            )
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                4,
-                bit_depth,
-                False,
-                photometric_interpretation=5,
-                use_mct=False,
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 4
+        arr = random_image((rows, cols, 3), bit_depth, False, "<")
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            3,
+            bit_depth,
+            False,
+            photometric_interpretation=PI.RGB,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, 4), bit_depth, False, "<")
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            4,
+            bit_depth,
+            False,
+            photometric_interpretation=5,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_unsigned_u2(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(9, 17))
+    def test_lossless_unsigned_u2(self, bit_depth, random_image):
         """Test encoding unsigned data for bit-depth 9-16"""
-        jpg = DIR_15444 / "2KLS" / "693.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
-
         rows = 123
         cols = 234
-        for bit_depth in range(9, 17):
-            maximum = 2**bit_depth - 1
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype="u2")
-            if sys.byteorder == "big":
-                # I think randint() requires dtype use machine byte order
-                arr = arr.byteswap().view("<u2")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                False,
-                photometric_interpretation=PI.MONOCHROME2,
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 1
+        arr = random_image((rows, cols), bit_depth, False, "<")
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            False,
+            photometric_interpretation=PI.MONOCHROME2,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, 3), dtype="u2"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<u2")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                3,
-                bit_depth,
-                False,
-                photometric_interpretation=PI.RGB,
-                use_mct=False,
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 3
+        arr = random_image((rows, cols, 3), bit_depth, False, "<")
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            3,
+            bit_depth,
+            False,
+            photometric_interpretation=PI.RGB,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, 4), dtype="u2"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<u2")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                4,
-                bit_depth,
-                False,
-                photometric_interpretation=5,
-                use_mct=False,
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 4
+        arr = random_image((rows, cols, 4), bit_depth, False, "<")
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            4,
+            bit_depth,
+            False,
+            photometric_interpretation=5,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_unsigned_u4(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(17, 25))
+    def test_lossless_unsigned_u4(self, bit_depth, random_image):
         """Test encoding unsigned data for bit-depth 17-24"""
         rows = 123
         cols = 234
         planes = 3
-        for bit_depth in range(17, 25):
-            maximum = 2**bit_depth - 1
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype="u4")
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<u4")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                False,
-                photometric_interpretation=PI.MONOCHROME2,
-            )
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 1
+        arr = random_image((rows, cols), bit_depth, False, "<")
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                0, high=maximum + 1, size=(rows, cols, planes), dtype="u4"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<u4")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                3,
-                bit_depth,
-                False,
-                photometric_interpretation=PI.RGB,
-                use_mct=False,
-            )
-            out = decode(buffer)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            False,
+            photometric_interpretation=PI.MONOCHROME2,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 1
-            assert param["components"] == 3
+        arr = random_image((rows, cols, planes), bit_depth, False, "<")
 
-            assert out.dtype.kind == "u"
-            assert np.array_equal(arr, out)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            3,
+            bit_depth,
+            False,
+            photometric_interpretation=PI.RGB,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_signed_i1(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(2, 9))
+    def test_lossless_signed_i1(self, bit_depth, random_image):
         """Test encoding signed data for bit-depth 1-8"""
         rows = 123
         cols = 543
-        for bit_depth in range(2, 9):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype="i1"
-            )
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                True,
-                photometric_interpretation=PI.MONOCHROME2,
-            )
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols, 3), dtype="i1"
-            )
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                3,
-                bit_depth,
-                True,
-                photometric_interpretation=PI.RGB,
-                use_mct=False,
-            )
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 3
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols, 4), dtype="i1"
-            )
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                4,
-                bit_depth,
-                True,
-                photometric_interpretation=5,
-                use_mct=False,
-            )
-            out = decode(buffer)
+        arr = random_image((rows, cols), bit_depth, True, "<")
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            True,
+            photometric_interpretation=PI.MONOCHROME2,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 4
+        arr = random_image((rows, cols, 3), bit_depth, True, "<")
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            3,
+            bit_depth,
+            True,
+            photometric_interpretation=PI.RGB,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, 4), bit_depth, True, "<")
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            4,
+            bit_depth,
+            True,
+            photometric_interpretation=5,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_signed_i2(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(9, 17))
+    def test_lossless_signed_i2(self, bit_depth, random_image):
         """Test encoding signed data for bit-depth 9-16"""
         rows = 123
         cols = 543
-        for bit_depth in range(9, 17):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype="i2"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<i2")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                True,
-                photometric_interpretation=PI.MONOCHROME2,
-            )
-            out = decode(buffer)
+        arr = random_image((rows, cols), bit_depth, True, "<")
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols, 3), dtype="i2"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<i2")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                3,
-                bit_depth,
-                True,
-                photometric_interpretation=PI.RGB,
-                use_mct=False,
-            )
-            out = decode(buffer)
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 3
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            True,
+            photometric_interpretation=PI.MONOCHROME2,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
+        arr = random_image((rows, cols, 3), bit_depth, True, "<")
 
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols, 4), dtype="i2"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<i2")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                4,
-                bit_depth,
-                True,
-                photometric_interpretation=5,
-                use_mct=False,
-            )
-            out = decode(buffer)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            3,
+            bit_depth,
+            True,
+            photometric_interpretation=PI.RGB,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 4
+        arr = random_image((rows, cols, 4), bit_depth, True, "<")
 
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            4,
+            bit_depth,
+            True,
+            photometric_interpretation=5,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossless_signed_i4(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(17, 25))
+    def test_lossless_signed_i4(self, bit_depth, random_image):
         """Test encoding signed data for bit-depth 17-24"""
         rows = 123
         cols = 234
         planes = 3
-        for bit_depth in range(17, 25):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype="i4"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<i4")
+        arr = random_image((rows, cols), bit_depth, True, "<")
 
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                True,
-                photometric_interpretation=PI.MONOCHROME2,
-            )
-            out = decode(buffer)
-
-
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
-
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols, planes), dtype="i4"
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view("<i4")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                3,
-                bit_depth,
-                True,
-                photometric_interpretation=PI.RGB,
-                use_mct=False,
-            )
-            out = decode(buffer)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            True,
+            photometric_interpretation=PI.MONOCHROME2,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 1
-            assert param["components"] == 3
+        arr = random_image((rows, cols, planes), bit_depth, True, "<")
 
-            assert out.dtype.kind == "i"
-            assert np.array_equal(arr, out)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            3,
+            bit_depth,
+            True,
+            photometric_interpretation=PI.RGB,
+            use_mct=False,
+        )
+        check_encoded(arr, buffer, bit_depth)
 
-    def test_lossy_unsigned(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(2, 17))
+    def test_lossy_unsigned(self, bit_depth, random_image):
         """Test lossy encoding with unsigned data"""
         rows = 123
         cols = 234
-        for bit_depth in range(2, 17):
-            maximum = 2**bit_depth - 1
-            dtype = f"u{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(0, high=maximum + 1, size=(rows, cols), dtype=dtype)
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view(f"<{dtype}")
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                False,
-                compression_ratios=[4, 2, 1],
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 3
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "u"
-            assert np.allclose(arr, out, atol=5)
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                False,
-                signal_noise_ratios=[50, 100, 200],
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is False
-            assert param["layers"] == 3
-            assert param["components"] == 1
+        arr = random_image((rows, cols), bit_depth, False, "<")
 
-            assert out.dtype.kind == "u"
-            assert np.allclose(arr, out, atol=5)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            False,
+            compression_ratios=[4, 2, 1],
+        )
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-    def test_lossy_signed(self):
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            False,
+            signal_noise_ratios=[50, 100, 200],
+        )
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("bit_depth", range(2, 17))
+    def test_lossy_signed(self, bit_depth, random_image):
         """Test lossy encoding with unsigned data"""
         rows = 123
         cols = 234
-        for bit_depth in range(2, 17):
-            maximum = 2 ** (bit_depth - 1) - 1
-            minimum = -(2 ** (bit_depth - 1))
-            dtype = f"i{math.ceil(bit_depth / 8)}"
-            arr = np.random.randint(
-                low=minimum, high=maximum + 1, size=(rows, cols), dtype=dtype
-            )
-            if sys.byteorder == "big":
-                arr = arr.byteswap().view(f"<{dtype}")
+        arr = random_image((rows, cols), bit_depth, True, "<")
 
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                True,
-                compression_ratios=[4, 2, 1],
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 3
-            assert param["components"] == 1
-
-            assert out.dtype.kind == "i"
-            assert np.allclose(arr, out, atol=5)
-
-            buffer = encode_buffer(
-                arr.tobytes(),
-                cols,
-                rows,
-                1,
-                bit_depth,
-                True,
-                signal_noise_ratios=[50, 100, 200],
-            )
-            out = decode(buffer)
-            param = parse_j2k(buffer)
-            assert param["precision"] == bit_depth
-            assert param["is_signed"] is True
-            assert param["layers"] == 3
-            assert param["components"] == 1
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            True,
+            compression_ratios=[4, 2, 1],
+        )
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-            assert out.dtype.kind == "i"
-            assert np.allclose(arr, out, atol=5)
+        buffer = encode_buffer(
+            arr,
+            cols,
+            rows,
+            1,
+            bit_depth,
+            True,
+            signal_noise_ratios=[50, 100, 200],
+        )
+        check_encoded(arr, buffer, bit_depth, layers=3, atol=5)
 
-    def test_roundtrip_u1_ybr(self):
+    def test_roundtrip_u1_ybr(self, decoded_image):
         """Test a round trip for u1 YBR."""
-        jpg = DIR_15444 / "2KLS" / "oj36.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
+        arr = decoded_image("2KLS", "oj36.j2k")
         assert "uint8" == arr.dtype
         assert (256, 256, 3) == arr.shape
 
         # Test lossless
         result = encode_buffer(
-            arr.tobytes(),
+            arr,
             256,
             256,
             3,
@@ -1631,7 +1236,7 @@ class TestEncodeBuffer:
 
         # Test lossy
         result = encode_buffer(
-            arr.tobytes(),
+            arr,
             256,
             256,
             3,
@@ -1645,7 +1250,7 @@ class TestEncodeBuffer:
 
         # Test lossy
         result = encode_buffer(
-            arr.tobytes(),
+            arr,
             256,
             256,
             3,
@@ -1657,20 +1262,16 @@ class TestEncodeBuffer:
         out = decode(result)
         assert np.allclose(out, arr, atol=2)
 
-    def test_roundtrip_i2_mono(self):
+    def test_roundtrip_i2_mono(self, decoded_image):
         """Test a round trip for i2 YBR."""
 
-        jpg = DIR_15444 / "2KLS" / "693.j2k"
-        with open(jpg, "rb") as f:
-            data = f.read()
-
-        arr = decode(data)
+        arr = decoded_image("2KLS", "693.j2k")
         assert "<i2" == arr.dtype
         assert (512, 512) == arr.shape
 
         # Test lossless
         result = encode_buffer(
-            arr.tobytes(),
+            arr,
             512,
             512,
             1,
@@ -1683,7 +1284,7 @@ class TestEncodeBuffer:
 
         # Test lossy w/ compression ratios
         result = encode_buffer(
-            arr.tobytes(),
+            arr,
             512,
             512,
             1,
@@ -1697,7 +1298,7 @@ class TestEncodeBuffer:
 
         # Test lossy w/ signal-to-noise ratios
         result = encode_buffer(
-            arr.tobytes(),
+            arr,
             512,
             512,
             1,
@@ -1709,11 +1310,9 @@ class TestEncodeBuffer:
         out = decode(result)
         assert np.allclose(out, arr, atol=2)
 
-    def test_jp2(self):
+    def test_jp2(self, decoded_image):
         """Test using JP2 format"""
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            arr = decode(f.read())
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
 
         kwargs = {
             "rows": 480,
@@ -1725,223 +1324,158 @@ class TestEncodeBuffer:
             "codec_format": 1,
         }
 
-        buffer = encode_buffer(arr.tobytes(), **kwargs)
+        buffer = encode_buffer(arr, **kwargs)
         assert buffer.startswith(b"\x00\x00\x00\x0c\x6a\x50\x20\x20\x0d\x0a\x87\x0a")
 
 
 class TestEncodePixelData:
     """Tests for encode_pixel_data()"""
 
-    def test_nominal(self):
+    def test_nominal(self, decoded_image):
         """Test the function works OK"""
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            arr = decode(f.read())
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
 
-        kwargs = {
-            "rows": 480,
-            "columns": 640,
-            "samples_per_pixel": 3,
-            "pixel_representation": 0,
-            "bits_stored": 8,
-            "photometric_interpretation": "RGB",
-        }
-        buffer = encode_pixel_data(arr.tobytes(), **kwargs)
+        buffer = encode_pixel_data(arr, **BRETAGNE_KWARGS)
         assert np.array_equal(arr, decode(buffer))
 
-    def test_photometric_interpretation(self):
+    def test_photometric_interpretation(self, decoded_image):
         """Check photometric interpretation sets MCT correctly."""
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            arr = decode(f.read())
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
 
-        kwargs = {
-            "rows": 480,
-            "columns": 640,
-            "samples_per_pixel": 3,
-            "pixel_representation": 0,
-            "bits_stored": 8,
-        }
         for pi in ("YBR_ICT", "YBR_RCT"):
-            buffer = encode_pixel_data(
-                arr.tobytes(),
-                photometric_interpretation=pi,
-                **kwargs,
-            )
+            kwargs = {**BRETAGNE_KWARGS, "photometric_interpretation": pi}
+            buffer = encode_pixel_data(arr, **kwargs)
             param = parse_j2k(buffer)
-            assert param["mct"] is True
+            assert param.mct is True
 
         for pi in ("RGB", "YBR_FULL", "MONOCHROME1"):
-            buffer = encode_pixel_data(
-                arr.tobytes(),
-                photometric_interpretation=pi,
-                use_mct=True,
-                **kwargs,
-            )
+            kwargs = {**BRETAGNE_KWARGS, "photometric_interpretation": pi}
+            buffer = encode_pixel_data(arr, use_mct=True, **kwargs)
             param = parse_j2k(buffer)
-            assert param["mct"] is False
+            assert param.mct is False
 
-    def test_codec_format_ignored(self):
+    def test_codec_format_ignored(self, decoded_image):
         """Test that codec_format gets ignored."""
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            arr = decode(f.read())
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
 
-        kwargs = {
-            "rows": 480,
-            "columns": 640,
-            "samples_per_pixel": 3,
-            "pixel_representation": 0,
-            "photometric_interpretation": "RGB",
-            "bits_stored": 8,
-            "codec_format": 1,
-        }
-        buffer = encode_pixel_data(arr.tobytes(), **kwargs)
+        buffer = encode_pixel_data(arr, codec_format=1, **BRETAGNE_KWARGS)
         assert buffer.startswith(b"\xff\x4f\xff\x51")
 
-    def test_pixel_representation(self):
+    @pytest.mark.parametrize("pixel_representation", [0, 1])
+    def test_pixel_representation(self, pixel_representation, decoded_image):
         """Test pixel representation is applied correctly."""
-        jpg = DIR_15444 / "HTJ2K" / "Bretagne1_ht.j2k"
-        with open(jpg, "rb") as f:
-            arr = decode(f.read())
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
 
-        kwargs = {
-            "rows": 480,
-            "columns": 640,
-            "samples_per_pixel": 3,
-            "pixel_representation": 0,
-            "photometric_interpretation": "RGB",
-            "bits_stored": 8,
-        }
-        buffer = encode_pixel_data(arr.tobytes(), **kwargs)
+        kwargs = {**BRETAGNE_KWARGS, "pixel_representation": pixel_representation}
+        buffer = encode_pixel_data(arr, **kwargs)
         info = parse_j2k(buffer)
-        assert info["is_signed"] is False
+        assert info.is_signed is bool(pixel_representation)
 
-        kwargs["pixel_representation"] = 1
-        buffer = encode_pixel_data(arr.tobytes(), **kwargs)
-        info = parse_j2k(buffer)
-        assert info["is_signed"] is True
 
+class TestEncodePixelDataBatched:
+    """Tests for encode_pixel_data_batched()"""
 
-class TestGetBitsStored:
-    """Tests for _get_bits_stored()"""
+    def test_nominal(self, decoded_image):
+        """Test encoding multiple frames."""
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
+        frames = np.stack([arr, arr[::-1], arr[:, ::-1]])
 
-    def check_signed(self, nr_bits, minimin, minimax, maximax, maximin):
-        arr = np.asarray([minimin, minimax], dtype="<i2")
-        assert _get_bits_stored(arr) == nr_bits
-        arr = np.asarray([minimax - 1, minimax], dtype="<i2")
-        assert _get_bits_stored(arr) == nr_bits
-        arr = np.asarray([minimin, minimin + 1], dtype="<i2")
-        assert _get_bits_stored(arr) == nr_bits
-        arr = np.asarray([maximin, maximax], dtype="<i2")
-        assert _get_bits_stored(arr) == nr_bits
-        arr = np.asarray([0, maximax], dtype="<i2")
-        assert _get_bits_stored(arr) == nr_bits
-        arr = np.asarray([minimin, 0], dtype="<i2")
-        assert _get_bits_stored(arr) == nr_bits
+        buffers = encode_pixel_data_batched(frames, **BRETAGNE_KWARGS)
+        assert len(buffers) == 3
+        for frame, buffer in zip(frames, buffers):
+            assert buffer == encode_pixel_data(frame, **BRETAGNE_KWARGS)
+            assert np.array_equal(frame, decode(buffer))
 
-    def test_bool(self):
-        """Test bool input."""
-        arr = np.asarray([0, 0], dtype="bool")
-        assert _get_bits_stored(arr) == 1
-
-        arr = np.asarray([1, 1], dtype="bool")
-        assert _get_bits_stored(arr) == 1
-
-    def test_unsigned(self):
-        """Test unsigned integer input."""
-        arr = np.asarray([0, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 1
-        arr = np.asarray([1, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 1
-
-        arr = np.asarray([2, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 2
-        arr = np.asarray([3, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 2
-
-        arr = np.asarray([4, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 3
-        arr = np.asarray([7, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 3
-
-        arr = np.asarray([8, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 4
-        arr = np.asarray([15, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 4
-
-        arr = np.asarray([16, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 5
-        arr = np.asarray([31, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 5
-
-        arr = np.asarray([32, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 6
-        arr = np.asarray([63, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 6
-
-        arr = np.asarray([64, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 7
-        arr = np.asarray([127, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 7
-
-        arr = np.asarray([128, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 8
-        arr = np.asarray([255, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 8
-
-        arr = np.asarray([256, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 9
-        arr = np.asarray([511, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 9
-
-        arr = np.asarray([512, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 10
-        arr = np.asarray([1023, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 10
+    def test_frame_types(self, decoded_image):
+        """Test encoding an iterable of frames with different types."""
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
+        frames = [arr, arr.tobytes(), memoryview(arr)]
 
-        arr = np.asarray([1024, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 11
-        arr = np.asarray([2047, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 11
+        buffers = encode_pixel_data_batched(iter(frames), **BRETAGNE_KWARGS)
+        assert len(buffers) == 3
+        assert buffers[0] == buffers[1] == buffers[2]
 
-        arr = np.asarray([2048, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 12
-        arr = np.asarray([4095, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 12
+    def test_no_frames(self):
+        """Test no frames returns an empty list."""
+        assert encode_pixel_data_batched([], **BRETAGNE_KWARGS) == []
 
-        arr = np.asarray([4096, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 13
-        arr = np.asarray([8191, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 13
+    def test_single_codec_thread(self, decoded_image, monkeypatch):
+        """Test each frame is encoded using a single OpenJPEG thread."""
+        monkeypatch.setenv("PYLIBJPEG_OPENJPEG_THREADS", "2")
+        arr = decoded_image("HTJ2K", "Bretagne1_ht.j2k")
+        nr_threads = []
+        encode_buffer = _openjpeg.encode_buffer
 
-        arr = np.asarray([8192, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 14
-        arr = np.asarray([16383, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 14
+        def wrapper(*args):
+            nr_threads.append(args[-1])
+            return encode_buffer(*args)
 
-        arr = np.asarray([16384, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 15
-        arr = np.asarray([32767, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 15
+        monkeypatch.setattr(_openjpeg, "encode_buffer", wrapper)
+        encode_pixel_data_batched([arr, arr], **BRETAGNE_KWARGS)
+        assert nr_threads == [1, 1]
 
-        arr = np.asarray([32768, 0], dtype="<u2")
-        assert _get_bits_stored(arr) == 16
-        arr = np.asarray([65535, 0], dtype="<u2")
+
+class TestGetBitsStored:
+    """Tests for _get_bits_stored()"""
+
+    def test_bool(self):
+        """Test bool input."""
+        assert _get_bits_stored(np.zeros(2, dtype="bool")) == 1
+        assert _get_bits_stored(np.ones(2, dtype="bool")) == 1
+
+    @pytest.mark.parametrize("dtype", ["<u1", "<i1", "<u2", "<i2", "<u4", "<i4"])
+    def test_boundaries(self, dtype):
+        """Test the boundary values of every precision of `dtype`."""
+        pairs = boundary_pairs(dtype)
+        expected = expected_bits_stored(pairs)
+        assert set(expected) == set(range(1, pairs.dtype.itemsize * 8 + 1))
+
+        np.testing.assert_array_equal(_get_bits_stored(pairs, axis=-1), expected)
+        got = [_get_bits_stored(pair) for pair in pairs]
+        np.testing.assert_array_equal(got, expected)
+
+    def test_axis(self):
+        """Test returning the bits stored along an axis."""
+        arr = np.array([[0, 1], [2, 3], [0, 255], [256, 65535]], dtype="<u2")
+        assert _get_bits_stored(arr, axis=1).tolist() == [1, 2, 8, 16]
+        assert _get_bits_stored(arr, axis=0).tolist() == [9, 16]
+
+        arr = np.array([[0, -1], [-2, 1], [-129, 127]], dtype="<i2")
+        assert _get_bits_stored(arr, axis=-1).tolist() == [1, 2, 9]
+
+        arr = np.zeros((3, 2), dtype="bool")
+        assert _get_bits_stored(arr, axis=1).tolist() == [1, 1, 1]
+
+    def test_multiple_chunks(self):
+        """Test input larger than the chunk size used to find the range."""
+        arr = np.zeros((512, 512), dtype="<i2")
+        arr[-1, -1] = -1024
+        assert _get_bits_stored(arr) == 11
+        # Stop after the first chunk if the full dtype width is needed
+        arr[0, 0] = 32767
         assert _get_bits_stored(arr) == 16
 
-    def test_signed(self):
-        """Test signed integer input."""
-        arr = np.asarray([0, 0], dtype="<i2")
-        assert _get_bits_stored(arr) == 1
-        arr = np.asarray([-1, 0], dtype="<i2")
-        assert _get_bits_stored(arr) == 1
-
-        minimin, minimax = -2, 1
-        maximax, maximin = 1, -2
-        self.check_signed(2, minimin, minimax, maximax, maximin)
-
-        for ii in range(3, 17):
-            minimin, minimax = maximin - 1, maximax + 1
-            maximax, maximin = 2 ** (ii - 1) - 1, -(2 ** (ii - 1))
-            self.check_signed(ii, minimin, minimax, maximax, maximin)
+        arr = np.zeros((512, 512), dtype="<u2")
+        arr[-1, -1] = 1023
+        assert _get_bits_stored(arr) == 10
+        # Non-contiguous input
+        assert _get_bits_stored(arr[:, ::2]) == 1
+        assert _get_bits_stored(arr[:, 1::2]) == 10
+        assert _get_bits_stored(arr.T[::-1]) == 10
+        arr[0, 1] = 65535
+        assert _get_bits_stored(arr[:, 1::2]) == 16
+
+    def test_uniform(self):
+        """Test input with a single value."""
+        assert _get_bits_stored(np.zeros((512, 512), dtype="<u2")) == 1
+        assert _get_bits_stored(np.full((512, 512), 1023, dtype="<u2")) == 10
+        assert _get_bits_stored(np.full((512, 512), -1, dtype="<i2")) == 1
+        assert _get_bits_stored(np.asarray([1023], dtype="<u2")) == 10
+        assert _get_bits_stored(np.asarray([-1024], dtype="<i2")) == 11
+
+    def test_non_native(self):
+        """Test input the extension can't find the range of."""
+        arr = np.asarray([-1024, 0], dtype="=i2")
+        assert _get_bits_stored(arr.astype(">i2")) == 11
+        assert _get_bits_stored(arr.astype("<i2")) == 11
+        assert _get_bits_stored(arr.astype("i8")) == 11
@@ -1,10 +1,12 @@
 """Tests for the pylibjpeg pixel data handler."""
 
+import re
+
+import numpy as np
 import pytest
 
 try:
     from pydicom import __version__
-    from pydicom.encaps import generate_pixel_data_frame
     from pydicom.pixel_data_handlers.util import (
         reshape_pixel_array,
         pixel_dtype,
@@ -15,27 +17,54 @@ except ImportError:
     HAS_PYDICOM = False
 
 from openjpeg import get_parameters, decode_pixel_data
-from openjpeg.data import get_indexed_datasets
+from openjpeg.tests._frames import first_frame, indexed_datasets
+
+# The names of the transfer syntaxes that need a plugin other than this one
+MISSING_PLUGIN_NAMES = {
+    "1.2.840.10008.1.2.4.50": "JPEG Baseline (Process 1)",
+    "1.2.840.10008.1.2.4.51": "JPEG Extended (Process 2 and 4)",
+    "1.2.840.10008.1.2.4.57": "JPEG Lossless, Non-Hierarchical (Process 14)",
+    "1.2.840.10008.1.2.4.70": (
+        "JPEG Lossless, Non-Hierarchical, First-Order Prediction "
+        "(Process 14 [Selection Value 1])"
+    ),
+    "1.2.840.10008.1.2.4.80": "JPEG-LS Lossless Image Compression",
+    "1.2.840.10008.1.2.4.81": "JPEG-LS Lossy (Near-Lossless) Image Compression",
+}
+
+
+def missing_plugin_msg(name):
+    """Return the compiled error message for decoding without a plugin."""
+    if PYD_VERSION < 3:
+        return re.compile(
+            "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
+            "not installed"
+        )
+
+    return re.compile(
+        f"Unable to decompress '{re.escape(name)}' pixel data because all plugins "
+        "are missing dependencies:"
+    )
+
 
 if HAS_PYDICOM:
     PYD_VERSION = int(__version__.split(".")[0])
-
-
-def generate_frames(ds):
-    """Return a frame generator for DICOM datasets."""
-    nr_frames = ds.get("NumberOfFrames", 1)
-    return generate_pixel_data_frame(ds.PixelData, nr_frames)
+    # Compile the error messages once rather than in each test
+    MISSING_PLUGIN_MSGS = {
+        uid: missing_plugin_msg(name) for uid, name in MISSING_PLUGIN_NAMES.items()
+    }
 
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="pydicom unavailable")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.90")
 class TestHandler:
     """Tests for the pixel data handler."""
 
     def test_invalid_type_raises(self):
         """Test decoding using invalid type raises."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
-        ds = index["MR_small_jp2klossless.dcm"]["ds"]
-        frame = tuple(next(generate_frames(ds)))
+        frame = tuple(
+            first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        )
         assert not hasattr(frame, "tell") and not isinstance(frame, bytes)
 
         msg = "a bytes-like object is required, not 'tuple'"
@@ -43,15 +72,30 @@ class TestHandler:
             decode_pixel_data(frame)
 
     def test_no_dataset(self):
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
         ds = index["MR_small_jp2klossless.dcm"]["ds"]
-        frame = next(generate_frames(ds))
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
         arr = decode_pixel_data(frame)
         assert arr.flags.writeable
         assert "uint8" == arr.dtype
         length = ds.Rows * ds.Columns * ds.SamplesPerPixel * ds.BitsAllocated / 8
         assert (length,) == arr.shape
 
+    def test_kwargs_mismatch_warns(self):
+        """Test kwargs without a dataset are checked against the J2K data."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        kwargs = {"samples_per_pixel": 1, "bits_stored": 12, "pixel_representation": 1}
+        with pytest.warns(UserWarning, match="Bits Stored value '12'"):
+            decode_pixel_data(frame, **kwargs)
+
+    def test_kwargs_match_no_warning(self, recwarn):
+        """Test matching kwargs without a dataset don't warn."""
+        frame = first_frame("1.2.840.10008.1.2.4.90", "MR_small_jp2klossless.dcm")
+        kwargs = {"samples_per_pixel": 1, "bits_stored": 16, "pixel_representation": 1}
+        decode_pixel_data(frame, **kwargs)
+
+        assert 0 == len(recwarn)
+
 
 class HandlerTestBase:
     """Baseclass for handler tests."""
@@ -59,10 +103,11 @@ class HandlerTestBase:
     uid = None
 
     def setup_method(self):
-        self.ds = get_indexed_datasets(self.uid)
+        self.ds = indexed_datasets(self.uid)
 
     def plot(self, arr, index=None, cmap=None):
-        import matplotlib.pyplot as plt
+        # Only imported when plotting to keep it out of normal test runs
+        plt = pytest.importorskip("matplotlib.pyplot")
 
         if index is not None:
             if cmap:
@@ -79,12 +124,13 @@ class HandlerTestBase:
 
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.90")
 class TestLibrary:
     """Tests for libjpeg itself."""
 
     def test_non_conformant_raises(self):
         """Test that a non-conformant JPEG image raises an exception."""
-        ds_list = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        ds_list = indexed_datasets("1.2.840.10008.1.2.4.90")
         # Image has invalid Se value in the SOS marker segment
         item = ds_list["966.dcm"]
         assert 0xC000 == item["Status"][1]
@@ -94,7 +140,7 @@ class TestLibrary:
 
     def test_valid_no_warning(self, recwarn):
         """Test no warning issued when dataset matches JPEG data."""
-        index = get_indexed_datasets("1.2.840.10008.1.2.4.90")
+        index = indexed_datasets("1.2.840.10008.1.2.4.90")
         ds = index["966_fixed.dcm"]["ds"]
         ds.pixel_array
 
@@ -103,6 +149,7 @@ class TestLibrary:
 
 # ISO/IEC 10918 JPEG - Expected fail
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.50")
 class TestJPEGBaseline(HandlerTestBase):
     """Test the handler with ISO 10918 JPEG images.
 
@@ -121,22 +168,12 @@ class TestJPEGBaseline(HandlerTestBase):
         assert 8 == ds.BitsAllocated == ds.BitsStored
         assert 0 == ds.PixelRepresentation
 
-        if PYD_VERSION < 3:
-            msg = (
-                "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
-                "not installed"
-            )
-        else:
-            msg = (
-                r"Unable to decompress 'JPEG Baseline \(Process 1\)' pixel data because "
-                "all plugins are missing dependencies:"
-            )
-
-        with pytest.raises(RuntimeError, match=msg):
+        with pytest.raises(RuntimeError, match=MISSING_PLUGIN_MSGS[self.uid]):
             ds.pixel_array
 
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.51")
 class TestJPEGExtended(HandlerTestBase):
     """Test the handler with ISO 10918 JPEG images.
 
@@ -158,22 +195,12 @@ class TestJPEGExtended(HandlerTestBase):
         assert 10 == ds.BitsStored
         assert 0 == ds.PixelRepresentation
 
-        if PYD_VERSION < 3:
-            msg = (
-                "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
-                "not installed"
-            )
-        else:
-            msg = (
-                r"Unable to decompress 'JPEG Extended \(Process 2 and 4\)' pixel data because "
-                "all plugins are missing dependencies:"
-            )
-
-        with pytest.raises(RuntimeError, match=msg):
+        with pytest.raises(RuntimeError, match=MISSING_PLUGIN_MSGS[self.uid]):
             ds.pixel_array
 
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.57")
 class TestJPEGLossless(HandlerTestBase):
     """Test the handler with ISO 10918 JPEG images.
 
@@ -193,22 +220,12 @@ class TestJPEGLossless(HandlerTestBase):
         assert 12 == ds.BitsStored
         assert 0 == ds.PixelRepresentation
 
-        if PYD_VERSION < 3:
-            msg = (
-                "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
-                "not installed"
-            )
-        else:
-            msg = (
-                r"Unable to decompress 'JPEG Lossless, Non-Hierarchical \(Process "
-                r"14\)' pixel data because all plugins are missing dependencies:"
-            )
-
-        with pytest.raises(RuntimeError, match=msg):
+        with pytest.raises(RuntimeError, match=MISSING_PLUGIN_MSGS[self.uid]):
             ds.pixel_array
 
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.70")
 class TestJPEGLosslessSV1(HandlerTestBase):
     """Test the handler with ISO 10918 JPEG images.
 
@@ -229,24 +246,13 @@ class TestJPEGLosslessSV1(HandlerTestBase):
         assert 8 == ds.BitsStored
         assert 0 == ds.PixelRepresentation
 
-        if PYD_VERSION < 3:
-            msg = (
-                "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
-                "not installed"
-            )
-        else:
-            msg = (
-                "Unable to decompress 'JPEG Lossless, Non-Hierarchical, First-Order "
-                r"Prediction \(Process 14 \[Selection Value 1\]\)' "
-                "pixel data because all plugins are missing dependencies:"
-            )
-
-        with pytest.raises(RuntimeError, match=msg):
+        with pytest.raises(RuntimeError, match=MISSING_PLUGIN_MSGS[self.uid]):
             ds.pixel_array
 
 
 # ISO/IEC 14495 JPEG-LS - Expected fail
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.80")
 class TestJPEGLSLossless(HandlerTestBase):
     """Test the handler with ISO 14495 JPEG-LS images.
 
@@ -266,22 +272,12 @@ class TestJPEGLSLossless(HandlerTestBase):
         assert 16 == ds.BitsStored
         assert 1 == ds.PixelRepresentation
 
-        if PYD_VERSION < 3:
-            msg = (
-                "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
-                "not installed"
-            )
-        else:
-            msg = (
-                r"Unable to decompress 'JPEG-LS Lossless Image Compression' "
-                "pixel data because all plugins are missing dependencies:"
-            )
-
-        with pytest.raises(RuntimeError, match=msg):
+        with pytest.raises(RuntimeError, match=MISSING_PLUGIN_MSGS[self.uid]):
             ds.pixel_array
 
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.81")
 class TestJPEGLS(HandlerTestBase):
     """Test the handler with ISO 14495 JPEG-LS images.
 
@@ -301,23 +297,13 @@ class TestJPEGLS(HandlerTestBase):
         assert 16 == ds.BitsStored
         assert 1 == ds.PixelRepresentation
 
-        if PYD_VERSION < 3:
-            msg = (
-                "Unable to convert the Pixel Data as the 'pylibjpeg-libjpeg' plugin is "
-                "not installed"
-            )
-        else:
-            msg = (
-                r"Unable to decompress 'JPEG-LS Lossy \(Near-Lossless\) Image Compression' "
-                "pixel data because all plugins are missing dependencies:"
-            )
-
-        with pytest.raises(RuntimeError, match=msg):
+        with pytest.raises(RuntimeError, match=MISSING_PLUGIN_MSGS[self.uid]):
             ds.pixel_array
 
 
 # ISO/IEC 15444 JPEG 2000
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.90")
 class TestJPEG2000Lossless(HandlerTestBase):
     """Test the handler with ISO 15444 JPEG2000 images.
 
@@ -327,55 +313,20 @@ class TestJPEG2000Lossless(HandlerTestBase):
     uid = "1.2.840.10008.1.2.4.90"
 
     @pytest.mark.skip("No suitable dataset")
-    def test_1s_1f_i_08_08(self):
-        """Test 1 component, 1 frame, signed 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "int8" == arr.dtype
-        assert (ds.Rows, ds.Columns) == arr.shape
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_1s_1f_u_08_08(self):
-        """Test 1 component, 1 frame, unsigned 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 0 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "int8" == arr.dtype
-        assert (ds.Rows, ds.Columns) == arr.shape
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_1s_2f_i_08_08(self):
-        """Test 1 component, 2 frame, signed 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 2 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "int8" == arr.dtype
-        assert (ds.Rows, ds.Columns) == arr.shape
+    @pytest.mark.parametrize(
+        "case",
+        [
+            "1s_1f_i_08_08",  # 1 component, 1 frame, signed 8-bit
+            "1s_1f_u_08_08",  # 1 component, 1 frame, unsigned 8-bit
+            "1s_2f_i_08_08",  # 1 component, 2 frame, signed 8-bit
+            "3s_2f_i_08_08",  # 3 component, 2 frame, signed 8-bit
+            "1s_2f_i_16_16",  # 1 component, 2 frame, signed 16/16-bit
+            "3s_1f_i_16_16",  # 3 component, 1 frame, signed 16/16-bit
+            "3s_2f_i_16_16",  # 3 component, 2 frame, signed 16/16-bit
+        ],
+    )
+    def test_pending(self, case):
+        """Placeholder for the cases without a suitable dataset."""
 
     def test_3s_1f_u_08_08(self):
         """Test 3 component, 1 frame, unsigned 8-bit."""
@@ -394,45 +345,31 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns, ds.SamplesPerPixel) == arr.shape
 
         # Values checked against GDCM
-        assert [
-            [180, 26, 0],
-            [172, 15, 0],
-            [162, 9, 0],
-            [152, 4, 0],
-            [145, 0, 0],
-            [132, 0, 0],
-            [119, 0, 0],
-            [106, 0, 0],
-            [87, 0, 0],
-            [37, 0, 0],
-            [0, 0, 0],
-            [50, 0, 0],
-            [100, 0, 0],
-            [109, 0, 0],
-            [122, 0, 0],
-            [135, 0, 0],
-            [145, 0, 0],
-            [155, 5, 0],
-            [165, 11, 0],
-            [175, 17, 0],
-        ] == arr[175:195, 28, :].tolist()
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_3s_2f_i_08_08(self):
-        """Test 3 component, 2 frame, signed 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "RGB" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "uint8" == arr.dtype
-        assert (ds.Rows, ds.Columns, ds.SamplesPerPixel) == arr.shape
+        assert np.array_equal(
+            arr[175:195, 28, :],
+            [
+                [180, 26, 0],
+                [172, 15, 0],
+                [162, 9, 0],
+                [152, 4, 0],
+                [145, 0, 0],
+                [132, 0, 0],
+                [119, 0, 0],
+                [106, 0, 0],
+                [87, 0, 0],
+                [37, 0, 0],
+                [0, 0, 0],
+                [50, 0, 0],
+                [100, 0, 0],
+                [109, 0, 0],
+                [122, 0, 0],
+                [135, 0, 0],
+                [145, 0, 0],
+                [155, 5, 0],
+                [165, 11, 0],
+                [175, 17, 0],
+            ],
+        )
 
     def test_1s_1f_i_16_14(self):
         """Test 1 component, 1 frame, signed 16/14-bit."""
@@ -451,9 +388,10 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [1022, 1051, 1165, 1442, 1835, 2096, 2074, 1868, 1685, 1603] == arr[
-            290, 135:145
-        ].tolist()
+        assert np.array_equal(
+            arr[290, 135:145],
+            [1022, 1051, 1165, 1442, 1835, 2096, 2074, 1868, 1685, 1603],
+        )
         assert -2000 == arr[0, 0]
 
     def test_1s_1f_i_16_16(self):
@@ -473,9 +411,9 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [21, 287, 797, 863, 813, 428, 55, -7, 37, -22] == arr[
-            142, 260:270
-        ].tolist()
+        assert np.array_equal(
+            arr[142, 260:270], [21, 287, 797, 863, 813, 428, 55, -7, 37, -22]
+        )
 
     def test_1s_1f_u_16_12(self):
         """Test 1 component, 1 frame, unsigned 16/12-bit."""
@@ -494,9 +432,10 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [2719, 2678, 2684, 2719, 2882, 2963, 2981, 2949, 3049, 3145] == arr[
-            2417, 1223:1233
-        ].tolist()
+        assert np.array_equal(
+            arr[2417, 1223:1233],
+            [2719, 2678, 2684, 2719, 2882, 2963, 2981, 2949, 3049, 3145],
+        )
 
     def test_1s_1f_u_16_15(self):
         """Test 1 component, 1 frame, unsigned 16/15-bit."""
@@ -515,9 +454,10 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [21920, 22082, 22245, 22406, 22557, 22619, 22629, 22724, 22787] == arr[
-            45:54, 184
-        ].tolist()
+        assert np.array_equal(
+            arr[45:54, 184],
+            [21920, 22082, 22245, 22406, 22557, 22619, 22629, 22724, 22787],
+        )
 
     def test_1s_1f_u_16_16(self):
         """Test 1 component, 1 frame, unsigned 16/16-bit."""
@@ -536,9 +476,10 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [55680, 57220, 58518, 61083, 64624, 65535, 65535, 65535, 65535] == arr[
-            1402:1411, 1388
-        ].tolist()
+        assert np.array_equal(
+            arr[1402:1411, 1388],
+            [55680, 57220, 58518, 61083, 64624, 65535, 65535, 65535, 65535],
+        )
 
     def test_1s_10f_u_16_16(self):
         """Test 1 component, 10 frame, unsigned 16/16-bit."""
@@ -557,48 +498,12 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.NumberOfFrames, ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [290, 312, 345, 414, 379, 239, 119, 76, 80, 76] == arr[
-            0, 36, 41:51
-        ].tolist()
-        assert [87, 45, 193, 341, 307, 133, 54, 99, 113, 101] == arr[
-            9, 53:63, 57
-        ].tolist()
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_1s_2f_i_16_16(self):
-        """Test 1 component, 2 frame, signed 16/16-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 16 == ds.BitsAllocated
-        assert 16 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_3s_1f_i_16_16(self):
-        """Test 3 component, 1 frame, signed 16/16-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 16 == ds.BitsAllocated
-        assert 16 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_3s_2f_i_16_16(self):
-        """Test 3 component, 2 frame, signed 16/16-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 16 == ds.BitsAllocated
-        assert 16 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
+        assert np.array_equal(
+            arr[0, 36, 41:51], [290, 312, 345, 414, 379, 239, 119, 76, 80, 76]
+        )
+        assert np.array_equal(
+            arr[9, 53:63, 57], [87, 45, 193, 341, 307, 133, 54, 99, 113, 101]
+        )
 
     def test_jp2(self):
         """Test decoding a non-conformant Pixel Data with JP2 data."""
@@ -617,10 +522,10 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert (ds.Rows, ds.Columns, ds.SamplesPerPixel) == arr.shape
 
         # Values checked against GDCM
-        assert [255, 0, 0] == arr[54, 145, :].tolist()
-        assert [0, 255, 0] == arr[179, 85, :].tolist()
-        assert [0, 0, 255] == arr[275, 38, :].tolist()
-        assert [128, 128, 128] == arr[368, 376, :].tolist()
+        assert np.array_equal(arr[54, 145, :], [255, 0, 0])
+        assert np.array_equal(arr[179, 85, :], [0, 255, 0])
+        assert np.array_equal(arr[275, 38, :], [0, 0, 255])
+        assert np.array_equal(arr[368, 376, :], [128, 128, 128])
 
     def test_data_unsigned_pr_1(self):
         """Test unsigned JPEG data with Pixel Representation 1"""
@@ -633,13 +538,15 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert 16 == ds.BitsStored
         assert 1 == ds.PixelRepresentation
 
-        # Note: if PR is 1 but the JPEG data is unsigned then it should
-        #   probably be converted to signed using 2s complement
-        ds.pixel_array
-        frame = next(generate_frames(ds))
+        frame = first_frame(self.uid, "TOSHIBA_J2K_SIZ0_PixRep1.dcm")
         params = get_parameters(frame)
         assert params["is_signed"] is False
 
+        # Note: if PR is 1 but the JPEG data is unsigned then it should
+        #   probably be converted to signed using 2s complement
+        # Decode the already extracted frame the same way the handler does
+        decode_pixel_data(frame, ds)
+
         # self.plot(arr)
 
     def test_data_signed_pr_0(self):
@@ -653,15 +560,16 @@ class TestJPEG2000Lossless(HandlerTestBase):
         assert 16 == ds.BitsStored
         assert 0 == ds.PixelRepresentation
 
-        # Note: if PR is 0 but the JPEG data is signed then... ?
-        ds.pixel_array
-
-        frame = next(generate_frames(ds))
+        frame = first_frame(self.uid, "TOSHIBA_J2K_SIZ1_PixRep0.dcm")
         params = get_parameters(frame)
         assert params["is_signed"] is True
 
+        # Note: if PR is 0 but the JPEG data is signed then... ?
+        decode_pixel_data(frame, ds)
+
 
 @pytest.mark.skipif(not HAS_PYDICOM, reason="No dependencies")
+@pytest.mark.xdist_group(name="1.2.840.10008.1.2.4.91")
 class TestJPEG2000(HandlerTestBase):
     """Test the handler with ISO 15444 JPEG2000 images.
 
@@ -671,55 +579,20 @@ class TestJPEG2000(HandlerTestBase):
     uid = "1.2.840.10008.1.2.4.91"
 
     @pytest.mark.skip("No suitable dataset")
-    def test_1s_1f_i_08_08(self):
-        """Test 1 component, 1 frame, signed 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "int8" == arr.dtype
-        assert (ds.Rows, ds.Columns) == arr.shape
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_1s_1f_u_08_08(self):
-        """Test 1 component, 1 frame, unsigned 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 0 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "int8" == arr.dtype
-        assert (ds.Rows, ds.Columns) == arr.shape
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_1s_2f_i_08_08(self):
-        """Test 1 component, 2 frame, signed 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 2 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "int8" == arr.dtype
-        assert (ds.Rows, ds.Columns) == arr.shape
+    @pytest.mark.parametrize(
+        "case",
+        [
+            "1s_1f_i_08_08",  # 1 component, 1 frame, signed 8-bit
+            "1s_1f_u_08_08",  # 1 component, 1 frame, unsigned 8-bit
+            "1s_2f_i_08_08",  # 1 component, 2 frame, signed 8-bit
+            "3s_2f_i_08_08",  # 3 component, 2 frame, signed 8-bit
+            "1s_2f_i_16_16",  # 1 component, 2 frame, signed 16/16-bit
+            "3s_1f_i_16_16",  # 3 component, 1 frame, signed 16/16-bit
+            "3s_2f_i_16_16",  # 3 component, 2 frame, signed 16/16-bit
+        ],
+    )
+    def test_pending(self, case):
+        """Placeholder for the cases without a suitable dataset."""
 
     def test_3s_1f_u_08_08(self):
         """Test 3 component, 1 frame, unsigned 8-bit."""
@@ -737,33 +610,20 @@ class TestJPEG2000(HandlerTestBase):
         assert "uint8" == arr.dtype
         assert (ds.Rows, ds.Columns, ds.SamplesPerPixel) == arr.shape
 
-        assert [255, 0, 0] == arr[5, 0].tolist()
-        assert [255, 128, 128] == arr[15, 0].tolist()
-        assert [0, 255, 0] == arr[25, 0].tolist()
-        assert [128, 255, 128] == arr[35, 0].tolist()
-        assert [0, 0, 255] == arr[45, 0].tolist()
-        assert [128, 128, 255] == arr[55, 0].tolist()
-        assert [0, 0, 0] == arr[65, 0].tolist()
-        assert [64, 64, 64] == arr[75, 0].tolist()
-        assert [192, 192, 192] == arr[85, 0].tolist()
-        assert [255, 255, 255] == arr[95, 0].tolist()
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_3s_2f_i_08_08(self):
-        """Test 3 component, 2 frame, signed 8-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "RGB" in ds.PhotometricInterpretation
-        assert 8 == ds.BitsAllocated
-        assert 8 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-        arr = ds.pixel_array
-        assert arr.flags.writeable
-        assert "uint8" == arr.dtype
-        assert (ds.Rows, ds.Columns, ds.SamplesPerPixel) == arr.shape
+        # The first pixel of every 10th row, starting at row 5
+        expected = [
+            [255, 0, 0],
+            [255, 128, 128],
+            [0, 255, 0],
+            [128, 255, 128],
+            [0, 0, 255],
+            [128, 128, 255],
+            [0, 0, 0],
+            [64, 64, 64],
+            [192, 192, 192],
+            [255, 255, 255],
+        ]
+        assert np.array_equal(arr[5:100:10, 0], expected)
 
     @pytest.mark.skip("No suitable dataset")
     def test_1s_1f_i_16_14(self):
@@ -799,9 +659,10 @@ class TestJPEG2000(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [812, 894, 1179, 1465, 1751, 2037, 1939, 1841, 1743, 1645] == arr[
-            290, 135:145
-        ].tolist()
+        assert np.array_equal(
+            arr[290, 135:145],
+            [812, 894, 1179, 1465, 1751, 2037, 1939, 1841, 1743, 1645],
+        )
         assert -2016 == arr[0, 0]
 
     def test_1s_1f_u_16_12(self):
@@ -821,7 +682,7 @@ class TestJPEG2000(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [27, 31, 32, 25, 17, 7, 6, 36, 63, 39] == arr[770:780, 136].tolist()
+        assert np.array_equal(arr[770:780, 136], [27, 31, 32, 25, 17, 7, 6, 36, 63, 39])
 
     def test_1s_1f_u_16_15(self):
         """Test 1 component, 1 frame, unsigned 16/15-bit."""
@@ -840,9 +701,10 @@ class TestJPEG2000(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [24291, 24345, 24401, 24455, 24508, 24559, 24604, 24647, 24687] == arr[
-            175:184, 28
-        ].tolist()
+        assert np.array_equal(
+            arr[175:184, 28],
+            [24291, 24345, 24401, 24455, 24508, 24559, 24604, 24647, 24687],
+        )
 
     def test_1s_1f_u_16_16(self):
         """Test 1 component, 1 frame, unsigned 16/16-bit."""
@@ -861,9 +723,10 @@ class TestJPEG2000(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [1090, 1114, 1135, 1123, 1100, 1100, 1086, 1093, 1128, 1141] == arr[
-            107, 66:76
-        ].tolist()
+        assert np.array_equal(
+            arr[107, 66:76],
+            [1090, 1114, 1135, 1123, 1100, 1100, 1086, 1093, 1128, 1141],
+        )
 
     @pytest.mark.skip("No suitable dataset")
     def test_1s_10f_u_16_16(self):
@@ -882,42 +745,6 @@ class TestJPEG2000(HandlerTestBase):
         assert "<u2" == arr.dtype
         assert (ds.NumberOfFrames, ds.Rows, ds.Columns) == arr.shape
 
-    @pytest.mark.skip("No suitable dataset")
-    def test_1s_2f_i_16_16(self):
-        """Test 1 component, 2 frame, signed 16/16-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 16 == ds.BitsAllocated
-        assert 16 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_3s_1f_i_16_16(self):
-        """Test 3 component, 1 frame, signed 16/16-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 16 == ds.BitsAllocated
-        assert 16 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
-    @pytest.mark.skip("No suitable dataset")
-    def test_3s_2f_i_16_16(self):
-        """Test 3 component, 2 frame, signed 16/16-bit."""
-        ds = self.ds[".dcm"]["ds"]
-        assert self.uid == ds.file_meta.TransferSyntaxUID
-        assert 1 == ds.SamplesPerPixel
-        assert 1 == getattr(ds, "NumberOfFrames", 1)
-        assert "MONOCHROME" in ds.PhotometricInterpretation
-        assert 16 == ds.BitsAllocated
-        assert 16 == ds.BitsStored
-        assert 1 == ds.PixelRepresentation
-
     def test_jp2(self):
         """Test decoding a non-conformant Pixel Data with JP2 data."""
         ds = self.ds["MAROTECH_CT_JP2Lossy.dcm"]["ds"]
@@ -935,6 +762,6 @@ class TestJPEG2000(HandlerTestBase):
         assert (ds.Rows, ds.Columns) == arr.shape
 
         # Values checked against GDCM
-        assert [939, 698, 988, 1074, 1029, 1218, 1471, 873, 647, 864] == arr[
-            191, 136:146
-        ].tolist()
+        assert np.array_equal(
+            arr[191, 136:146], [939, 698, 988, 1074, 1029, 1218, 1471, 873, 647, 864]
+        )
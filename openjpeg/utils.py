@@ -1,10 +1,25 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import IntEnum
-from io import BytesIO
+from functools import lru_cache, partial
+from itertools import chain
 import logging
-from math import ceil, log
 import os
 from pathlib import Path
-from typing import BinaryIO, Tuple, Union, TYPE_CHECKING, Any, Dict, cast, List
+from typing import (
+    BinaryIO,
+    Deque,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    cast,
+    List,
+    Iterator,
+    Iterable,
+    Sequence,
+)
 import warnings
 
 import numpy as np
@@ -50,6 +65,8 @@ DECODING_ERRORS = {
     6: "failed to decode image",
     7: "support for more than 32-bits per component is not implemented",
     8: "failed to upscale subsampled components",
+    9: "reducing the resolution of subsampled components is not supported",
+    10: "the decoded image is larger than the output buffer",
 }
 ENCODING_ERRORS = {
     # Validation errors
@@ -99,18 +116,39 @@ ENCODING_ERRORS = {
     53: "the value of the 'columns' is invalid, must be in [1, 65535]",
     54: "the value of the 'is_signed' is invalid, must be 0 or 1",
     55: "the length of 'src' doesn't match the expected length",
+    56: "unable to get a C-contiguous buffer from 'src'",
 }
 
 
-def _get_format(stream: BinaryIO) -> int:
+# The dtype of the decoded data, keyed by (bytes per pixel, is signed), 24-bit
+#   components are decoded to 32-bit
+_DECODED_DTYPES = {
+    (1, False): np.dtype("u1"),
+    (1, True): np.dtype("i1"),
+    (2, False): np.dtype("<u2"),
+    (2, True): np.dtype("<i2"),
+    (3, False): np.dtype("<u4"),
+    (3, True): np.dtype("<i4"),
+    (4, False): np.dtype("<u4"),
+    (4, True): np.dtype("<i4"),
+}
+
+
+# The number of elements per chunk when finding the range of an array
+_RANGE_CHUNK_SIZE = 2**16
+
+
+def _get_format(
+    stream: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO],
+) -> int:
     """Return the JPEG 2000 format for the encoded data in `stream`.
 
     Parameters
     ----------
-    stream : file-like
-        A Python object containing the encoded JPEG 2000 data. If not
-        :class:`bytes` then the object must have ``tell()``, ``seek()`` and
-        ``read()`` methods.
+    stream : str | pathlib.Path | bytes | bytearray | memoryview | file-like
+        The path to the JPEG 2000 file or a Python object containing the
+        encoded JPEG 2000 data. If not a path or bytes-like then the object
+        must have ``tell()``, ``seek()`` and ``read()`` methods.
 
     Returns
     -------
@@ -125,22 +163,63 @@ def _get_format(stream: BinaryIO) -> int:
     ValueError
         If no matching JPEG 2000 file format found for the data.
     """
-    data = stream.read(20)
-    stream.seek(0)
+    # The longest magic number is 12 bytes
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        data = bytes(stream[:12])
+    elif isinstance(stream, (str, Path)):
+        with open(stream, "rb") as f:
+            data = f.read(12)
+    else:
+        data = stream.read(12)
+        stream.seek(-len(data), os.SEEK_CUR)
 
-    try:
-        return MAGIC_NUMBERS[data[:4]]
-    except KeyError:
-        pass
+    for magic_number, j2k_format in MAGIC_NUMBERS.items():
+        if data.startswith(magic_number):
+            return j2k_format
+
+    raise ValueError("No matching JPEG 2000 format found")
+
+
+def _get_stream(
+    stream: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO],
+) -> Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]:
+    """Return `stream` as an object the decoder can read the J2K data from.
+
+    Parameters
+    ----------
+    stream : str, pathlib.Path, bytes, bytearray, memoryview or file-like
+        The path to the JPEG 2000 file or a Python object containing the
+        encoded JPEG 2000 data.
+
+    Returns
+    -------
+    str | pathlib.Path | bytes | bytearray | memoryview | file-like
+        The path or the encoded data, paths and bytes-like are read directly
+        by the decoder without copying.
+
+    Raises
+    ------
+    TypeError
+        If `stream` isn't bytes-like and doesn't have ``read()``, ``tell()``
+        and ``seek()`` methods.
+    """
+    # Paths are passed to OpenJPEG rather than being read into memory
+    if isinstance(stream, (str, Path, bytes, bytearray, memoryview)):
+        return stream
 
+    # BinaryIO
     try:
-        return MAGIC_NUMBERS[data[:12]]
-    except KeyError:
-        pass
+        stream.read, stream.tell, stream.seek
+    except AttributeError:
+        raise TypeError(
+            "The Python object containing the encoded JPEG 2000 data must "
+            "either be bytes or have read(), tell() and seek() methods."
+        )
 
-    raise ValueError("No matching JPEG 2000 format found")
+    return cast(BinaryIO, stream)
 
 
+@lru_cache(maxsize=1)
 def get_openjpeg_version() -> Tuple[int, ...]:
     """Return the openjpeg version as tuple of int."""
     version = _openjpeg.get_version().decode("ascii").split(".")
@@ -148,9 +227,12 @@ def get_openjpeg_version() -> Tuple[int, ...]:
 
 
 def decode(
-    stream: Union[str, os.PathLike, bytes, bytearray, BinaryIO],
+    stream: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO],
     j2k_format: Union[int, None] = None,
     reshape: bool = True,
+    reduce: int = 0,
+    decode_area: Union[Tuple[int, int, int, int], None] = None,
+    out: Union[np.ndarray, None] = None,
 ) -> np.ndarray:
     """Return the decoded JPEG2000 data from `stream` as a :class:`numpy.ndarray`.
 
@@ -158,9 +240,14 @@ def decode(
 
         `stream` can now also be :class:`str` or :class:`pathlib.Path`
 
+    .. versionchanged:: 2.5
+
+        `stream` can now also be :class:`memoryview`, added the `reduce`,
+        `decode_area` and `out` keyword parameters
+
     Parameters
     ----------
-    stream : str, pathlib.Path, bytes, bytearray or file-like
+    stream : str, pathlib.Path, bytes, bytearray, memoryview or file-like
         The path to the JPEG 2000 file or a Python object containing the
         encoded JPEG 2000 data. If using a file-like then the object must have
         ``tell()``, ``seek()`` and ``read()`` methods.
@@ -173,6 +260,24 @@ def decode(
     reshape : bool, optional
         Reshape and re-view the output array so it matches the image data
         (default), otherwise return a 1D array of ``np.uint8``.
+    reduce : int, optional
+        The number of highest resolution levels to discard when decoding, each
+        level halves the number of rows and columns of the output (default
+        ``0``). Not supported for images with subsampled components.
+    decode_area : tuple[int, int, int, int], optional
+        The ``(x0, y0, x1, y1)`` area of the full resolution image to decode,
+        where (`x0`, `y0`) is the top left corner (inclusive) and (`x1`, `y1`)
+        the bottom right corner (exclusive). Only the parts of the codestream
+        needed for the area are decoded, which is much faster and uses much
+        less memory than decoding the entire image for large images. The
+        shape of the output matches the area (default: the entire image).
+    out : numpy.ndarray, optional
+        A writeable, C-contiguous array to write the decoded image data to
+        rather than allocating a new array, such as one frame of a
+        preallocated multi-frame array. Must have the same number of bytes
+        as the decoded image data, which is written as little endian, and
+        should have the matching shape and dtype. If used then `reshape` is
+        ignored and `out` is returned.
 
     Returns
     -------
@@ -183,22 +288,10 @@ def decode(
     ------
     RuntimeError
         If the decoding failed.
+    ValueError
+        If `reduce`, `decode_area` or `out` are invalid.
     """
-    if isinstance(stream, (str, Path)):
-        with open(stream, "rb") as f:
-            buffer: BinaryIO = BytesIO(f.read())
-            buffer.seek(0)
-    elif isinstance(stream, (bytes, bytearray)):
-        buffer = BytesIO(stream)
-    else:
-        # BinaryIO
-        required_methods = ["read", "tell", "seek"]
-        if not all([hasattr(stream, meth) for meth in required_methods]):
-            raise TypeError(
-                "The Python object containing the encoded JPEG 2000 data must "
-                "either be bytes or have read(), tell() and seek() methods."
-            )
-        buffer = cast(BinaryIO, stream)
+    buffer = _get_stream(stream)
 
     if j2k_format is None:
         j2k_format = _get_format(buffer)
@@ -206,26 +299,29 @@ def decode(
     if j2k_format not in [0, 1, 2]:
         raise ValueError(f"Unsupported 'j2k_format' value: {j2k_format}")
 
-    return_code, arr = _openjpeg.decode(buffer, j2k_format, as_array=True)
+    return_code, arr, meta = _openjpeg.decode(
+        buffer,
+        j2k_format,
+        as_array=True,
+        reduce=reduce,
+        decode_area=decode_area,
+        out=out,
+    )
     if return_code != 0:
         raise RuntimeError(
             f"Error decoding the J2K data: {DECODING_ERRORS.get(return_code, return_code)}"
         )
 
-    if not reshape:
+    if out is not None or not reshape:
         return cast(np.ndarray, arr)
 
-    meta = get_parameters(buffer, j2k_format)
     precision = cast(int, meta["precision"])
     rows = cast(int, meta["rows"])
     columns = cast(int, meta["columns"])
     pixels_per_sample = cast(int, meta["samples_per_pixel"])
     pixel_representation = cast(bool, meta["is_signed"])
-    bpp = ceil(precision / 8)
-
-    bpp = 4 if bpp == 3 else bpp
-    dtype = f"<u{bpp}" if not pixel_representation else f"<i{bpp}"
-    arr = arr.view(dtype)
+    bpp = (precision + 7) >> 3
+    arr = arr.view(_DECODED_DTYPES[bpp, pixel_representation])
 
     shape = [rows, columns]
     if pixels_per_sample > 1:
@@ -234,6 +330,159 @@ def decode(
     return cast(np.ndarray, arr.reshape(*shape))
 
 
+def _check_parameters(
+    meta: Dict[str, Union[int, str, bool]],
+    ds: Union["Dataset", Dict[str, Any], None] = None,
+    **kwargs: Any,
+) -> None:
+    """Warn if the J2K image parameters don't match the dataset.
+
+    Parameters
+    ----------
+    meta : dict
+        The J2K image parameters, as from :func:`~openjpeg.utils.get_parameters`.
+    ds : pydicom.dataset.Dataset, optional
+        A :class:`~pydicom.dataset.Dataset` containing the group ``0x0028``
+        elements corresponding to the *Pixel data*.
+    **kwargs
+        The *Samples per Pixel*, *Bits Stored* and *Pixel Representation*
+        values to use if not in `ds`, see
+        :func:`~openjpeg.utils.decode_pixel_data`.
+    """
+    samples_per_pixel = kwargs.get("samples_per_pixel")
+    bits_stored = kwargs.get("bits_stored")
+    pixel_representation = kwargs.get("pixel_representation")
+    no_kwargs = None in (samples_per_pixel, bits_stored, pixel_representation)
+
+    if not ds and no_kwargs:
+        return
+
+    if ds:
+        ds = cast("Dataset", ds)
+        samples_per_pixel = ds.get("SamplesPerPixel", samples_per_pixel)
+        bits_stored = ds.get("BitsStored", bits_stored)
+        pixel_representation = ds.get("PixelRepresentation", pixel_representation)
+
+    if samples_per_pixel != meta["samples_per_pixel"]:
+        warnings.warn(
+            f"The (0028,0002) Samples per Pixel value '{samples_per_pixel}' "
+            f"in the dataset does not match the number of components "
+            f"'{meta['samples_per_pixel']}' found in the JPEG 2000 data. "
+            f"It's recommended that you change the  Samples per Pixel value "
+            f"to produce the correct output"
+        )
+
+    if bits_stored != meta["precision"]:
+        warnings.warn(
+            f"The (0028,0101) Bits Stored value '{bits_stored}' in the "
+            f"dataset does not match the component precision value "
+            f"'{meta['precision']}' found in the JPEG 2000 data. "
+            f"It's recommended that you change the Bits Stored value to "
+            f"produce the correct output"
+        )
+
+    if bool(pixel_representation) != meta["is_signed"]:
+        val = "signed" if meta["is_signed"] else "unsigned"
+        ds_val = "signed" if bool(pixel_representation) else "unsigned"
+        ds_val = f"'{pixel_representation}' ({ds_val})"
+        warnings.warn(
+            f"The (0028,0103) Pixel Representation value {ds_val} in the "
+            f"dataset does not match the format of the values found in the "
+            f"JPEG 2000 data '{val}'"
+        )
+
+
+def _check_frame(
+    meta: Dict[str, Union[int, str, bool]],
+    expected: Dict[str, Union[int, str, bool]],
+    index: int,
+) -> None:
+    """Raise if the J2K image parameters of a frame don't match the first frame.
+
+    Parameters
+    ----------
+    meta : dict
+        The J2K image parameters of the frame.
+    expected : dict
+        The J2K image parameters of the first frame.
+    index : int
+        The index of the frame, used in the exception message.
+    """
+    for key in ("rows", "columns", "samples_per_pixel", "precision", "is_signed"):
+        if meta[key] != expected[key]:
+            raise ValueError(
+                f"The '{key}' value '{meta[key]}' of frame {index} doesn't match "
+                f"the value '{expected[key]}' of the first frame"
+            )
+
+
+def _check_frame_type(src: Any) -> None:
+    """Raise a TypeError if the *Pixel Data* frame `src` isn't bytes-like."""
+    if not isinstance(src, (bytes, bytearray, memoryview)):
+        raise TypeError(f"a bytes-like object is required, not '{type(src).__name__}'")
+
+
+def _get_frame_format(src: Union[bytes, bytearray, memoryview], version: int) -> int:
+    """Return the J2K format of the *Pixel Data* frame `src`.
+
+    Warns if the frame uses the JP2 format and `version` is ``1``.
+    """
+    _check_frame_type(src)
+
+    j2k_format = _get_format(src)
+    if version == Version.v1 and j2k_format != 0:
+        warnings.warn(
+            "The (7FE0,0010) Pixel Data contains a JPEG 2000 codestream "
+            "with the optional JP2 file format header, which is "
+            "non-conformant to the DICOM Standard (Part 5, Annex A.4.4)"
+        )
+
+    return j2k_format
+
+
+def _get_first_frame_parameters(
+    src: Union[bytes, bytearray, memoryview],
+    ds: Union["Dataset", Dict[str, Any], None],
+    version: int,
+    **kwargs: Any,
+) -> Tuple[int, Dict[str, Union[int, str, bool]]]:
+    """Return the J2K format and image parameters for the first of the frames.
+
+    The parameters are checked against `ds` or `kwargs` if `version` is ``1``,
+    and every other frame is checked against them using :func:`_check_frame`.
+    """
+    j2k_format = _get_frame_format(src, version)
+    meta = _openjpeg.get_parameters(src, j2k_format)
+    if version == Version.v1:
+        _check_parameters(meta, ds, **kwargs)
+
+    return j2k_format, meta
+
+
+def _decode_frame(
+    src: Union[bytes, bytearray, memoryview],
+    j2k_format: int,
+    version: int = Version.v1,
+    out: Union[np.ndarray, None] = None,
+) -> Tuple[Union[np.ndarray, bytearray], Dict[str, Union[int, str, bool]]]:
+    """Return the decoded *Pixel Data* frame `src` and its J2K image parameters.
+
+    Decodes to a 1D :class:`numpy.ndarray` of ``np.uint8`` (or `out`) if
+    `version` is ``1``, otherwise to a :class:`bytearray`.
+    """
+    _check_frame_type(src)
+
+    return_code, arr, meta = _openjpeg.decode(
+        src, j2k_format, as_array=version == Version.v1, out=out
+    )
+    if return_code != 0:
+        raise RuntimeError(
+            f"Error decoding the J2K data: {DECODING_ERRORS.get(return_code, return_code)}"
+        )
+
+    return arr, meta
+
+
 def decode_pixel_data(
     src: Union[bytes, bytearray],
     ds: Union["Dataset", Dict[str, Any], None] = None,
@@ -266,83 +515,170 @@ def decode_pixel_data(
 
     Raises
     ------
+    TypeError
+        If `src` is not bytes-like.
     RuntimeError
         If the decoding failed.
     """
-    buffer = BytesIO(src)
-    j2k_format = _get_format(buffer)
-
-    # Version 1
+    j2k_format = _get_frame_format(src, version)
+    arr, meta = _decode_frame(src, j2k_format, version)
     if version == Version.v1:
-        if j2k_format != 0:
-            warnings.warn(
-                "The (7FE0,0010) Pixel Data contains a JPEG 2000 codestream "
-                "with the optional JP2 file format header, which is "
-                "non-conformant to the DICOM Standard (Part 5, Annex A.4.4)"
-            )
+        _check_parameters(meta, ds, **kwargs)
 
-        return_code, arr = _openjpeg.decode(buffer, j2k_format, as_array=True)
-        if return_code != 0:
-            raise RuntimeError(
-                f"Error decoding the J2K data: {DECODING_ERRORS.get(return_code, return_code)}"
-            )
+    return arr
 
-        samples_per_pixel = kwargs.get("samples_per_pixel")
-        bits_stored = kwargs.get("bits_stored")
-        pixel_representation = kwargs.get("pixel_representation")
-        no_kwargs = None in (samples_per_pixel, bits_stored, pixel_representation)
 
-        if not ds and no_kwargs:
-            return cast(np.ndarray, arr)
+def decode_pixel_data_iter(
+    frames: Iterable[Union[bytes, bytearray, memoryview]],
+    ds: Union["Dataset", Dict[str, Any], None] = None,
+    version: int = Version.v1,
+    **kwargs: Any,
+) -> Iterator[Union[np.ndarray, bytearray]]:
+    """Yield the decoded JPEG 2000 `frames`.
 
-        ds = cast("Dataset", ds)
-        samples_per_pixel = ds.get("SamplesPerPixel", samples_per_pixel)
-        bits_stored = ds.get("BitsStored", bits_stored)
-        pixel_representation = ds.get("PixelRepresentation", pixel_representation)
+    .. versionadded:: 2.5
 
-        meta = get_parameters(buffer, j2k_format)
-        if samples_per_pixel != meta["samples_per_pixel"]:
-            warnings.warn(
-                f"The (0028,0002) Samples per Pixel value '{samples_per_pixel}' "
-                f"in the dataset does not match the number of components "
-                f"'{meta['samples_per_pixel']}' found in the JPEG 2000 data. "
-                f"It's recommended that you change the  Samples per Pixel value "
-                f"to produce the correct output"
-            )
+    Frames are taken from `frames` while the earlier frames are still being
+    decoded by a pool of threads, one per CPU by default, which can be changed
+    with the ``PYLIBJPEG_OPENJPEG_THREADS`` environment variable. Reading the
+    encoded data, such as from slow storage, overlaps with decoding and at
+    most one frame per thread is read ahead of the frame being yielded. Use
+    ``list(decode_pixel_data_iter(frames))`` to get a list of every frame.
 
-        if bits_stored != meta["precision"]:
-            warnings.warn(
-                f"The (0028,0101) Bits Stored value '{bits_stored}' in the "
-                f"dataset does not match the component precision value "
-                f"'{meta['precision']}' found in the JPEG 2000 data. "
-                f"It's recommended that you change the Bits Stored value to "
-                f"produce the correct output"
-            )
+    Every frame must have the same JPEG 2000 format and image parameters, as
+    required for the frames of DICOM *Pixel Data*.
 
-        if bool(pixel_representation) != meta["is_signed"]:
-            val = "signed" if meta["is_signed"] else "unsigned"
-            ds_val = "signed" if bool(pixel_representation) else "unsigned"
-            ds_val = f"'{pixel_representation}' ({ds_val})"
-            warnings.warn(
-                f"The (0028,0103) Pixel Representation value {ds_val} in the "
-                f"dataset does not match the format of the values found in the "
-                f"JPEG 2000 data '{val}'"
-            )
+    Parameters
+    ----------
+    frames : Iterable[bytes | bytearray | memoryview]
+        The encoded JPEG 2000 data for each frame, such as from
+        :func:`~pydicom.encaps.generate_frames`.
+    ds : pydicom.dataset.Dataset, optional
+        A :class:`~pydicom.dataset.Dataset` containing the group ``0x0028``
+        elements corresponding to the *Pixel data*, see
+        :func:`~openjpeg.utils.decode_pixel_data`.
+    version : int, optional
 
-        return cast(np.ndarray, arr)
+        * If ``1`` (default) then yield each frame as an :class:`numpy.ndarray`
+        * If ``2`` then yield each frame as :class:`bytearray`
+    **kwargs
+        The keyword arguments to use when decoding every frame, see
+        :func:`~openjpeg.utils.decode_pixel_data`.
 
-    # Version 2
-    return_code, buffer = _openjpeg.decode(buffer, j2k_format, as_array=False)
-    if return_code != 0:
-        raise RuntimeError(
-            f"Error decoding the J2K data: {DECODING_ERRORS.get(return_code, return_code)}"
-        )
+    Yields
+    ------
+    bytearray | numpy.ndarray
+        The image data for each frame, in the same order as `frames`.
+
+    Raises
+    ------
+    RuntimeError
+        If decoding any of the frames failed.
+    ValueError
+        If the image parameters of a frame don't match those of the first
+        frame.
+    """
+    frames = iter(frames)
+    first = next(frames, None)
+    if first is None:
+        return
+
+    j2k_format, expected = _get_first_frame_parameters(first, ds, version, **kwargs)
+
+    def _result(idx: int, future: Future) -> Union[np.ndarray, bytearray]:
+        arr, meta = future.result()
+        _check_frame(meta, expected, idx)
+        return cast(Union[np.ndarray, bytearray], arr)
+
+    # Decoding bytes-like data doesn't hold the GIL, so the frames can be
+    #   decoded in parallel
+    func = partial(_decode_frame, j2k_format=j2k_format, version=version)
+    nr_threads = _openjpeg._get_nr_threads(os.cpu_count() or 1)
+    pending: Deque[Future] = deque()
+    idx = 0
+    with ThreadPoolExecutor(max_workers=nr_threads) as pool:
+        for frame in chain([first], frames):
+            pending.append(pool.submit(func, frame))
+            if len(pending) > nr_threads:
+                yield _result(idx, pending.popleft())
+                idx += 1
+
+        while pending:
+            yield _result(idx, pending.popleft())
+            idx += 1
+
+
+def decode_pixel_data_frames(
+    frames: Sequence[Union[bytes, bytearray, memoryview]],
+    ds: Union["Dataset", Dict[str, Any], None] = None,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Return the decoded JPEG 2000 `frames` as a single :class:`numpy.ndarray`.
+
+    .. versionadded:: 2.5
+
+    The output array is allocated once using the image parameters of the first
+    frame and each frame is decoded directly into it by a pool of threads, one
+    per CPU by default, which can be changed with the
+    ``PYLIBJPEG_OPENJPEG_THREADS`` environment variable. Every frame must
+    have the same JPEG 2000 format and image parameters, as required for the
+    frames of DICOM *Pixel Data*.
+
+    Parameters
+    ----------
+    frames : Sequence[bytes | bytearray | memoryview]
+        The encoded JPEG 2000 data for each frame.
+    ds : pydicom.dataset.Dataset, optional
+        A :class:`~pydicom.dataset.Dataset` containing the group ``0x0028``
+        elements corresponding to the *Pixel data*, see
+        :func:`~openjpeg.utils.decode_pixel_data`.
+    **kwargs
+        The *Samples per Pixel*, *Bits Stored* and *Pixel Representation*
+        values to check the JPEG 2000 data against if not in `ds`, see
+        :func:`~openjpeg.utils.decode_pixel_data`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded image data with shape (frames, rows, columns) or
+        (frames, rows, columns, planes).
+
+    Raises
+    ------
+    RuntimeError
+        If decoding any of the frames failed.
+    ValueError
+        If there are no frames or the image parameters of a frame don't match
+        those of the first frame.
+    """
+    if len(frames) == 0:
+        raise ValueError("At least one frame is required")
+
+    j2k_format, meta = _get_first_frame_parameters(frames[0], ds, Version.v1, **kwargs)
 
-    return cast(bytearray, buffer)
+    samples_per_pixel = cast(int, meta["samples_per_pixel"])
+    shape = [len(frames), cast(int, meta["rows"]), cast(int, meta["columns"])]
+    if samples_per_pixel > 1:
+        shape.append(samples_per_pixel)
+
+    bpp = (cast(int, meta["precision"]) + 7) >> 3
+    arr = np.empty(shape, dtype=_DECODED_DTYPES[bpp, cast(bool, meta["is_signed"])])
+
+    def _decode_into(idx: int) -> None:
+        _, frame_meta = _decode_frame(frames[idx], j2k_format, out=arr[idx])
+        _check_frame(frame_meta, meta, idx)
+
+    # Decoding bytes-like data doesn't hold the GIL, so the frames can be
+    #   decoded in parallel
+    nr_threads = _openjpeg._get_nr_threads(os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=nr_threads) as pool:
+        list(pool.map(_decode_into, range(len(frames))))
+
+    return arr
 
 
 def get_parameters(
-    stream: Union[str, os.PathLike, bytes, bytearray, BinaryIO],
+    stream: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO],
     j2k_format: Union[int, None] = None,
 ) -> Dict[str, Union[int, str, bool]]:
     """Return a :class:`dict` containing the JPEG2000 image parameters.
@@ -351,9 +687,13 @@ def get_parameters(
 
         `stream` can now also be :class:`str` or :class:`pathlib.Path`
 
+    .. versionchanged:: 2.5
+
+        `stream` can now also be :class:`memoryview`
+
     Parameters
     ----------
-    stream : str, pathlib.Path, bytes or file-like
+    stream : str, pathlib.Path, bytes, bytearray, memoryview or file-like
         The path to the JPEG 2000 file or a Python object containing the
         encoded JPEG 2000 data. If using a file-like then the object must have
         ``tell()``, ``seek()`` and ``read()`` methods.
@@ -378,21 +718,7 @@ def get_parameters(
     RuntimeError
         If reading the image parameters failed.
     """
-    if isinstance(stream, (str, Path)):
-        with open(stream, "rb") as f:
-            buffer: BinaryIO = BytesIO(f.read())
-            buffer.seek(0)
-    elif isinstance(stream, (bytes, bytearray)):
-        buffer = BytesIO(stream)
-    else:
-        # BinaryIO
-        required_methods = ["read", "tell", "seek"]
-        if not all([hasattr(stream, meth) for meth in required_methods]):
-            raise TypeError(
-                "The Python object containing the encoded JPEG 2000 data must "
-                "either be bytes or have read(), tell() and seek() methods."
-            )
-        buffer = cast(BinaryIO, stream)
+    buffer = _get_stream(stream)
 
     if j2k_format is None:
         j2k_format = _get_format(buffer)
@@ -406,24 +732,90 @@ def get_parameters(
     )
 
 
-def _get_bits_stored(arr: np.ndarray) -> int:
-    """Return a 'bits_stored' appropriate for `arr`."""
+def _get_bits_stored(
+    arr: np.ndarray, axis: Union[int, None] = None
+) -> Union[int, np.ndarray]:
+    """Return a 'bits_stored' appropriate for `arr`.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        The array to return the 'bits_stored' for.
+    axis : int, optional
+        If used then return a 'bits_stored' for each 1D slice of `arr` along
+        `axis` instead, such as ``axis=-1`` for the 'bits_stored' of each pixel.
+
+    Returns
+    -------
+    int | numpy.ndarray
+        The 'bits_stored' for `arr`, or an array of 'bits_stored' if `axis` is
+        used.
+    """
+    if axis is not None:
+        return _get_bits_stored_along(arr, axis)
+
     if arr.dtype.kind == "b":
         return 1
 
-    maximum = arr.max()
-    if arr.dtype.kind == "u":
-        if maximum == 0:
-            return 1
+    # Find the range in chunks small enough that the second reduction over each
+    #   chunk is served from the CPU cache rather than main memory, which also
+    #   allows stopping early once the full width is needed
+    if arr.flags.c_contiguous:
+        flat = arr.reshape(-1)
+        chunks: Iterator[np.ndarray] = (
+            flat[idx : idx + _RANGE_CHUNK_SIZE]
+            for idx in range(0, flat.size, _RANGE_CHUNK_SIZE)
+        )
+    else:
+        # Non-contiguous arrays are copied a chunk at a time into a buffer
+        chunks = np.nditer(
+            arr,
+            flags=["external_loop", "buffered", "zerosize_ok"],
+            buffersize=_RANGE_CHUNK_SIZE,
+        )
+
+    is_signed = arr.dtype.kind == "i"
+    max_bits = arr.dtype.itemsize * 8
+    bits_stored = 1
+    for chunk in chunks:
+        maximum = int(chunk.max())
+        if is_signed:
+            # A signed precision of N bits covers [-2**(N - 1), 2**(N - 1) - 1],
+            #   and ~minimum is the magnitude of a negative minimum less 1
+            nr_bits = max(maximum, 0).bit_length() + 1
+            if nr_bits < max_bits:
+                # Skip the minimum if the maximum already needs the full width
+                minimum = int(chunk.min())
+                nr_bits = max(nr_bits, max(~minimum, 0).bit_length() + 1)
+        else:
+            nr_bits = maximum.bit_length()
+
+        bits_stored = max(bits_stored, nr_bits)
+        if bits_stored == max_bits:
+            break
+
+    return bits_stored
+
+
+def _get_bits_stored_along(arr: np.ndarray, axis: int) -> np.ndarray:
+    """Return the 'bits_stored' for each 1D slice of `arr` along `axis`."""
+    maximum = arr.max(axis=axis).astype("i8")
+    if arr.dtype.kind == "b":
+        return np.ones(maximum.shape, dtype="i8")
 
-        return int(log(maximum, 2) + 1)
+    if arr.dtype.kind == "u":
+        magnitude = maximum
+    else:
+        # Non-negative for every slice, see _get_bits_stored()
+        magnitude = np.maximum(maximum, ~arr.min(axis=axis).astype("i8"))
 
-    minimum = arr.min()
-    for bit_depth in range(1, arr.dtype.itemsize * 8):
-        if maximum <= 2 ** (bit_depth - 1) - 1 and minimum >= -(2 ** (bit_depth - 1)):
-            return bit_depth
+    # The bit length of each magnitude is the number of powers of 2 <= it
+    powers = 2 ** np.arange(arr.dtype.itemsize * 8, dtype="i8")
+    nr_bits = np.searchsorted(powers, magnitude, side="right")
+    if arr.dtype.kind == "i":
+        return cast(np.ndarray, nr_bits + 1)
 
-    return cast(int, arr.dtype.itemsize * 8)
+    return cast(np.ndarray, np.maximum(nr_bits, 1))
 
 
 def encode_array(
@@ -542,7 +934,7 @@ def encode_array(
         )
 
     if bits_stored is None:
-        bits_stored = _get_bits_stored(arr)
+        bits_stored = cast(int, _get_bits_stored(arr))
 
     # The destination for the encoded data, must support BinaryIO
     return_code, buffer = _openjpeg.encode_array(
@@ -567,7 +959,7 @@ encode = encode_array
 
 
 def encode_buffer(
-    src: bytes,
+    src: Union[bytes, bytearray, memoryview, np.ndarray],
     columns: int,
     rows: int,
     samples_per_pixel: int,
@@ -579,6 +971,7 @@ def encode_buffer(
     compression_ratios: Union[List[float], None] = None,
     signal_noise_ratios: Union[List[float], None] = None,
     codec_format: int = 0,
+    nr_threads: int = 0,
     **kwargs: Any,
 ) -> bytes:
     """Return the JPEG 2000 compressed `src`.
@@ -609,10 +1002,12 @@ def encode_buffer(
 
     Parameters
     ----------
-    src : bytes
+    src : bytes | bytearray | memoryview | numpy.ndarray
         A single frame of little endian, colour-by-pixel ordered image data to
-        be JPEG 2000 encoded. Each pixel should be encoded using the following
-        (each pixel has 1 or more samples):
+        be JPEG 2000 encoded, as a C-contiguous object that supports the buffer
+        protocol. The data is used directly without being copied. Each pixel
+        should be encoded using the following (each pixel has 1 or more
+        samples):
 
         * For  0 < bits per sample <=  8: 1 byte per sample
         * For  8 < bits per sample <= 16: 2 bytes per sample
@@ -677,6 +1072,12 @@ def encode_buffer(
 
         * ``0``: JPEG 2000 codestream only (default) (J2K/J2C format)
         * ``1``: A boxed JPEG 2000 codestream (JP2 format)
+    nr_threads : int, optional
+        The number of threads OpenJPEG uses when encoding, if ``0`` (default)
+        then uses the value of the ``PYLIBJPEG_OPENJPEG_THREADS`` environment
+        variable or ``1`` if not set.
+
+        .. versionadded:: 2.5
 
     Returns
     -------
@@ -702,6 +1103,7 @@ def encode_buffer(
         compression_ratios,
         signal_noise_ratios,
         codec_format,
+        nr_threads,
     )
 
     if return_code != 0:
@@ -712,16 +1114,19 @@ def encode_buffer(
     return cast(bytes, buffer)
 
 
-def encode_pixel_data(src: bytes, **kwargs: Any) -> bytes:
+def encode_pixel_data(
+    src: Union[bytes, bytearray, memoryview, np.ndarray], **kwargs: Any
+) -> bytes:
     """Return the JPEG 2000 compressed `src`.
 
     .. versionadded:: 2.2
 
     Parameters
     ----------
-    src : bytes
+    src : bytes | bytearray | memoryview | numpy.ndarray
         A single frame of little endian, colour-by-pixel ordered image data to
-        be JPEG2000 encoded. Each pixel should be encoded using the following:
+        be JPEG2000 encoded, as a C-contiguous object that supports the buffer
+        protocol. Each pixel should be encoded using the following:
 
         * For  0 < bits per sample <=  8: 1 byte per sample
         * For  8 < bits per sample <= 16: 2 bytes per sample
@@ -754,6 +1159,49 @@ def encode_pixel_data(src: bytes, **kwargs: Any) -> bytes:
     bytes | bytearray
         A JPEG 2000 codestream.
     """
+    return encode_buffer(src, **_encode_buffer_kwargs(kwargs))
+
+
+def encode_pixel_data_batched(
+    frames: Iterable[Union[bytes, bytearray, memoryview, np.ndarray]], **kwargs: Any
+) -> List[bytes]:
+    """Return a list of the JPEG 2000 compressed `frames`.
+
+    .. versionadded:: 2.5
+
+    The frames are encoded concurrently by a pool of threads, one per CPU by
+    default, which can be changed with the ``PYLIBJPEG_OPENJPEG_THREADS``
+    environment variable. OpenJPEG uses a single thread for each frame.
+
+    Parameters
+    ----------
+    frames : Iterable[bytes | bytearray | memoryview | numpy.ndarray]
+        The frames of image data to be JPEG2000 encoded, such as a list of
+        frames or a C-contiguous (frames, rows, columns, planes) ndarray. Each
+        frame must meet the requirements of `src` for
+        :func:`~openjpeg.utils.encode_pixel_data`.
+    **kwargs
+        The keyword arguments to use when encoding every frame, see
+        :func:`~openjpeg.utils.encode_pixel_data`.
+
+    Returns
+    -------
+    list[bytes | bytearray]
+        The JPEG 2000 codestream for each frame.
+    """
+    # Only convert the kwargs once for every frame
+    kwargs = _encode_buffer_kwargs(kwargs)
+    # Encoding doesn't hold the GIL, so the frames can be encoded in parallel,
+    #   each with a single OpenJPEG thread to avoid oversubscribing the CPUs
+    kwargs["nr_threads"] = 1
+    func = partial(encode_buffer, **kwargs)
+    nr_threads = _openjpeg._get_nr_threads(os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=nr_threads) as pool:
+        return list(pool.map(func, frames))
+
+
+def _encode_buffer_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the encode_buffer() kwargs for the encode_pixel_data() `kwargs`."""
     # A J2K codestream doesn't track the colour space, so the photometric
     #   interpretation is only used to help with setting MCT
     pi = kwargs["photometric_interpretation"]
@@ -765,4 +1213,4 @@ def encode_pixel_data(src: bytes, **kwargs: Any) -> bytes:
     kwargs["is_signed"] = kwargs["pixel_representation"]
     kwargs["codec_format"] = 0
 
-    return encode_buffer(src, **kwargs)
+    return kwargs